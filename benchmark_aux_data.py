@@ -0,0 +1,52 @@
+import spectrum_card as sc
+from spectrum_card.spectrum_header import spcm_simulated
+from spectrum_card.spectrum_header import spcm_tools
+
+import time as tm
+import numpy as np
+import math
+
+signal_length = 2**20 # Samples per channel in each upload
+number_of_uploads = 5 # How many uploads are timed, the fastest is kept
+
+# Open a card on the simulated driver, so that the encoding is what is measured, rather than the transfer
+card = sc.Card(driver = spcm_simulated.SimulatedDriver())
+card.reset()
+card.set_channels_enable(channel_0 = True, channel_1 = True, channel_2 = True, channel_3 = True)
+card.set_memory_size(signal_length)
+
+# Create signals, with markers on each of the bits that can be used for them
+signals = [np.sin(math.tau*(channel + 1)*np.arange(signal_length)/signal_length) for channel in range(4)]
+markers = [signals[channel] >= 0 for channel in range(3)]
+marker_channels = [
+  {"Channel" : 0, "Bit" : 15, "Port" : 0},
+  {"Channel" : 1, "Bit" : 14, "Port" : 1},
+  {"Channel" : 2, "Bit" : 13, "Port" : 2}
+]
+
+# The same signals already quantised, both as separate channels and interleaved into a page aligned buffer
+quantised = [(32767*signal).astype(np.int16) for signal in signals]
+interleaved = np.frombuffer(spcm_tools.pvAllocMemPageAligned(2*4*signal_length), dtype = np.int16)
+for channel in range(4):
+  interleaved[channel::4] = quantised[channel]
+
+def samples_per_second(upload, *arguments, **keyword_arguments):
+  upload_times = []
+  for upload_index in range(number_of_uploads):
+    start_time = tm.perf_counter()
+    upload(*arguments, **keyword_arguments)
+    upload_times.append(tm.perf_counter() - start_time)
+  return 4*signal_length/min(upload_times)
+
+rates = {
+  "Without markers" : samples_per_second(card.array_to_device, signals),
+  "With markers" : samples_per_second(card.array_to_device, signals, aux_data = markers, aux_data_channels = marker_channels),
+  "int16, copied" : samples_per_second(card.int16_to_device, quantised),
+  "int16, zero copy" : samples_per_second(card.int16_to_device, interleaved)
+}
+
+print(f"{'Upload':<20}{'Samples/s':>16}")
+for name, rate in rates.items():
+  print(f"{name:<20}{rate:>16.3g}")
+
+card.close()
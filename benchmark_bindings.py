@@ -0,0 +1,100 @@
+import spectrum_card as sc
+from spectrum_card.spectrum_header import pyspcm as spcm
+from spectrum_card.spectrum_header import spcm_simulated
+
+import ctypes
+import ctypes.util
+import os
+import time as tm
+
+number_of_calls = 100000 # How many times each call is made
+
+def calls_per_second(function):
+  start_time = tm.perf_counter()
+  for call_index in range(number_of_calls):
+    function()
+  return number_of_calls/(tm.perf_counter() - start_time)
+
+def print_rates(benchmarks, before_name, after_name):
+  print(f"{'Call':<12}{before_name:>24}{after_name:>24}{'Speed up':>12}")
+  for name, (before, after) in benchmarks.items():
+    before_rate = calls_per_second(before)
+    after_rate = calls_per_second(after)
+    print(f"{name:<12}{before_rate:>24.0f}{after_rate:>24.0f}{after_rate/before_rate:>12.2f}")
+
+# Driver calls through ctypes
+# A function from the C library stands in for the driver, so that each call is converted and made by ctypes as it is with the real driver, without needing a card
+# labs only reads its first argument, and the rest are ignored, as extra arguments are in the C calling convention
+c_library = ctypes.cdll.msvcrt if os.name == "nt" else ctypes.CDLL(ctypes.util.find_library("c"))
+
+def get_stand_in(argtypes = None):
+  # A separate function object each time, so that prototypes are not shared
+  function = c_library["labs"]
+  function.restype = spcm.uint32
+  if argtypes is not None:
+    function.argtypes = argtypes
+  return function
+
+handle = ctypes.c_void_p(0)
+int32_response = spcm.int32(0)
+int32_reference = spcm.byref(int32_response)
+int64_response = spcm.int64(0)
+int64_reference = spcm.byref(int64_response)
+
+# Before: no prototypes (argtype, rather than argtypes, was set, which ctypes ignores), so values were wrapped and responses allocated on every call
+unprototyped = get_stand_in()
+
+# After: prototypes as set by pyspcm, with plain ints and reused response buffers
+get_param_i32 = get_stand_in([ctypes.c_void_p, spcm.int32, spcm.ptr32])
+set_param_i32 = get_stand_in([ctypes.c_void_p, spcm.int32, spcm.int32])
+get_param_i64 = get_stand_in([ctypes.c_void_p, spcm.int32, spcm.ptr64])
+set_param_i64 = get_stand_in([ctypes.c_void_p, spcm.int32, spcm.int64])
+
+print("Driver calls through ctypes:")
+print_rates(
+  {
+    "get int32" : (lambda: unprototyped(handle, spcm.SPC_M2STATUS, spcm.byref(spcm.int32(0))), lambda: get_param_i32(handle, spcm.SPC_M2STATUS, int32_reference)),
+    "set int32" : (lambda: unprototyped(handle, spcm.SPC_LOOPS, spcm.int32(1)), lambda: set_param_i32(handle, spcm.SPC_LOOPS, 1)),
+    "get int64" : (lambda: unprototyped(handle, spcm.SPC_SAMPLERATE, spcm.byref(spcm.int64(0))), lambda: get_param_i64(handle, spcm.SPC_SAMPLERATE, int64_reference)),
+    "set int64" : (lambda: unprototyped(handle, spcm.SPC_MEMSIZE, spcm.int64(512)), lambda: set_param_i64(handle, spcm.SPC_MEMSIZE, 512))
+  },
+  "Unprototyped (calls/s)",
+  "Prototyped (calls/s)"
+)
+
+# Card methods
+# On the simulated driver, which is called from Python rather than through ctypes, so that only the Python side of each Card call is measured
+card = sc.Card(driver = spcm_simulated.SimulatedDriver())
+card.reset()
+
+# The way calls were made before, allocating a new ctypes number (and reference) for each one
+def get_int32_allocating():
+  response = spcm.int32(0)
+  card._handle_error(card.driver.spcm_dwGetParam_i32(card.card_handle, spcm.SPC_M2STATUS, spcm.byref(response)))
+  return response.value
+
+def set_int32_allocating():
+  card._handle_error(card.driver.spcm_dwSetParam_i32(card.card_handle, spcm.SPC_LOOPS, spcm.int32(1)))
+
+def get_int64_allocating():
+  response = spcm.int64(0)
+  card._handle_error(card.driver.spcm_dwGetParam_i64(card.card_handle, spcm.SPC_SAMPLERATE, spcm.byref(response)))
+  return response.value
+
+def set_int64_allocating():
+  card._handle_error(card.driver.spcm_dwSetParam_i64(card.card_handle, spcm.SPC_MEMSIZE, spcm.int64(512)))
+
+print("")
+print("Card methods on the simulated driver:")
+print_rates(
+  {
+    "get int32" : (get_int32_allocating, lambda: card._get_int32(spcm.SPC_M2STATUS)),
+    "set int32" : (set_int32_allocating, lambda: card._set_int32(spcm.SPC_LOOPS, 1)),
+    "get int64" : (get_int64_allocating, lambda: card._get_int64(spcm.SPC_SAMPLERATE)),
+    "set int64" : (set_int64_allocating, lambda: card._set_int64(spcm.SPC_MEMSIZE, 512))
+  },
+  "Allocating (calls/s)",
+  "Fast path (calls/s)"
+)
+
+card.close()
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+number_of_runs = 20  # How many fresh interpreters each import is timed in
+budget = {           # Longest each import may take (s), exceeding it exits with an error
+  "import spectrum_card" : 0.02,
+  "from spectrum_card import Card" : 0.1
+}
+
+# Each import is timed in a fresh interpreter, so that nothing is already loaded
+timing_code = """
+import time
+start_time = time.perf_counter()
+{statement}
+print(time.perf_counter() - start_time)
+"""
+
+environment = dict(os.environ)
+environment["PYTHONPATH"] = os.pathsep.join([os.path.dirname(os.path.abspath(__file__))] + [path for path in [environment.get("PYTHONPATH")] if path])
+
+def get_import_time(statement):
+  times = []
+  for run_index in range(number_of_runs):
+    result = subprocess.run([sys.executable, "-c", timing_code.format(statement = statement)], env = environment, capture_output = True, text = True, check = True)
+    times.append(float(result.stdout))
+  # The fastest run is the one least disturbed by the rest of the system
+  return min(times)
+
+is_over_budget = False
+print(f"{'Import':<36}{'Time (ms)':>12}{'Budget (ms)':>14}")
+for statement, statement_budget in budget.items():
+  import_time = get_import_time(statement)
+  print(f"{statement:<36}{1e3*import_time:>12.1f}{1e3*statement_budget:>14.1f}")
+  if import_time > statement_budget:
+    is_over_budget = True
+
+if is_over_budget:
+  sys.exit("Importing spectrum_card took longer than its budget.")
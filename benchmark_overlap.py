@@ -0,0 +1,58 @@
+import spectrum_card as sc
+from spectrum_card.spectrum_header import spcm_simulated
+
+import time as tm
+import numpy as np
+import math
+
+signal_length = 2**18   # Samples per channel in each segment
+number_of_segments = 16 # How many segments are uploaded in each run
+number_of_runs = 3      # How many runs are timed, the fastest is kept
+
+# Open a card on the simulated driver, set up for a sequence of four channel segments with markers
+driver = spcm_simulated.SimulatedDriver()
+card = sc.Card(driver = driver)
+card.reset()
+card.set_channels_enable(channel_0 = True, channel_1 = True, channel_2 = True, channel_3 = True)
+card.use_mode_sequence()
+card.set_number_of_segments(number_of_segments)
+card.set_memory_size(number_of_segments*signal_length)
+
+signals = [np.sin(math.tau*(channel + 1)*np.arange(signal_length)/signal_length) for channel in range(4)]
+segments = [[(segment + 1)/number_of_segments*signal for signal in signals] for segment in range(number_of_segments)]
+markers = [signals[0] >= 0]
+marker_channels = [{"Channel" : 0, "Bit" : 15, "Port" : 0}]
+
+def upload_blocking():
+  for segment, data in enumerate(segments):
+    card.array_to_device(data, segment, aux_data = markers, aux_data_channels = marker_channels)
+
+def upload_overlapped():
+  # Each segment is quantised while the one before it is being transferred
+  for segment, data in enumerate(segments):
+    card.start_array_to_device(data, segment, aux_data = markers, aux_data_channels = marker_channels)
+  card.get_dma_transfer().wait()
+
+def fastest_time(upload):
+  run_times = []
+  for run_index in range(number_of_runs):
+    start_time = tm.perf_counter()
+    upload()
+    run_times.append(tm.perf_counter() - start_time)
+  return min(run_times)
+
+# Time the quantisation on its own, then make the simulated DMA take as long, which is when overlapping gains the most
+quantise_time = fastest_time(upload_blocking)/number_of_segments
+number_of_bytes = 4*2*signal_length
+driver.byte_latency = quantise_time/number_of_bytes
+
+blocking_time = fastest_time(upload_blocking)
+overlapped_time = fastest_time(upload_overlapped)
+
+print(f"Simulated DMA rate: {number_of_bytes/quantise_time/1e9:.3g} GB/s")
+print(f"{'Upload':<16}{'Time (s)':>12}{'Segments/s':>16}")
+print(f"{'Blocking':<16}{blocking_time:>12.3f}{number_of_segments/blocking_time:>16.1f}")
+print(f"{'Overlapped':<16}{overlapped_time:>12.3f}{number_of_segments/overlapped_time:>16.1f}")
+print(f"Overlapping is {blocking_time/overlapped_time:.2f} times as fast")
+
+card.close()
@@ -0,0 +1,87 @@
+import spectrum_card as sc
+from spectrum_card.spectrum_header import spcm_simulated
+
+import sys
+import threading
+import time as tm
+import numpy as np
+
+run_time = 1                # How long each contention run lasts (s)
+number_of_toggles = 20000   # How many times each thread toggles its IO port in the lost update test
+signal_length = 512         # Samples per segment uploaded by the control thread
+
+# Switch between threads as often as possible, so that unguarded operations are likely to be interleaved
+sys.setswitchinterval(1e-6)
+
+def open_card(thread_safe):
+  # A card on the simulated driver, set up for a sequence of four segments
+  card = sc.Card(driver = spcm_simulated.SimulatedDriver(), thread_safe = thread_safe)
+  card.reset()
+  card.set_channels_enable(channel_0 = True)
+  card.use_mode_sequence()
+  card.set_number_of_segments(4)
+  card.set_memory_size(4*signal_length)
+  return card
+
+signal = np.sin(2*np.pi*np.arange(signal_length)/signal_length)
+
+def control(card, stop_event, counts):
+  # Uploads to each segment in turn, as a control thread would
+  segment = 0
+  while not stop_event.is_set():
+    card.array_to_device([signal], segment)
+    segment = (segment + 1) % 4
+    counts["Control"] += 1
+
+def monitor(card, stop_event, counts):
+  # Polls the status and temperature, as a monitoring thread would
+  while not stop_event.is_set():
+    card.get_status()
+    card.get_temperature_base()
+    counts["Monitor"] += 1
+
+def run(card, workers):
+  counts = {"Control" : 0, "Monitor" : 0}
+  stop_event = threading.Event()
+  threads = [threading.Thread(target = worker, args = (card, stop_event, counts)) for worker in workers]
+  for thread in threads:
+    thread.start()
+  tm.sleep(run_time)
+  stop_event.set()
+  for thread in threads:
+    thread.join()
+  return {name : count/run_time for name, count in counts.items()}
+
+# Contention: how much the control and monitoring threads slow each other down
+# The simulated driver runs in Python and holds the GIL, so two busy threads can at best get half each, whereas calls to the driver library release it
+card = open_card(thread_safe = True)
+control_alone = run(card, [control])["Control"]
+monitor_alone = run(card, [monitor])["Monitor"]
+together = run(card, [control, monitor])
+card.close()
+
+print(f"{'Thread':<12}{'Alone (ops/s)':>20}{'Together (ops/s)':>20}{'Ratio':>12}")
+print(f"{'Control':<12}{control_alone:>20.0f}{together['Control']:>20.0f}{together['Control']/control_alone:>12.2f}")
+print(f"{'Monitor':<12}{monitor_alone:>20.0f}{together['Monitor']:>20.0f}{together['Monitor']/monitor_alone:>12.2f}")
+
+# Lost updates: two threads each toggle their own bit of SPCM_XX_ASYNCIO with a read, modify and write
+def toggle(card, port, errors):
+  for toggle_index in range(number_of_toggles):
+    value = toggle_index % 2 == 0
+    card.set_io_asynchronous(port, value)
+    if card.get_io_asynchronous(port) != value:
+      errors[port] += 1
+
+print("")
+print(f"{'Thread safe':<12}{'Lost updates':>20}{'Time (s)':>20}")
+for thread_safe in [False, True]:
+  card = open_card(thread_safe)
+  errors = {0 : 0, 1 : 0}
+  threads = [threading.Thread(target = toggle, args = (card, port, errors)) for port in errors]
+  start_time = tm.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  print(f"{str(thread_safe):<12}{sum(errors.values()):>20}{tm.perf_counter() - start_time:>20.3f}")
+  card.close()
@@ -51,30 +51,17 @@ card.set_memory_size(card.get_number_of_segments()*signal_sine.size)
 aux_data_channels = [{"Channel" : 1, "Bit" : 13, "Port": 2}]
 
 # Transfer signals for each segment
-card.array_to_device(
-  [signal_sine, signal_square, signal_bipolar, signal_rectified],
-  0,
-  aux_data = [signal_aux],
-  aux_data_channels = aux_data_channels
-)
-card.array_to_device(
-  [signal_rectified, signal_sine, signal_square, signal_bipolar],
-  1,
-  aux_data = [signal_aux],
-  aux_data_channels = aux_data_channels
-)
-card.array_to_device(
-  [signal_bipolar, signal_rectified, signal_sine, signal_square],
-  2,
-  aux_data = [signal_aux],
-  aux_data_channels = aux_data_channels
-)
-card.array_to_device(
-  [signal_square, signal_bipolar, signal_rectified, signal_sine],
-  3,
-  aux_data = [signal_aux],
+timings = card.upload_segments(
+  {
+    0 : [signal_sine, signal_square, signal_bipolar, signal_rectified],
+    1 : [signal_rectified, signal_sine, signal_square, signal_bipolar],
+    2 : [signal_bipolar, signal_rectified, signal_sine, signal_square],
+    3 : [signal_square, signal_bipolar, signal_rectified, signal_sine]
+  },
+  aux_data = {segment : [signal_aux] for segment in range(4)},
   aux_data_channels = aux_data_channels
 )
+print(f"Uploaded {len(timings['Segments'])} segments in {timings['Total time']*1e3:.3g} ms")
 
 # Add sequencer step instructions
 number_of_loops = 100000
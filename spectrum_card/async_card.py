@@ -0,0 +1,215 @@
+"""
+The :obj:`AsyncCard` class, which controls a :obj:`Card` from an :obj:`asyncio` event loop.
+"""
+
+from spectrum_card.card import Card
+
+import asyncio
+import concurrent.futures
+import functools
+
+# How many threads the shared executor runs blocking driver calls on, for all cards together
+DEFAULT_MAX_WORKERS = 4
+
+_default_executor = None
+
+def get_default_executor():
+  """
+  Finds the executor that :obj:`AsyncCard` runs blocking driver calls on when it is not given one, creating it if this is the first time it has been asked for.
+  It is shared by every :obj:`AsyncCard`, so the number of threads does not grow with the number of cards.
+
+  Returns
+  -------
+  executor : :obj:`concurrent.futures.ThreadPoolExecutor`
+    An executor with :obj:`DEFAULT_MAX_WORKERS` threads.
+  """
+  global _default_executor
+  if _default_executor is None:
+    _default_executor = concurrent.futures.ThreadPoolExecutor(max_workers = DEFAULT_MAX_WORKERS, thread_name_prefix = "spectrum_card")
+  return _default_executor
+
+class AsyncCard:
+  """
+  Opens a :obj:`Card` that can be controlled from an :obj:`asyncio` event loop, so that one loop can drive several cards, and other I/O, at the same time.
+
+  .. code-block:: python
+
+    async with sc.AsyncCard() as card:
+      card.card.set_sample_rate(50, "M")
+      await card.upload([signal])
+      await card.arm()
+      await card.wait_ready()
+
+  Calls that block in the driver (:obj:`upload`, which waits for the DMA transfer, and waits such as :obj:`wait_ready`) are run on a bounded executor.
+  Waits use the driver's own waits (:obj:`M2CMD_CARD_WAITREADY` etc.), which return as soon as the card is ready rather than polling, and each holds a thread of the executor while it waits.
+  Setup that does not block (setting the sample rate, amplitudes, etc.) can be done straight through :obj:`card`.
+
+  The :obj:`Card` is opened with :obj:`thread_safe = True`, so that it can be used from the event loop while a call is running on the executor.
+  Commands do not wait for the lock of the card, so :obj:`stop` or :obj:`force_trigger` can end a wait that is running.
+  So that they are not queued behind waits that hold every thread of the executor, commands (:obj:`start`, :obj:`arm`, :obj:`force_trigger` and :obj:`stop`) are run on the default executor of the event loop instead.
+
+  Parameters
+  ----------
+  device_address : :obj:`str`
+    Directory to the card.
+  driver : :obj:`str` or :obj:`object`
+    Where the driver functions are found, see :obj:`Card`.
+  cache_capabilities : :obj:`bool`
+    Whether capability registers are cached, see :obj:`Card`.
+  executor : :obj:`concurrent.futures.Executor`
+    What blocking driver calls, other than commands, are run on.
+    If :obj:`None` (default), uses :obj:`get_default_executor`.
+
+  Attributes
+  ----------
+  card : :obj:`Card`
+    The card, for calls that do not block.
+  """
+  def __init__(self, device_address = b"/dev/spcm0", driver = None, cache_capabilities = True, executor = None):
+    self.card = Card(device_address, driver, cache_capabilities, thread_safe = True)
+    self.executor = executor if executor is not None else get_default_executor()
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, exception_type, exception_value, traceback):
+    await self.close()
+    return False
+
+  async def _run(self, function, *arguments, **keyword_arguments):
+    # Runs a blocking call on the executor, without blocking the event loop
+    return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(function, *arguments, **keyword_arguments))
+
+  async def _run_command(self, function):
+    # Commands are run on the default executor of the loop, rather than with the waits, so that stop can still end a wait when waits hold every thread of the executor
+    return await asyncio.get_running_loop().run_in_executor(None, function)
+
+  async def close(self):
+    """
+    Closes the connection to the card, once any call running on the executor has returned.
+    See :obj:`Card.close`.
+    """
+    await self._run(self.card.close)
+
+  # Data ------------------------------------------------------------------------
+  # =============================================================================
+
+  async def upload(self, data, segment = 0, aux_data = None, aux_data_channels = None):
+    """
+    Transfers signals from the host to the card, waiting for the transfer to finish on the executor.
+    See :obj:`Card.array_to_device` for the parameters.
+    """
+    await self._run(self.card.array_to_device, data, segment, aux_data, aux_data_channels)
+
+  async def start_upload(self, data, segment = 0, aux_data = None, aux_data_channels = None):
+    """
+    Transfers signals from the host to the card, returning once the transfer has started, as :obj:`Card.start_array_to_device` does.
+    It is run on the executor, as it first waits for any transfer that is already running.
+    Wait for the transfer to finish with :obj:`wait_dma`.
+    See :obj:`Card.array_to_device` for the parameters.
+
+    Returns
+    -------
+    transfer : :obj:`DmaTransfer`
+      The transfer that has been started.
+    """
+    return await self._run(self.card.start_array_to_device, data, segment, aux_data, aux_data_channels)
+
+  async def upload_segments(self, segments, aux_data = None, aux_data_channels = None):
+    """
+    Transfers signals for several segments from the host to the card, waiting for the transfers to finish on the executor.
+    See :obj:`Card.upload_segments` for the parameters and what is returned.
+    """
+    return await self._run(self.card.upload_segments, segments, aux_data, aux_data_channels)
+
+  async def patch_segment(self, segment, start_sample, data, aux_data = None, aux_data_channels = None):
+    """
+    Overwrites part of a segment that is already on the card, waiting for the transfer to finish on the executor.
+    See :obj:`Card.patch_segment` for the parameters.
+    """
+    await self._run(self.card.patch_segment, segment, start_sample, data, aux_data, aux_data_channels)
+
+  # Commands --------------------------------------------------------------------
+  # =============================================================================
+
+  async def start(self):
+    """
+    Starts the card, see :obj:`Card.start`.
+    """
+    await self._run_command(self.card.start)
+
+  async def arm(self):
+    """
+    Starts the card and enables the trigger, see :obj:`Card.arm`.
+    """
+    await self._run_command(self.card.arm)
+
+  async def force_trigger(self):
+    """
+    Triggers the card, see :obj:`Card.force_trigger`.
+    """
+    await self._run_command(self.card.force_trigger)
+
+  async def stop(self):
+    """
+    Stops the card, see :obj:`Card.stop`.
+    """
+    await self._run_command(self.card.stop)
+
+  # Waits -----------------------------------------------------------------------
+  # =============================================================================
+
+  async def wait_ready(self, timeout = None):
+    """
+    Waits until the card has finished replaying, running :obj:`Card.wait_ready` (:obj:`M2CMD_CARD_WAITREADY`) on the executor.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`Card.set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, in s.
+    """
+    return await self._run(self.card.wait_ready, timeout)
+
+  async def wait_trigger(self, timeout = None):
+    """
+    Waits until the card has been triggered, running :obj:`Card.wait_trigger` (:obj:`M2CMD_CARD_WAITTRIGGER`) on the executor.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`Card.set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, in s.
+    """
+    return await self._run(self.card.wait_trigger, timeout)
+
+  async def wait_dma(self, timeout = None):
+    """
+    Waits until the DMA transfer has finished, running :obj:`Card.wait_dma` (:obj:`M2CMD_DATA_WAITDMA`) on the executor.
+    If a transfer started by :obj:`start_upload` is running, waits on it with :obj:`DmaTransfer.wait` instead, so that its buffer is given back and its segment restored.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`Card.set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, or how long the transfer took if one was started by :obj:`start_upload`, in s.
+    """
+    transfer = self.card.get_dma_transfer()
+    if transfer is not None:
+      return await self._run(transfer.wait, timeout)
+    return await self._run(self.card.wait_dma, timeout)
@@ -0,0 +1,149 @@
+"""
+The :obj:`BufferPool` class, which recycles page aligned buffers for DMA transfers.
+"""
+
+from spectrum_card.spectrum_header import spcm_tools
+
+import collections
+import threading
+
+# Buffers are aligned to, and sized in multiples of, one page
+PAGE_SIZE = 4096
+
+# Most bytes kept by a pool for reuse, unless it is given a different cap
+DEFAULT_MEMORY_CAP = 2**28
+
+def get_size_class(size):
+  """
+  Finds the size of buffer that is handed out for a request.
+  Sizes are rounded up to a whole number of pages, and then up to one of four classes per power of two (1, 1.25, 1.5 or 1.75 times a power of two), so that less than a quarter of a buffer is unused.
+
+  Parameters
+  ----------
+  size : :obj:`int`
+    The number of bytes asked for.
+
+  Returns
+  -------
+  size_class : :obj:`int`
+    The number of bytes in the buffer that is handed out.
+  """
+  pages = max(1, -(-size//PAGE_SIZE))
+  if pages > 4:
+    step = 1 << (pages.bit_length() - 3)
+    pages = -(-pages//step)*step
+  return pages*PAGE_SIZE
+
+class BufferPool:
+  """
+  Hands out page aligned buffers, and keeps buffers that are given back so that they can be handed out again, rather than allocating a new buffer for every transfer.
+
+  .. code-block:: python
+
+    pool = sc.BufferPool(memory_cap = 2**30)
+    card = sc.Card(buffer_pool = pool)
+
+  Buffers are grouped by size class (see :obj:`get_size_class`), and a request is served by a free buffer of its class if there is one.
+  When the buffers kept for reuse take up more than :obj:`memory_cap` bytes, the least recently given back are freed.
+  Buffers that have been handed out and not given back do not count towards the cap.
+  A pool can be shared by several cards and threads.
+
+  Parameters
+  ----------
+  memory_cap : :obj:`int`
+    Most bytes kept for reuse.
+    Defaults to :obj:`DEFAULT_MEMORY_CAP` (256 MiB).
+
+  Attributes
+  ----------
+  number_of_hits : :obj:`int`
+    Requests served by a buffer that was kept for reuse.
+  number_of_misses : :obj:`int`
+    Requests that needed a new buffer.
+  number_of_evictions : :obj:`int`
+    Buffers freed to stay under the cap.
+  """
+  def __init__(self, memory_cap = DEFAULT_MEMORY_CAP):
+    self.memory_cap = memory_cap
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+    self.number_of_evictions = 0
+    self._free = {}
+    self._free_order = collections.OrderedDict()
+    self._free_bytes = 0
+    self._lock = threading.Lock()
+
+  def acquire(self, size):
+    """
+    Hands out a buffer.
+
+    Parameters
+    ----------
+    size : :obj:`int`
+      The least number of bytes the buffer needs.
+
+    Returns
+    -------
+    buffer : :obj:`ctypes.Array` of :obj:`ctypes.c_char`
+      A page aligned buffer of :obj:`get_size_class(size)` bytes.
+      Its contents are left over from its last use.
+      Give it back with :obj:`release` once the transfer that uses it has finished.
+    """
+    size_class = get_size_class(size)
+    with self._lock:
+      free_buffers = self._free.get(size_class)
+      if free_buffers:
+        buffer = free_buffers.pop()
+        del self._free_order[id(buffer)]
+        self._free_bytes -= size_class
+        self.number_of_hits += 1
+        return buffer
+      self.number_of_misses += 1
+    return spcm_tools.pvAllocMemPageAligned(size_class)
+
+  def release(self, buffer):
+    """
+    Gives back a buffer handed out by :obj:`acquire`, so that it can be handed out again.
+    If the buffers kept for reuse then take up more than :obj:`memory_cap`, the least recently given back are freed.
+
+    Parameters
+    ----------
+    buffer : :obj:`ctypes.Array` of :obj:`ctypes.c_char`
+      The buffer.
+    """
+    size_class = len(buffer)
+    with self._lock:
+      self._free.setdefault(size_class, []).append(buffer)
+      self._free_order[id(buffer)] = buffer
+      self._free_bytes += size_class
+      while self._free_bytes > self.memory_cap:
+        # The oldest buffer of any class is also the oldest of its own class
+        evicted_id, evicted_buffer = self._free_order.popitem(last = False)
+        self._free[len(evicted_buffer)].pop(0)
+        self._free_bytes -= len(evicted_buffer)
+        self.number_of_evictions += 1
+
+  def clear(self):
+    """
+    Frees every buffer kept for reuse.
+    """
+    with self._lock:
+      self._free.clear()
+      self._free_order.clear()
+      self._free_bytes = 0
+
+  def get_statistics(self):
+    """
+    Returns
+    -------
+    statistics : :obj:`dict`
+      :obj:`"Hits"`, :obj:`"Misses"` and :obj:`"Evictions"` counted since the pool was created, :obj:`"Free buffers"`, the number of buffers kept for reuse, and :obj:`"Free bytes"`, the memory they take up.
+    """
+    with self._lock:
+      return {
+        "Hits" : self.number_of_hits,
+        "Misses" : self.number_of_misses,
+        "Evictions" : self.number_of_evictions,
+        "Free buffers" : len(self._free_order),
+        "Free bytes" : self._free_bytes
+      }
@@ -0,0 +1,5546 @@
+"""
+The :obj:`Card` class, which wraps the driver functions of :obj:`pyspcm` for a single card.
+"""
+
+from spectrum_card.spectrum_header import pyspcm as spcm
+from spectrum_card.spectrum_header import spcm_tools
+from spectrum_card.spectrum_header import spcm_backends
+from spectrum_card.spectrum_header import spcm_names
+from spectrum_card.errors import get_error_type
+from spectrum_card.buffer_pool import BufferPool, PAGE_SIZE
+
+import functools
+import math
+import os
+import struct
+import threading
+import time
+
+# Registers whose value can change without being written to, depends on another register, or is rounded by the driver when written.
+# Writing to one of these removes it from the shadow register file, rather than storing the value written.
+_UNSHADOWED_REGISTERS = frozenset((
+  spcm.SPC_M2CMD,
+  spcm.SPC_SAMPLERATE,
+  spcm.SPC_MEMTEST,
+  spcm.SPC_SEQMODE_SEGMENTSIZE,
+  spcm.SPCM_XX_ASYNCIO
+))
+
+# Registers that change how memory is split into segments, so that the segment lengths shadowed before they were written no longer hold
+_SEGMENT_LAYOUT_REGISTERS = frozenset((
+  spcm.SPC_MEMSIZE,
+  spcm.SPC_SEQMODE_MAXSEGMENTS
+))
+
+# Registers that are written with spcm_dwSetParam_i64 rather than spcm_dwSetParam_i32
+_INT64_REGISTERS = frozenset((
+  spcm.SPC_CHENABLE,
+  spcm.SPC_SAMPLERATE,
+  spcm.SPC_REFERENCECLOCK,
+  spcm.SPC_MEMSIZE,
+  spcm.SPC_MEMTEST,
+  spcm.SPC_TRIG_DELAY,
+  spcm.SPC_SEQMODE_MAXSEGMENTS,
+  spcm.SPC_SEQMODE_WRITESEGMENT,
+  spcm.SPC_SEQMODE_SEGMENTSIZE,
+  spcm.SPC_SEQMODE_STARTSTEP
+))
+
+def _get_register_width(address):
+  if address in _INT64_REGISTERS or spcm.SPC_SEQMODE_STEPMEM0 <= address <= spcm.SPC_SEQMODE_STEPMEM8191:
+    return 64
+  return 32
+
+# Registers compared by Card.warm_start to check whether the card is still set up
+_WARM_START_REGISTERS = (
+  spcm.SPC_CARDMODE,
+  spcm.SPC_CHENABLE,
+  spcm.SPC_MEMSIZE,
+  spcm.SPC_SAMPLERATE,
+  spcm.SPC_LOOPS,
+  spcm.SPC_SEQMODE_MAXSEGMENTS
+)
+
+SNAPSHOT_MAGIC = b"SPCMSNAP\x01"
+_SNAPSHOT_HEADER = struct.Struct("<I")
+_SNAPSHOT_ENTRY = struct.Struct("<Iiq")
+
+# Methods of Card that are timed when instrumentation is enabled, and what their first argument is
+_INSTRUMENTED_METHODS = {
+  "_get_int32" : "Register",
+  "_set_int32" : "Register",
+  "_get_int64" : "Register",
+  "_set_int64" : "Register",
+  "_transfer_array_i64" : "Buffer",
+  "execute_command" : "Command"
+}
+
+def _get_buffer_name(buffer_type):
+  return {spcm.SPCM_BUF_DATA : "SPCM_BUF_DATA", spcm.SPCM_BUF_ABA : "SPCM_BUF_ABA", spcm.SPCM_BUF_TIMESTAMP : "SPCM_BUF_TIMESTAMP"}.get(buffer_type, str(buffer_type))
+
+class _ResponseBuffers:
+  # The ctypes numbers that reads are returned in, allocated once rather than on every read
+  def __init__(self):
+    self.int32 = spcm.int32(0)
+    self.int32_reference = spcm.byref(self.int32)
+    self.int64 = spcm.int64(0)
+    self.int64_reference = spcm.byref(self.int64)
+
+class _ThreadResponseBuffers(threading.local, _ResponseBuffers):
+  # One set of response buffers for each thread, so that reads from different threads do not need a lock
+  pass
+
+# Registers that the transfer context of a Card is built from, see _TransferContext
+_TRANSFER_CONTEXT_REGISTERS = (
+  spcm.SPC_CARDMODE,
+  spcm.SPC_CHENABLE,
+  spcm.SPCM_X0_MODE,
+  spcm.SPCM_X1_MODE,
+  spcm.SPCM_X2_MODE
+)
+
+class _TransferContext:
+  # What an upload needs to know about the setup, read once and reused by every upload until one of the registers it was built from changes
+  def __init__(self, card):
+    self.registers = {address : card._get_config_int64(address) if _get_register_width(address) == 64 else card._get_config_int32(address) for address in _TRANSFER_CONTEXT_REGISTERS}
+    self.is_segmented = card.get_mode_information() in ["Sequence", "Multi"]
+    self.stride = card.get_sample_resolution()
+    self.number_of_channels = card.get_number_of_active_channels()
+    self.resolution_bits = card.get_sample_resolution_bits()
+    self.io_modes = [self.registers[spcm.SPCM_X0_MODE + (spcm.SPCM_X1_MODE - spcm.SPCM_X0_MODE)*port] for port in range(3)]
+
+  def is_current(self, shadow):
+    return all(shadow.get(address) == value for address, value in self.registers.items())
+
+def _get_digital_out_mode(channel, bit):
+  # The SPCM_X*_MODE bit code that outputs one bit of a channel on an IO port
+  mode = spcm.SPCM_XMODE_DIGOUT
+  mode |= spcm.SPCM_XMODE_DIGOUTSRC_CH0 << channel
+  if bit == 15:
+    mode |= spcm.SPCM_XMODE_DIGOUTSRC_BIT15
+  elif bit == 14:
+    mode |= spcm.SPCM_XMODE_DIGOUTSRC_BIT14
+  elif bit == 13:
+    mode |= spcm.SPCM_XMODE_DIGOUTSRC_BIT13
+  return mode
+
+def _quantise(data_np, data, aux_data, markers, resolution_bits):
+  # Scales and interleaves the waveforms of each channel into data_np, with the markers of each channel in the bits given up for them
+  import numpy as np
+
+  channels = len(markers)
+  for channel in range(channels):
+    max_bits = min([resolution_bits] + [bit for aux_data_channel_index, bit in markers[channel]])
+    limit = int(2**(max_bits - 1) - 1)
+    channel_data = data[channel]
+    if not markers[channel]:
+      data_np[channel::channels] = limit*np.clip(channel_data, -1, 1)
+    else:
+      # Discretise waveform (rounding towards zero), and blank out bits meant for aux digital out
+      samples = (limit*np.clip(channel_data, -1, 1)).astype(np.int32)
+      samples &= ~(0x7 << max_bits)
+      # Append aux digital outs
+      for aux_data_channel_index, bit in markers[channel]:
+        samples |= (np.asarray(aux_data[aux_data_channel_index]).astype(np.int32) & 1) << bit
+      # Keep the low 16 bits, so that a marker on bit 15 becomes the sign bit
+      data_np[channel::channels] = samples.astype(np.int16)
+
+def _atomic(method):
+  # Holds the lock of a thread safe Card for the whole of a method that reads and writes several registers
+  @functools.wraps(method)
+  def atomic_method(self, *arguments, **keyword_arguments):
+    if self._lock is None:
+      return method(self, *arguments, **keyword_arguments)
+    with self._lock:
+      return method(self, *arguments, **keyword_arguments)
+  return atomic_method
+
+class Card:
+  """
+  Opens the connection to the card using :obj:`spcm_hOpen`.
+
+  Parameters
+  ----------
+  device_address : :obj:`str`
+    Directory to the card.
+  driver : :obj:`str` or :obj:`object`
+    Where the driver functions (:obj:`spcm_hOpen`, :obj:`spcm_dwGetParam_i32`, etc.) are found.
+    Either the name of a backend in :obj:`spectrum_card.spectrum_header.spcm_backends` (for example :obj:`"driver"`, :obj:`"simulated"` or :obj:`"recording"`), or a backend object itself.
+    Defaults to the default backend, which loads the driver library the first time a card is opened.
+    To run without a card, use :obj:`"simulated"`, or a :obj:`spectrum_card.spectrum_header.spcm_simulated.SimulatedDriver`.
+  cache_capabilities : :obj:`bool`
+    If :obj:`True` (default), registers that describe the card and do not change while it is open (card type, serial number, max sample rate, sample resolution, firmware versions, features, etc.) are only read from the driver once, and are then kept until :obj:`invalidate` is called.
+    If :obj:`False`, they are read from the driver every time.
+  thread_safe : :obj:`bool`
+    If :obj:`True`, the card can be used from several threads at once, for example one uploading and arming while another polls the status and temperatures.
+    Writes, and methods that read and write several registers (such as :obj:`set_segment_length`, :obj:`set_io_asynchronous`, :obj:`array_to_device` and :obj:`apply`), hold a lock for the card, so that they are not interleaved with writes from other threads.
+    A :obj:`Transaction` holds the lock until it is flushed, and only queues writes from the thread that opened it.
+    Reads do not take the lock, and each thread reads into its own response buffers, so polling does not wait for an upload to finish.
+    Commands (:obj:`execute_command`) do not take the lock either, so that a card that one thread is waiting on can be stopped from another.
+    If :obj:`False` (default), there is no lock, and the card should only be used from one thread at a time.
+  buffer_pool : :obj:`BufferPool`
+    Where the page aligned buffers for transfers (see :obj:`array_to_device`) are taken from and given back to, so that they can be reused.
+    Can be shared between cards.
+    If :obj:`None` (default), the card has its own pool.
+
+  Configuration registers written through a :obj:`Card` are kept in a write-through shadow register file, and getters such as :obj:`get_amplitude` and :obj:`get_mode` return the shadowed value without calling the driver.
+  To read the register from the driver instead, pass :obj:`verify = True` to the getter.
+  The shadow is cleared on :obj:`reset` and :obj:`invalidate`.
+
+  Errors returned by the driver are raised as a :obj:`SpcmError`, or one of its subclasses such as :obj:`SpcmTimeout`, see :obj:`spectrum_card.errors`.
+  """
+  def __init__(self, device_address = b"/dev/spcm0", driver = None, cache_capabilities = True, thread_safe = False, buffer_pool = None):
+    self.is_alive = False
+    self.cache_capabilities = cache_capabilities
+    self.is_thread_safe = thread_safe
+    self._lock = threading.RLock() if thread_safe else None
+    self.buffer_pool = buffer_pool if buffer_pool is not None else BufferPool()
+    self._capabilities = {}
+    self._shadow = {}
+    self._segment_sizes = {}
+    self._transfer_context = None
+    self._dma_transfer = None
+    self._number_of_timed_waits = 0
+    self._timeout_before_waits = None
+    self._transaction = None
+    self._fingerprint = None
+    self.is_instrumented = False
+    self._call_records = {}
+    if driver is None or isinstance(driver, str):
+      driver = spcm_backends.get_backend(driver)
+    self.driver = driver
+    self.card_handle = self.driver.spcm_hOpen(spcm.create_string_buffer(device_address))
+    if self.card_handle is None:
+      raise Exception("No card found...")
+
+    # Fast path: driver functions and response buffers are looked up and allocated once, rather than on every call
+    self._spcm_dwGetParam_i32 = self.driver.spcm_dwGetParam_i32
+    self._spcm_dwSetParam_i32 = self.driver.spcm_dwSetParam_i32
+    self._spcm_dwGetParam_i64 = self.driver.spcm_dwGetParam_i64
+    self._spcm_dwSetParam_i64 = self.driver.spcm_dwSetParam_i64
+    self._buffers = _ThreadResponseBuffers() if thread_safe else _ResponseBuffers()
+    self.is_alive = True
+    
+  def close(self):
+    """
+    Closes the connection to the card, once any transfer started by :obj:`start_array_to_device` has finished.
+    """
+    self._wait_for_dma_transfer()
+    if self._fingerprint is not None:
+      fingerprint_path, registers = self._fingerprint
+      if any(self._shadow.get(address) != value for address, (width, value) in registers.items() if address not in _UNSHADOWED_REGISTERS):
+        # The setup was changed after warm_start, so the fingerprint no longer describes the card
+        self._forget_fingerprint()
+    self.driver.spcm_vClose(self.card_handle)
+    self.is_alive = False
+  
+  # Error handling --------------------------------------------------------------
+  # =============================================================================
+  
+  def _handle_error(self, error):
+    if not error:
+      return
+    raise get_error_type(error)(error, self._get_error_info)
+
+  def _get_error_info(self):
+    # Only called when the details of an error are used, see SpcmError
+    return self._get_last_error()[1]
+
+  def _get_last_error(self):
+    # Returns the last error code stored by the driver (0 if there is none), and its register, value and text
+    error_register = spcm.uint32(0)
+    error_value = spcm.int32(0)
+    error_text = spcm.create_string_buffer(spcm.ERRORTEXTLEN)
+    error = self.driver.spcm_dwGetErrorInfo_i32(self.card_handle, spcm.byref(error_register), spcm.byref(error_value), error_text)
+    return error, (error_register.value, error_value.value, error_text.value.decode(errors = "replace"))
+
+  # DLL -------------------------------------------------------------------------
+  # =============================================================================
+  
+  def _get_int32(self, address):
+    if not self.is_alive:
+      raise Exception("Hardware not defined.")
+    if self._transaction is not None:
+      value = self._transaction._look_up(address)
+      if value is not None:
+        return value
+    buffers = self._buffers
+    error = self._spcm_dwGetParam_i32(self.card_handle, address, buffers.int32_reference)
+    if error:
+      self._handle_error(error)
+    return buffers.int32.value
+
+  def _set_int32(self, address, message):
+    if not self.is_alive:
+      raise Exception("Hardware not defined.")
+    # Commands do not wait for the lock, so that another thread can stop a card that is being waited on
+    lock = self._lock if address != spcm.SPC_M2CMD else None
+    if lock is not None:
+      lock.acquire()
+    try:
+      if self._transaction is not None and self._transaction._queue(address, message, 32):
+        return
+      error = self._spcm_dwSetParam_i32(self.card_handle, address, message)
+      if error:
+        self._shadow.pop(address, None)
+        self._handle_error(error)
+      if address in _UNSHADOWED_REGISTERS:
+        self._shadow.pop(address, None)
+      else:
+        self._shadow[address] = message
+    finally:
+      if lock is not None:
+        lock.release()
+
+  def _get_int64(self, address):
+    if not self.is_alive:
+      raise Exception("Hardware not defined.")
+    if self._transaction is not None:
+      value = self._transaction._look_up(address)
+      if value is not None:
+        return value
+    buffers = self._buffers
+    error = self._spcm_dwGetParam_i64(self.card_handle, address, buffers.int64_reference)
+    if error:
+      self._handle_error(error)
+    return buffers.int64.value
+
+  def _set_int64(self, address, message):
+    if not self.is_alive:
+      raise Exception("Hardware not defined.")
+    # Commands do not wait for the lock, so that another thread can stop a card that is being waited on
+    lock = self._lock if address != spcm.SPC_M2CMD else None
+    if lock is not None:
+      lock.acquire()
+    try:
+      if self._transaction is not None and self._transaction._queue(address, message, 64):
+        return
+      error = self._spcm_dwSetParam_i64(self.card_handle, address, message)
+      if error:
+        self._shadow.pop(address, None)
+        if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+          self._segment_sizes.clear()
+        self._handle_error(error)
+      if address in _UNSHADOWED_REGISTERS:
+        self._shadow.pop(address, None)
+        if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+          self._shadow_segment_size(message)
+      else:
+        self._shadow[address] = message
+        if address in _SEGMENT_LAYOUT_REGISTERS:
+          self._segment_sizes.clear()
+    finally:
+      if lock is not None:
+        lock.release()
+
+  def _shadow_segment_size(self, size):
+    # Segment lengths are shadowed separately, for each segment, as SPC_SEQMODE_SEGMENTSIZE holds the length of whichever segment is selected
+    segment = self._shadow.get(spcm.SPC_SEQMODE_WRITESEGMENT)
+    if segment is not None:
+      self._segment_sizes[segment] = size
+
+  def _get_capability_int32(self, address):
+    if not self.cache_capabilities:
+      return self._get_int32(address)
+    value = self._capabilities.get(address)
+    if value is None:
+      value = self._get_int32(address)
+      self._capabilities[address] = value
+    return value
+
+  def _get_capability_int64(self, address):
+    if not self.cache_capabilities:
+      return self._get_int64(address)
+    value = self._capabilities.get(address)
+    if value is None:
+      value = self._get_int64(address)
+      self._capabilities[address] = value
+    return value
+
+  def _get_config_int32(self, address, verify = False):
+    if self._transaction is not None:
+      value = self._transaction._look_up(address)
+      if value is not None:
+        return value
+    if not verify:
+      value = self._shadow.get(address)
+      if value is not None:
+        return value
+    if self._lock is None:
+      value = self._get_int32(address)
+      self._shadow[address] = value
+      return value
+    # Read and shadowed under the lock, so that a value written by another thread in between is not overwritten with the old one
+    with self._lock:
+      value = self._get_int32(address)
+      self._shadow[address] = value
+    return value
+
+  def _get_config_int64(self, address, verify = False):
+    if self._transaction is not None:
+      value = self._transaction._look_up(address)
+      if value is not None:
+        return value
+    if not verify:
+      value = self._shadow.get(address)
+      if value is not None:
+        return value
+    if self._lock is None:
+      value = self._get_int64(address)
+      self._shadow[address] = value
+      return value
+    # Read and shadowed under the lock, so that a value written by another thread in between is not overwritten with the old one
+    with self._lock:
+      value = self._get_int64(address)
+      self._shadow[address] = value
+    return value
+
+  @_atomic
+  def _transfer_array_i64(self, buffer_type, direction, notify_size, host_address, device_address, data_size):
+    if self._transaction is not None:
+      self._transaction.flush()
+    if self._fingerprint is not None:
+      # Memory is about to change, so the fingerprint no longer describes the card
+      self._forget_fingerprint()
+    self._handle_error(self.driver.spcm_dwDefTransfer_i64(self.card_handle, buffer_type, direction, notify_size, host_address, device_address, data_size))
+
+  # Bulk registers --------------------------------------------------------------
+  # =============================================================================
+
+  def read_registers(self, addresses, width = 32, as_dict = False):
+    """
+    Reads many registers from the driver in one loop, using a single response buffer, rather than one getter method call per register.
+    Values waiting in an open :obj:`Transaction` are returned instead of reading the driver, as they are for single registers.
+    Registers are always read from the driver, rather than the shadow register file.
+
+    Parameters
+    ----------
+    addresses : :obj:`list` of :obj:`int`
+      The registers to read, for example :obj:`[spcm.SPC_PCITYP, spcm.SPC_PCISERIALNO]`.
+    width : :obj:`int`
+      :obj:`32` (default) to read with :obj:`spcm_dwGetParam_i32`, or :obj:`64` to read with :obj:`spcm_dwGetParam_i64`.
+    as_dict : :obj:`bool`
+      If :obj:`True`, returns a :obj:`dict` from each register to its value, rather than an array.
+
+    Returns
+    -------
+    values : :obj:`numpy.ndarray` of :obj:`numpy.int32` or :obj:`numpy.int64`, or :obj:`dict` of :obj:`int` to :obj:`int`
+      The value of each register, in the same order as :obj:`addresses`.
+    """
+    import numpy as np
+
+    if not self.is_alive:
+      raise Exception("Hardware not defined.")
+    buffers = self._buffers
+    if width == 32:
+      get_param = self._spcm_dwGetParam_i32
+      response = buffers.int32
+      response_reference = buffers.int32_reference
+      dtype = np.int32
+    elif width == 64:
+      get_param = self._spcm_dwGetParam_i64
+      response = buffers.int64
+      response_reference = buffers.int64_reference
+      dtype = np.int64
+    else:
+      raise ValueError("width must be either 32 or 64.")
+    card_handle = self.card_handle
+    transaction = self._transaction
+    values = []
+    append = values.append
+    for address in addresses:
+      if transaction is not None:
+        value = transaction._look_up(address)
+        if value is not None:
+          append(value)
+          continue
+      error = get_param(card_handle, address, response_reference)
+      if error:
+        self._handle_error(error)
+      append(response.value)
+    if as_dict:
+      return dict(zip(addresses, values))
+    return np.array(values, dtype = dtype)
+
+  @_atomic
+  def write_registers(self, registers):
+    """
+    Writes many registers in one loop, rather than one setter method call per register.
+    Each register is written with :obj:`spcm_dwSetParam_i64` or :obj:`spcm_dwSetParam_i32` depending on the register, and is kept in the shadow register file, as it is for single registers.
+    Inside a :obj:`Transaction`, the writes are queued.
+    Commands should still be sent with :obj:`execute_command`, so that the shadow register file is cleared on a reset.
+
+    Parameters
+    ----------
+    registers : :obj:`dict` of :obj:`int` to :obj:`int`, or :obj:`list` of :obj:`tuple` of :obj:`int`
+      The value to write to each register, either as a :obj:`dict`, or as :obj:`(address, value)` pairs, which are written in order.
+    """
+    if not self.is_alive:
+      raise Exception("Hardware not defined.")
+    if isinstance(registers, dict):
+      registers = registers.items()
+    if self._transaction is not None:
+      for address, value in registers:
+        if _get_register_width(address) == 64:
+          self._set_int64(address, int(value))
+        else:
+          self._set_int32(address, int(value))
+      return
+    set_int32 = self._spcm_dwSetParam_i32
+    set_int64 = self._spcm_dwSetParam_i64
+    card_handle = self.card_handle
+    shadow = self._shadow
+    for address, value in registers:
+      value = int(value)
+      if _get_register_width(address) == 64:
+        error = set_int64(card_handle, address, value)
+      else:
+        error = set_int32(card_handle, address, value)
+      if error:
+        shadow.pop(address, None)
+        if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+          self._segment_sizes.clear()
+        self._handle_error(error)
+      if address in _UNSHADOWED_REGISTERS:
+        shadow.pop(address, None)
+        if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+          self._shadow_segment_size(value)
+      else:
+        shadow[address] = value
+        if address in _SEGMENT_LAYOUT_REGISTERS:
+          self._segment_sizes.clear()
+
+  # Caching ---------------------------------------------------------------------
+  # =============================================================================
+
+  def invalidate(self):
+    """
+    Forgets any cached capability registers and the shadow register file, so that registers are read from the driver again next time they are asked for.
+    See the :obj:`cache_capabilities` parameter of :obj:`Card`.
+    """
+    self._capabilities.clear()
+    self._shadow.clear()
+    self._segment_sizes.clear()
+    self._transfer_context = None
+
+  # Instrumentation -------------------------------------------------------------
+  # =============================================================================
+
+  def instrumentation_enable(self):
+    """
+    Starts counting and timing calls to the methods that talk to the driver (:obj:`_get_int32`, :obj:`_set_int32`, :obj:`_get_int64`, :obj:`_set_int64`, :obj:`_transfer_array_i64` and :obj:`execute_command`), for each register, buffer or command.
+    Results are read using :obj:`stats`.
+
+    The methods are only replaced with timed versions on this :obj:`Card` while instrumentation is enabled, so it costs nothing when disabled.
+    """
+    if self.is_instrumented:
+      return
+    self.is_instrumented = True
+    for method_name in _INSTRUMENTED_METHODS:
+      setattr(self, method_name, self._get_instrumented_method(method_name))
+
+  def instrumentation_disable(self):
+    """
+    Stops counting and timing calls, and puts back the untimed methods.
+    Results so far are kept until :obj:`reset_stats` is called.
+    """
+    for method_name in _INSTRUMENTED_METHODS:
+      self.__dict__.pop(method_name, None)
+    self.is_instrumented = False
+
+  def _get_instrumented_method(self, method_name):
+    method = getattr(Card, method_name).__get__(self)
+    records = self._call_records
+    perf_counter_ns = time.perf_counter_ns
+    def instrumented_method(key, *arguments):
+      start_time = perf_counter_ns()
+      try:
+        return method(key, *arguments)
+      finally:
+        duration = perf_counter_ns() - start_time
+        record = records.get((method_name, key))
+        if record is None:
+          record = [0, 0, {}]
+          records[(method_name, key)] = record
+        record[0] += 1
+        record[1] += duration
+        bucket = duration.bit_length()
+        record[2][bucket] = record[2].get(bucket, 0) + 1
+    return instrumented_method
+
+  def stats(self):
+    """
+    Reads the call counts and latencies recorded since :obj:`instrumentation_enable` or :obj:`reset_stats`.
+    Calls made inside other calls are counted by both (for example, :obj:`execute_command` writes :obj:`SPC_M2CMD` using :obj:`_set_int32`).
+
+    Returns
+    -------
+    stats : :obj:`list` of :obj:`dict`
+      One :obj:`dict` for each method and register (or buffer, or command), with the most time consuming first.
+      Each has keys
+
+      * :obj:`"Method"`: name of the method, such as :obj:`"_get_int32"`.
+      * :obj:`"Register"`, :obj:`"Buffer"` or :obj:`"Command"`: the first argument of the method, as an :obj:`int`.
+      * :obj:`"Name"`: that argument as a name from :obj:`regs`, such as :obj:`"SPC_M2STATUS"`, or :obj:`"M2CMD_CARD_START | M2CMD_CARD_ENABLETRIGGER"`.
+      * :obj:`"Calls"`: the number of calls.
+      * :obj:`"Total time"`: the total time spent in the calls, in s.
+      * :obj:`"Mean time"`: the mean time of each call, in s.
+      * :obj:`"Histogram"`: a :obj:`dict` from upper bounds of power of two latency bins (in ns) to the number of calls that took at least half of that bound, and less than it.
+    """
+    stats = []
+    for (method_name, key), (calls, total_time, histogram) in self._call_records.items():
+      argument_type = _INSTRUMENTED_METHODS[method_name]
+      if argument_type == "Register":
+        name = spcm_names.get_register_name(key)
+      elif argument_type == "Buffer":
+        name = _get_buffer_name(key)
+      else:
+        name = spcm_names.get_command_name(key)
+      stats.append({
+        "Method" : method_name,
+        argument_type : key,
+        "Name" : name,
+        "Calls" : calls,
+        "Total time" : total_time*1e-9,
+        "Mean time" : total_time*1e-9/calls,
+        "Histogram" : {2**bucket : histogram[bucket] for bucket in sorted(histogram)}
+      })
+    stats.sort(key = lambda stat: stat["Total time"], reverse = True)
+    return stats
+
+  def reset_stats(self):
+    """
+    Forgets every call count and latency recorded so far.
+    """
+    self._call_records.clear()
+
+  # Transactions ----------------------------------------------------------------
+  # =============================================================================
+
+  def transaction(self):
+    """
+    Starts queueing writes to registers, so that they are written together, in a safe order, with repeated writes to the same register combined.
+    Use in a :obj:`with` block, see :obj:`Transaction`.
+
+    Returns
+    -------
+    transaction : :obj:`Transaction`
+      The transaction already open on this card, or a new one.
+    """
+    if self._transaction is not None and self._transaction.thread == threading.get_ident():
+      return self._transaction
+    from spectrum_card.transaction import Transaction
+    return Transaction(self)
+
+  # Configuration ---------------------------------------------------------------
+  # =============================================================================
+
+  @_atomic
+  def apply(self, configuration):
+    """
+    Writes a :obj:`CardConfiguration` to the card.
+    Only registers that differ from what is known to be on the card already (from the shadow register file) are written, so applying a configuration with one changed setting costs one driver call.
+    The writes are made in a :obj:`Transaction`, so are put in a safe order.
+
+    Parameters
+    ----------
+    configuration : :obj:`CardConfiguration`
+      The settings to write.
+
+    Returns
+    -------
+    number_of_writes : :obj:`int`
+      How many registers were written.
+    """
+    return self._write_changed_registers(configuration.get_registers())
+
+  def _write_changed_registers(self, registers):
+    number_of_writes = 0
+    with self.transaction() as transaction:
+      for address, (width, value) in registers.items():
+        current_value = transaction._look_up(address)
+        if current_value is None:
+          current_value = self._shadow.get(address)
+        if current_value is None and address in _UNSHADOWED_REGISTERS:
+          # Read back what the driver made of the last value written, so that it is shadowed from now on
+          current_value = self._get_config_int64(address) if width == 64 else self._get_config_int32(address)
+        if current_value == value:
+          continue
+        if width == 32:
+          self._set_int32(address, value)
+        else:
+          self._set_int64(address, value)
+        number_of_writes += 1
+    return number_of_writes
+
+  # Snapshots -------------------------------------------------------------------
+  # =============================================================================
+
+  def _get_writable_registers(self):
+    registers = [
+      spcm.SPC_CARDMODE,
+      spcm.SPC_CHENABLE,
+      spcm.SPC_CLOCKMODE,
+      spcm.SPC_REFERENCECLOCK,
+      spcm.SPC_SAMPLERATE,
+      spcm.SPC_CLOCKOUT,
+      spcm.SPC_MEMSIZE,
+      spcm.SPC_LOOPS,
+      spcm.SPC_TIMEOUT,
+      spcm.SPC_SEQMODE_MAXSEGMENTS,
+      spcm.SPC_SEQMODE_WRITESEGMENT,
+      spcm.SPC_SEQMODE_STARTSTEP,
+      spcm.SPC_TRIG_ORMASK,
+      spcm.SPC_TRIG_ANDMASK,
+      spcm.SPC_TRIG_CH_ORMASK0,
+      spcm.SPC_TRIG_CH_ANDMASK0,
+      spcm.SPC_TRIG_DELAY,
+      spcm.SPC_TRIG_TERM
+    ]
+    for trigger_index in range(2):
+      registers.append(spcm.SPC_TRIG_EXT0_ACDC + (spcm.SPC_TRIG_EXT1_ACDC - spcm.SPC_TRIG_EXT0_ACDC)*trigger_index)
+      registers.append(spcm.SPC_TRIG_EXT0_MODE + (spcm.SPC_TRIG_EXT1_MODE - spcm.SPC_TRIG_EXT0_MODE)*trigger_index)
+      registers.append(spcm.SPC_TRIG_EXT0_LEVEL0 + (spcm.SPC_TRIG_EXT1_LEVEL0 - spcm.SPC_TRIG_EXT0_LEVEL0)*trigger_index)
+      registers.append(spcm.SPC_TRIG_EXT0_LEVEL1 + (spcm.SPC_TRIG_EXT1_LEVEL1 - spcm.SPC_TRIG_EXT0_LEVEL1)*trigger_index)
+    for channel_index in range(self.get_number_of_front_end_modules()*self.get_number_of_channels_per_front_end_module()):
+      registers.append(spcm.SPC_AMP0 + channel_index*(spcm.SPC_AMP1 - spcm.SPC_AMP0))
+      registers.append(spcm.SPC_ENABLEOUT0 + channel_index*(spcm.SPC_ENABLEOUT1 - spcm.SPC_ENABLEOUT0))
+      registers.append(spcm.SPC_FILTER0 + channel_index*(spcm.SPC_FILTER1 - spcm.SPC_FILTER0))
+      registers.append(spcm.SPC_CH0_STOPLEVEL + channel_index*(spcm.SPC_CH1_STOPLEVEL - spcm.SPC_CH0_STOPLEVEL))
+      registers.append(spcm.SPC_CH0_CUSTOM_STOP + channel_index*(spcm.SPC_CH1_CUSTOM_STOP - spcm.SPC_CH0_CUSTOM_STOP))
+      if channel_index % 2 == 0:
+        registers.append(spcm.SPC_DIFF0 + channel_index*(spcm.SPC_DIFF1 - spcm.SPC_DIFF0))
+        registers.append(spcm.SPC_DOUBLEOUT0 + channel_index*(spcm.SPC_DOUBLEOUT1 - spcm.SPC_DOUBLEOUT0))
+    for port in range(3):
+      registers.append(spcm.SPCM_X0_MODE + (spcm.SPCM_X1_MODE - spcm.SPCM_X0_MODE)*port)
+    return registers
+
+  @_atomic
+  def snapshot(self):
+    """
+    Captures the setup of the card (every register that :obj:`Card` can write, apart from commands and asynchronous IO) as a compact binary blob, which can be written back using :obj:`restore`.
+    Registers that are shadowed (see :obj:`Card`) cost no driver calls to capture.
+
+    In sequence mode, the length of each segment is included.
+    Sequence steps are included if they have been written or read through this :obj:`Card` since the last :obj:`reset`.
+
+    The blob starts with :obj:`SNAPSHOT_MAGIC` and a :obj:`uint32` count, followed by one little endian :obj:`"<Iiq"` entry per register: the register address from :obj:`regs`, the segment it belongs to (:obj:`-1` except for :obj:`SPC_SEQMODE_SEGMENTSIZE`), and its value.
+
+    Returns
+    -------
+    snapshot : :obj:`bytes`
+    """
+    entries = []
+    for address in self._get_writable_registers():
+      if _get_register_width(address) == 64:
+        value = self._get_config_int64(address)
+      else:
+        value = self._get_config_int32(address)
+      entries.append(_SNAPSHOT_ENTRY.pack(address, -1, value))
+    for address, value in self._shadow.items():
+      if spcm.SPC_SEQMODE_STEPMEM0 <= address <= spcm.SPC_SEQMODE_STEPMEM8191:
+        entries.append(_SNAPSHOT_ENTRY.pack(address, -1, value))
+    if self.get_mode() == spcm.SPC_REP_STD_SEQUENCE:
+      for segment in range(self.get_number_of_segments()):
+        entries.append(_SNAPSHOT_ENTRY.pack(spcm.SPC_SEQMODE_SEGMENTSIZE, segment, self.get_segment_length(segment)))
+    return SNAPSHOT_MAGIC + _SNAPSHOT_HEADER.pack(len(entries)) + b"".join(entries)
+
+  @_atomic
+  def restore(self, snapshot):
+    """
+    Writes a setup captured by :obj:`snapshot` back to the card.
+    The registers are written in one :obj:`Transaction`, so are put in a safe order, and registers that are already shadowed with the right value are not written.
+    Segment lengths are shadowed for each segment, once they have been written or read through this :obj:`Card`, so are only written if they have changed too.
+
+    Parameters
+    ----------
+    snapshot : :obj:`bytes`
+      A blob from :obj:`snapshot`.
+
+    Returns
+    -------
+    number_of_writes : :obj:`int`
+      How many registers were written.
+    """
+    snapshot = bytes(snapshot)
+    if not snapshot.startswith(SNAPSHOT_MAGIC):
+      raise ValueError("Not a snapshot of a card.")
+    header_end = len(SNAPSHOT_MAGIC) + _SNAPSHOT_HEADER.size
+    number_of_entries, = _SNAPSHOT_HEADER.unpack_from(snapshot, len(SNAPSHOT_MAGIC))
+    if len(snapshot) != header_end + number_of_entries*_SNAPSHOT_ENTRY.size:
+      raise ValueError("Snapshot is the wrong length.")
+    registers = {}
+    segment_lengths = {}
+    for address, segment, value in _SNAPSHOT_ENTRY.iter_unpack(snapshot[header_end:]):
+      if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+        segment_lengths[segment] = value
+      else:
+        registers[address] = (_get_register_width(address), value)
+    with self.transaction() as transaction:
+      number_of_writes = self._write_changed_registers(registers)
+      # Segment lengths shadowed before the memory is split differently no longer hold, so are all written
+      is_layout_changing = any(address in transaction._writes for address in _SEGMENT_LAYOUT_REGISTERS)
+      changed_segment_lengths = {}
+      for segment, length in segment_lengths.items():
+        queued = transaction._writes.get((spcm.SPC_SEQMODE_SEGMENTSIZE, segment))
+        current_length = queued[1] if queued is not None else self._segment_sizes.get(segment)
+        if is_layout_changing or current_length != length:
+          changed_segment_lengths[segment] = length
+      if changed_segment_lengths:
+        write_segment = registers.get(spcm.SPC_SEQMODE_WRITESEGMENT, (64, 0))[1]
+        for segment, length in changed_segment_lengths.items():
+          self._set_int64(spcm.SPC_SEQMODE_WRITESEGMENT, segment)
+          self._set_int64(spcm.SPC_SEQMODE_SEGMENTSIZE, length)
+        self._set_int64(spcm.SPC_SEQMODE_WRITESEGMENT, write_segment)
+        number_of_writes += len(changed_segment_lengths)
+    return number_of_writes
+
+  # Warm start ------------------------------------------------------------------
+  # =============================================================================
+
+  @_atomic
+  def warm_start(self, configuration, segments = None, fingerprint_directory = None):
+    """
+    Sets up the card with a configuration and segment data, unless it is already set up that way from a previous run.
+    This replaces calling :obj:`reset`, :obj:`apply` and :obj:`array_to_device` when a program starts.
+
+    After setting up the card, a fingerprint (a hash of the configuration and data, and the values of a few cheap registers) is saved in a file named after the serial number of the card.
+    The next time :obj:`warm_start` is called with the same configuration and data, those registers are read and compared to the fingerprint.
+    If they match, the reset, configuration and upload are skipped, and the configuration is taken to be on the card.
+
+    The fingerprint is deleted if this :obj:`Card` transfers data to the card afterwards, or is closed with a setup different to the one that was fingerprinted.
+    Changes made to the card by other programs are only noticed if they change one of the compared registers (:obj:`SPC_CARDMODE`, :obj:`SPC_CHENABLE`, :obj:`SPC_MEMSIZE`, :obj:`SPC_SAMPLERATE`, :obj:`SPC_LOOPS` and :obj:`SPC_SEQMODE_MAXSEGMENTS`).
+
+    Parameters
+    ----------
+    configuration : :obj:`CardConfiguration`
+      The setup of the card.
+    segments : :obj:`dict` of :obj:`int` to :obj:`list` or :obj:`dict`
+      The data to upload to each segment.
+      Either a :obj:`list` of waveforms (see the :obj:`data` parameter of :obj:`array_to_device`), or a :obj:`dict` with keys :obj:`"Data"`, and optionally :obj:`"Aux data"` and :obj:`"Aux data channels"`.
+    fingerprint_directory : :obj:`str`
+      Where fingerprints are saved.
+      Defaults to a :obj:`spectrum_card` directory in the system temporary directory, which is cleared when the computer restarts (which also resets the card).
+
+    Returns
+    -------
+    reconfigured : :obj:`bool`
+      :obj:`False` if the card was already set up, :obj:`True` if it was reset and set up.
+    """
+    import hashlib
+    import json
+    import tempfile
+    import numpy as np
+
+    if segments is None:
+      segments = {}
+    if fingerprint_directory is None:
+      fingerprint_directory = os.path.join(tempfile.gettempdir(), "spectrum_card")
+    fingerprint_path = os.path.join(fingerprint_directory, f"{self.get_serial_number()}.json")
+    registers = configuration.get_registers()
+
+    # Hash everything that is to be written to the card
+    fingerprint_hash = hashlib.sha256()
+    for address, (width, value) in sorted(registers.items()):
+      fingerprint_hash.update(_SNAPSHOT_ENTRY.pack(address, width, value))
+    for segment, segment_data in sorted(segments.items()):
+      if not isinstance(segment_data, dict):
+        segment_data = {"Data" : segment_data}
+      fingerprint_hash.update(_SNAPSHOT_ENTRY.pack(spcm.SPC_SEQMODE_SEGMENTSIZE, segment, 0))
+      for waveform in segment_data["Data"]:
+        fingerprint_hash.update(np.ascontiguousarray(waveform, dtype = np.float64).tobytes())
+      if segment_data.get("Aux data") is not None:
+        for waveform in segment_data["Aux data"]:
+          fingerprint_hash.update(np.ascontiguousarray(waveform, dtype = np.bool_).tobytes())
+        fingerprint_hash.update(json.dumps(segment_data["Aux data channels"], sort_keys = True).encode())
+    fingerprint = fingerprint_hash.hexdigest()
+
+    # Compare to what was saved last time
+    try:
+      with open(fingerprint_path) as fingerprint_file:
+        saved_fingerprint = json.load(fingerprint_file)
+    except (OSError, ValueError):
+      saved_fingerprint = None
+    if saved_fingerprint is not None and saved_fingerprint.get("Fingerprint") == fingerprint:
+      is_matching = True
+      for address, value in saved_fingerprint["Registers"].items():
+        address = int(address)
+        if _get_register_width(address) == 64:
+          card_value = self._get_int64(address)
+        else:
+          card_value = self._get_int32(address)
+        if card_value != value:
+          is_matching = False
+          break
+      if is_matching:
+        self._shadow.update({address : value for address, (width, value) in registers.items() if address not in _UNSHADOWED_REGISTERS})
+        self._fingerprint = (fingerprint_path, registers)
+        return False
+
+    # Set up from scratch
+    self._forget_fingerprint(fingerprint_path)
+    self.reset()
+    self.apply(configuration)
+    for segment, segment_data in sorted(segments.items()):
+      if isinstance(segment_data, dict):
+        self.array_to_device(segment_data["Data"], segment, segment_data.get("Aux data"), segment_data.get("Aux data channels"))
+      else:
+        self.array_to_device(segment_data, segment)
+
+    saved_registers = {}
+    for address in _WARM_START_REGISTERS:
+      saved_registers[address] = self._get_config_int64(address) if _get_register_width(address) == 64 else self._get_config_int32(address)
+    os.makedirs(fingerprint_directory, exist_ok = True)
+    with open(fingerprint_path, "w") as fingerprint_file:
+      json.dump({"Fingerprint" : fingerprint, "Registers" : saved_registers}, fingerprint_file)
+    self._fingerprint = (fingerprint_path, registers)
+    return True
+
+  def _forget_fingerprint(self, fingerprint_path = None):
+    if fingerprint_path is None:
+      fingerprint_path = self._fingerprint[0]
+    self._fingerprint = None
+    try:
+      os.remove(fingerprint_path)
+    except OSError:
+      pass
+
+  # Identity --------------------------------------------------------------------
+  # =============================================================================
+  
+  def get_card_type(self):
+    """
+    Reads raw data from :obj:`SPC_PCITYP`.
+    For decoded information, use :obj:`get_name` and :obj:`get_series_information` instead.
+
+    Returns
+    -------
+    bit_type : :obj:`int`
+      Bit code for card type.
+    """
+    return self._get_capability_int32(spcm.SPC_PCITYP)
+  
+  def get_name(self):
+    """
+    Reads :obj:`SPC_PCITYP` to find the name of the card.
+
+    Returns
+    -------
+    name : :obj:`str`
+      Name of the card.
+    """
+    return spcm_tools.szTypeToName(self.get_card_type())
+  
+  def get_series(self):
+    """
+    Reads raw data from :obj:`SPC_PCITYP`.
+    For decoded information, use :obj:`get_series_information` instead.
+
+    Returns
+    -------
+    bit_series : :obj:`int`
+      Bit code for card series.
+    """
+    response = self._get_capability_int32(spcm.SPC_PCITYP)
+    return response & spcm.TYP_SERIESMASK
+  
+  def get_series_information(self):
+    """
+    Reads :obj:`SPC_PCITYP` to find the series of the card.
+
+    Returns
+    -------
+    Series : :obj:`str`
+      Series of the card.
+    """
+    series = self.get_series()
+    if series == spcm.TYP_MISERIES:
+      return "MI"
+    elif series == spcm.TYP_MCSERIES:
+      return "MC"
+    elif series == spcm.TYP_MXSERIES:
+      return "MX"
+    elif series == spcm.TYP_M2ISERIES:
+      return "M2i"
+    elif series == spcm.TYP_M2IEXPSERIES:
+      return "M2i Express"
+    elif series == spcm.TYP_M3ISERIES:
+      return "M3i"
+    elif series == spcm.TYP_M3IEXPSERIES:
+      return "M3i Express"
+    elif series == spcm.TYP_M4IEXPSERIES:
+      return "M4i Express"
+    elif series == spcm.TYP_M4XEXPSERIES:
+      return "M4x Express"
+    elif series == spcm.TYP_M2PEXPSERIES:
+      return "M4p Express"
+    elif series == spcm.TYP_M5IEXPSERIES:
+      return "M4i Express"
+  
+  def get_serial_number(self):
+    """
+    Reads :obj:`SPC_PCISERIALNO` to find the series of the card.
+
+    Returns
+    -------
+    serial_number : :obj:`int`
+      Serial number of the card.
+    """
+    return self._get_capability_int32(spcm.SPC_PCISERIALNO)
+  
+  def get_production_date(self):
+    """
+    Reads raw data from :obj:`SPC_PCIDATE`.
+    For decoded information, use :obj:`get_production_date_information` instead.
+
+    Returns
+    -------
+    bit_date : :obj:`int`
+      Bit code for production date.
+    """
+    return self._get_capability_int32(spcm.SPC_PCIDATE)
+  
+  def get_production_date_information(self):
+    """
+    Reads :obj:`SPC_PCIDATE` to find the production date of the card.
+
+    Returns
+    -------
+    date : :obj:`dict`
+      Contains two entries:
+      :obj:`"Year"` is an :obj:`int` which contains the year the card was produced.
+      :obj:`"Week"` is an :obj:`int` which contains the week of the year the card was produced.
+    """
+    bitmap = self.get_production_date()
+    return {"Week":(bitmap>>16), "Year":(bitmap & 0xFFFF)}
+  
+  def get_calibration_date(self):
+    """
+    Reads raw data from :obj:`SPC_CALIBDATE`.
+    For decoded information, use :obj:`get_calibration_date_information` instead.
+
+    Returns
+    -------
+    bit_date : :obj:`int`
+      Bit code for production date.
+    """
+    return self._get_capability_int32(spcm.SPC_CALIBDATE)
+  
+  def get_calibration_date_information(self):
+    """
+    Reads :obj:`SPC_CALIBDATE` to find the calibration date of the card.
+
+    Returns
+    -------
+    date : :obj:`dict`
+      Contains two entries:
+      :obj:`"Year"` is an :obj:`int` which contains the year the card was calibrated.
+      :obj:`"Week"` is an :obj:`int` which contains the week of the year the card was calibrated.
+    """
+    bitmap = self.get_calibration_date()
+    return {"Week":(bitmap>>16), "Year":(bitmap & 0xFFFF)}
+  
+  def get_is_demo_card(self):
+    """
+    Reads :obj:`SPC_MIINST_ISDEMOCARD` to find out if the card is a "demo" card (i.e., a software emulation).
+
+    Returns
+    -------
+    is_demo : :obj:`int`
+      :obj:`1` if the card is a demo, otherwise :obj:`0`.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_ISDEMOCARD)
+  
+  def set_card_identification(self, value):
+    """
+    Writes to :obj:`SPC_CARDIDENTIFICATION` to set or unset the card's notification LED to identification mode.
+    You may want to use :obj:`identification_led_enable` and :obj:`identification_led_disable` instead.
+
+    Parameters
+    ----------
+    value : :obj:`int`
+      :obj:`1` to get the LED to flash, otherwise :obj:`0`.
+    """
+    self._set_int32(spcm.SPC_CARDIDENTIFICATION, value)
+
+  def identification_led_enable(self):
+    """
+    Writes to :obj:`SPC_CARDIDENTIFICATION` to set the card's notification LED to identification mode.
+    """
+    self.set_card_identification(1)
+
+  def identification_led_disable(self):
+    """
+    Writes to :obj:`SPC_CARDIDENTIFICATION` to set the card's notification LED to normal mode.
+    """
+    self.set_card_identification(0)
+
+  def get_card_identification(self, verify = False):
+    """
+    Reads :obj:`SPC_CARDIDENTIFICATION` to see if the card's notification LED is in identification mode.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    value : :obj:`int`
+      :obj:`1` if the LED is flashing, otherwise :obj:`0`.
+    """
+    return self._get_config_int32(spcm.SPC_CARDIDENTIFICATION, verify)
+
+  
+  # Card information ------------------------------------------------------------
+  # =============================================================================
+  
+  def get_number_of_front_end_modules(self):
+    """
+    Reads :obj:`SPC_MIINST_MODULES`.
+
+    Returns
+    -------
+    number : :obj:`int`
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_MODULES)
+  
+  def get_number_of_channels_per_front_end_module(self):
+    """
+    Reads :obj:`SPC_MIINST_CHPERMODULE`.
+
+    Returns
+    -------
+    number : :obj:`int`
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_CHPERMODULE)
+  
+  def get_adc_full_scale(self):
+    """
+    Reads :obj:`SPC_MIINST_MAXADCVALUE`.
+
+    Returns
+    -------
+    full_scale : :obj:`int`
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_MAXADCVALUE)
+  
+  def get_min_external_clock(self):
+    """
+    Reads :obj:`SPC_MIINST_MINEXTCLOCK`.
+
+    Returns
+    -------
+    frequency : :obj:`int`
+      Minimum allowed external clock frequency in Hz.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_MINEXTCLOCK)
+  
+  def get_max_external_clock(self):
+    """
+    Reads :obj:`SPC_MIINST_MAXEXTCLOCK`.
+
+    Returns
+    -------
+    frequency : :obj:`int`
+      Maximum allowed external clock frequency in Hz.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_MAXEXTCLOCK)
+  
+  def get_min_external_reference_clock(self):
+    """
+    Reads :obj:`SPC_MIINST_MINEXTREFCLOCK`.
+
+    Returns
+    -------
+    frequency : :obj:`int`
+      Minimum allowed reference clock frequency in Hz.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_MINEXTREFCLOCK)
+  
+  def get_max_external_reference_clock(self):
+    """
+    Reads :obj:`SPC_MIINST_MAXEXTREFCLOCK`.
+
+    Returns
+    -------
+    frequency : :obj:`int`
+      Maximum allowed reference clock frequency in Hz.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_MAXEXTREFCLOCK)
+  
+  # Temperature -----------------------------------------------------------------
+  # =============================================================================
+  
+  def get_temperature_base(self, unit = "C"):
+    """
+    Reads :obj:`SPC_MON_TK_BASE_CTRL`, :obj:`SPC_MON_TC_BASE_CTRL` or :obj:`SPC_MON_TF_BASE_CTRL`.
+
+    Parameters
+    ----------
+    unit : :obj:`str`
+      Either :obj:`"K"` for temperature in Kelvin, :obj:`"C"` for temperature in Celsius (default), or :obj:`"F"` for temperature in Fahrenheit.
+
+    Returns
+    -------
+    temperature : :obj:`int`
+      Temperature in the unit selected (defaulting to Celsius).
+    """
+    if unit == "K":
+      unit_offset = 0
+    if unit == "C":
+      unit_offset = 1
+    if unit == "F":
+      unit_offset = 2
+    return self._get_int32(spcm.SPC_MON_TK_BASE_CTRL + (spcm.SPC_MON_TC_BASE_CTRL - spcm.SPC_MON_TK_BASE_CTRL)*unit_offset)
+  
+  def get_temperature_module_0(self, unit = "C"):
+    """
+    Reads :obj:`SPC_MON_TK_MODULE_0`, :obj:`SPC_MON_TC_MODULE_0` or :obj:`SPC_MON_TF_MODULE_0`.
+
+    Parameters
+    ----------
+    unit : :obj:`str`
+      Either :obj:`"K"` for temperature in Kelvin, :obj:`"C"` for temperature in Celsius (default), or :obj:`"F"` for temperature in Fahrenheit.
+
+    Returns
+    -------
+    temperature : :obj:`int`
+      Temperature in the unit selected (defaulting to Celsius).
+    """
+    if unit == "K":
+      unit_offset = 0
+    if unit == "C":
+      unit_offset = 1
+    if unit == "F":
+      unit_offset = 2
+    return self._get_int32(spcm.SPC_MON_TK_MODULE_0 + (spcm.SPC_MON_TC_BASE_CTRL - spcm.SPC_MON_TK_BASE_CTRL)*unit_offset)
+  
+  def get_temperature_module_1(self, unit = "C"):
+    """
+    Reads :obj:`SPC_MON_TK_MODULE_1`, :obj:`SPC_MON_TC_MODULE_1` or :obj:`SPC_MON_TF_MODULE_1`.
+
+    Parameters
+    ----------
+    unit : :obj:`str`
+      Either :obj:`"K"` for temperature in Kelvin, :obj:`"C"` for temperature in Celsius (default), or :obj:`"F"` for temperature in Fahrenheit.
+
+    Returns
+    -------
+    temperature : :obj:`int`
+      Temperature in the unit selected (defaulting to Celsius).
+    """
+    if unit == "K":
+      unit_offset = 0
+    if unit == "C":
+      unit_offset = 1
+    if unit == "F":
+      unit_offset = 2
+    return self._get_int32(spcm.SPC_MON_TK_MODULE_1 + (spcm.SPC_MON_TC_BASE_CTRL - spcm.SPC_MON_TK_BASE_CTRL)*unit_offset)
+
+  # Hardware and PCB version ----------------------------------------------------
+  # =============================================================================
+  
+  def get_pci_version(self):
+    """
+    Reads :obj:`SPC_PCIVERSION`.
+    For decoded information, use :obj:`get_pci_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code for PCI version
+    """
+    return self._get_capability_int32(spcm.SPC_PCIVERSION)
+  
+  def get_pci_information(self):
+    """
+    Reads :obj:`SPC_PCIVERSION` and displays as a :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Hardware version"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_pci_version()
+    return {"Hardware version":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_base_pcb_version(self):
+    """
+    Reads :obj:`SPC_BASEPCBVERSION`.
+    For decoded information, use :obj:`get_base_pcb_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code for PCB version
+    """
+    return self._get_capability_int32(spcm.SPC_BASEPCBVERSION)
+  
+  def get_base_pcb_information(self):
+    """
+    Reads :obj:`SPC_BASEPCBVERSION` and displays as a :obj:`str`.
+
+    Returns
+    -------
+    version : :obj:`str`
+      Version in :obj:`str` format.
+    """
+    bitmap = self.get_base_pcb_version()
+    return f"{bitmap >> 8}.{bitmap & 0xFF}"
+  
+  def get_module_pci_version(self):
+    """
+    Reads :obj:`SPC_PCIMODULEVERSION`.
+    For decoded information, use :obj:`get_module_pci_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code for module PCI version
+    """
+    return self._get_capability_int32(spcm.SPC_PCIMODULEVERSION)
+  
+  def get_module_pci_information(self):
+    """
+    Reads :obj:`SPC_PCIMODULEVERSION` and displays as a :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Hardware version"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_module_pci_version()
+    return {"Hardware version":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_module_pcb_version(self):
+    """
+    Reads :obj:`SPC_MODULEPCBVERSION`.
+    For decoded information, use :obj:`get_module_pcb_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code for module PCB version
+    """
+    return self._get_capability_int32(spcm.SPC_MODULEPCBVERSION)
+  
+  def get_module_pcb_information(self):
+    """
+    Reads :obj:`SPC_MODULEPCBVERSION` and displays as a :obj:`str`.
+
+    Returns
+    -------
+    version : :obj:`str`
+      Version in :obj:`str` format.
+    """
+    bitmap = self.get_module_pcb_version()
+    return f"{bitmap >> 8}.{bitmap & 0xFF}"
+  
+  def get_extension_pci_version(self):
+    """
+    Reads :obj:`SPC_PCIEXTVERSION`.
+    For decoded information, use :obj:`get_extension_pci_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code for extension PCI version
+    """
+    return self._get_capability_int32(spcm.SPC_PCIEXTVERSION)
+  
+  def get_extension_pci_information(self):
+    """
+    Reads :obj:`SPC_PCIEXTVERSION` and displays as a :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Hardware version"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_extension_pci_version()
+    return {"Hardware version":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_extension_pcb_version(self):
+    """
+    Reads :obj:`SPC_EXTPCBVERSION`.
+    For decoded information, use :obj:`get_module_pcb_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code for extension PCB version
+    """
+    return self._get_capability_int32(spcm.SPC_EXTPCBVERSION)
+  
+  def get_extension_pcb_information(self):
+    """
+    Reads :obj:`SPC_EXTPCBVERSION` and displays as a :obj:`str`.
+
+    Returns
+    -------
+    version : :obj:`str`
+      Version in :obj:`str` format.
+    """
+    bitmap = self.get_extension_pcb_version()
+    return f"{bitmap >> 8}.{bitmap & 0xFF}"
+  
+  def get_pxi_slot_number(self):
+    """
+    Reads :obj:`SPC_PXIHWSLOTNO`.
+
+    Returns
+    -------
+    number : :obj:`str`
+      PXI slot number.
+    """
+    return self._get_capability_int32(spcm.SPC_PXIHWSLOTNO)
+  
+  # Firmware information --------------------------------------------------------
+  # =============================================================================
+  
+  def get_firmware_version_control(self):
+    """
+    Reads :obj:`SPCM_FW_CTRL`.
+    For decoded information, use :obj:`get_firmware_version_control_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_CTRL)
+  
+  def get_firmware_version_control_information(self):
+    """
+    Reads :obj:`SPCM_FW_CTRL` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_control()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_control_golden(self):
+    """
+    Reads :obj:`SPCM_FW_CTRL_GOLDEN`.
+    For decoded information, use :obj:`get_firmware_version_control_golden_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_CTRL_GOLDEN)
+  
+  def get_firmware_version_control_golden_information(self):
+    """
+    Reads :obj:`SPCM_FW_CTRL_GOLDEN` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_control_golden()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_control_active(self):
+    """
+    Reads :obj:`SPCM_FW_CTRL_ACTIVE`.
+    For decoded information, use :obj:`get_firmware_version_control_active_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_CTRL_ACTIVE)
+  
+  def get_firmware_version_control_active_information(self):
+    """
+    Reads :obj:`SPCM_FW_CTRL_ACTIVE` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_control_active()
+    return {"Firmware type":(bitmap >> 28), "Firmware version":((bitmap >> 16) & 0xFFF)}
+  
+  def get_firmware_version_clock(self):
+    """
+    Reads :obj:`SPCM_FW_CLOCK`.
+    For decoded information, use :obj:`get_firmware_version_clock_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_CLOCK)
+  
+  def get_firmware_version_clock_information(self):
+    """
+    Reads :obj:`SPCM_FW_CLOCK` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_clock()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_configuration(self):
+    """
+    Reads :obj:`SPCM_FW_CONFIG`.
+    For decoded information, use :obj:`get_firmware_version_configuration_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_CONFIG)
+  
+  def get_firmware_version_configuration_information(self):
+    """
+    Reads :obj:`SPCM_FW_CONFIG` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_configuration()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_module_a(self):
+    """
+    Reads :obj:`SPCM_FW_MODULEA`.
+    For decoded information, use :obj:`get_firmware_version_module_a_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_MODULEA)
+  
+  def get_firmware_version_module_a_information(self):
+    """
+    Reads :obj:`SPCM_FW_MODULEA` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_module_a()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_module_b(self):
+    """
+    Reads :obj:`SPCM_FW_MODULEB`.
+    For decoded information, use :obj:`get_firmware_version_module_b_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_MODULEB)
+  
+  def get_firmware_version_module_b_information(self):
+    """
+    Reads :obj:`SPCM_FW_MODULEB` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_module_b()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_module_star(self):
+    """
+    Reads :obj:`SPCM_FW_MODEXTRA`.
+    For decoded information, use :obj:`get_firmware_version_module_star_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_MODEXTRA)
+  
+  def get_firmware_version_module_star_information(self):
+    """
+    Reads :obj:`SPCM_FW_MODEXTRA` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_module_star()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+  
+  def get_firmware_version_power(self):
+    """
+    Reads :obj:`SPCM_FW_POWER`.
+    For decoded information, use :obj:`get_firmware_version_power_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_FW_POWER)
+  
+  def get_firmware_version_power_information(self):
+    """
+    Reads :obj:`SPCM_FW_POWER` and displays as :obj:`dict`.
+
+    Returns
+    -------
+    version : :obj:`dict`
+      Contains two entries: :obj:`"Firmware type"` and :obj:`"Firmware version"`.
+    """
+    bitmap = self.get_firmware_version_power()
+    return {"Firmware type":(bitmap >> 16), "Firmware version":bitmap & 0xFFFF}
+
+  # Driver information ----------------------------------------------------------
+  # =============================================================================
+  
+  def get_driver(self):
+    """
+    Reads :obj:`SPC_GETDRVTYPE`.
+    For decoded information, use :obj:`get_driver_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_GETDRVTYPE)
+  
+  def get_driver_information(self):
+    """
+    Reads :obj:`SPC_GETDRVTYPE` and displays in :obj:`str` format.
+
+    Returns
+    -------
+    version : :obj:`str`
+      Name of driver.
+    """
+    driver = self.get_driver()
+    if driver == spcm.DRVTYP_LINUX32:
+      return "32 bit Linux"
+    if driver == spcm.DRVTYP_LINUX64:
+      return "64 bit Linux"
+    if driver == spcm.DRVTYP_WDM32:
+      return "32 bit Windows"
+    if driver == spcm.DRVTYP_WDM64:
+      return "64 bit Windows"
+    if driver == spcm.DRVTYP_WOW64:
+      return "64 bit Windows, used by 32 bit application"
+    
+  def get_driver_version(self):
+    """
+    Reads :obj:`SPC_GETDRVVERSION`.
+    For decoded information, use :obj:`get_driver_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_GETDRVVERSION)
+  
+  def get_driver_version_information(self):
+    """
+    Reads :obj:`SPC_GETDRVVERSION` and displays in :obj:`str` format.
+
+    Returns
+    -------
+    version : :obj:`str`
+      Version of driver
+    """
+    driver_version = self.get_driver_version()
+    return f"{driver_version >> 24}.{(driver_version >> 16) & 0xFF} build {(driver_version) & 0xFFFF}"
+  
+  def get_kernel_version(self):
+    """
+    Reads :obj:`SPC_GETKERNELVERSION`.
+    For decoded information, use :obj:`get_driver_information` instead.
+
+    Returns
+    -------
+    version : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_GETKERNELVERSION)
+  
+  def get_kernel_version_information(self):
+    """
+    Reads :obj:`SPC_GETKERNELVERSION` and displays in :obj:`str` format.
+
+    Returns
+    -------
+    version : :obj:`str`
+      Version of driver
+    """
+    kernel_version = self.get_kernel_version()
+    return f"{kernel_version >> 24}.{(kernel_version >> 16) & 0xFF} build {(kernel_version) & 0xFFFF}"
+  
+  # Modifications ---------------------------------------------------------------
+  # =============================================================================
+  
+  def get_modifications(self):
+    """
+    Reads :obj:`SPCM_CUSTOMMOD`.
+    For decoded information, use :obj:`get_modifications_information` instead.
+
+    Returns
+    -------
+    modifications : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_CUSTOMMOD)
+
+  def get_modifications_information(self):
+    """
+    Reads :obj:`SPCM_CUSTOMMOD` and displays in :obj:`dict` format.
+
+    Returns
+    -------
+    modifications : :obj:`dict`
+      Contains three entries for modifications for different parts of the card: :obj:`"Card"`, :obj:`"Front-end"`, and :obj:`"Star-hub"`.
+    """
+    modifications = self.get_modifications()
+    return {
+      "Card":(modifications & 0xFF),
+      "Front-end":((modifications >> 8) & 0xFF),
+      "Star-hub":((modifications >> 16) & 0xFF)
+    }
+
+  # Features and functions ------------------------------------------------------
+  # =============================================================================
+  
+  def get_features(self):
+    """
+    Reads :obj:`SPC_PCIFEATURES`.
+    For decoded information, use :obj:`get_features_information` instead.
+
+    Returns
+    -------
+    features : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_PCIFEATURES)
+  
+  def get_extended_features(self):
+    """
+    Reads :obj:`SPC_PCIEXTFEATURES`.
+    For decoded information, use :obj:`get_features_information` instead.
+
+    Returns
+    -------
+    features : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_PCIEXTFEATURES)
+  
+  def get_readout_features(self):
+    """
+    Reads :obj:`SPC_READAOFEATURES`.
+    For decoded information, use :obj:`get_features_information` instead.
+
+    Returns
+    -------
+    features : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_READAOFEATURES)
+  
+  def get_features_information(self):
+    """
+    Reads :obj:`SPC_PCIFEATURES`, :obj:`SPC_PCIEXTFEATURES`, :obj:`SPC_READAOFEATURES`, and :obj:`SPC_SEQMODE_AVAILFEATURES` and displays each feature of the card in a list.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each available feature written as a :obj:`str`.
+    """
+    bitmap = self.get_features()
+    features = []
+    if bitmap & spcm.SPCM_FEAT_MULTI:
+      features.append("Multiple recording/replay")
+    if bitmap & spcm.SPCM_FEAT_GATE:
+      features.append("Gated sampling/replay")
+    if bitmap & spcm.SPCM_FEAT_DIGITAL:
+      features.append("Digital input/output")
+    if bitmap & spcm.SPCM_FEAT_TIMESTAMP:
+      features.append("Timestamp")
+    if bitmap & spcm.SPCM_FEAT_STARHUB6_EXTM:
+      features.append("6 card star-hub extension/piggyback")
+    if bitmap & spcm.SPCM_FEAT_STARHUB8_EXTM:
+      features.append("8 card star-hub extension/piggyback")
+    if bitmap & spcm.SPCM_FEAT_STARHUB16_EXTM:
+      features.append("16 card star-hub extension/piggyback")
+    if bitmap & spcm.SPCM_FEAT_STARHUB4:
+      features.append("4 card star-hub piggyback")
+    if bitmap & spcm.SPCM_FEAT_STARHUB5:
+      features.append("5 card star-hub piggyback")
+    if bitmap & spcm.SPCM_FEAT_STARHUB8:
+      features.append("8 card star-hub piggyback")
+    if bitmap & spcm.SPCM_FEAT_STARHUB16:
+      features.append("16 card star-hub piggyback")
+    if bitmap & spcm.SPCM_FEAT_ABA:
+      features.append("ABA mode")
+    if bitmap & spcm.SPCM_FEAT_BASEXIO:
+      features.append("Base XIO option")
+    if bitmap & spcm.SPCM_FEAT_AMPLIFIER_10V:
+      features.append("10 V amplifier calibration")
+    if bitmap & spcm.SPCM_FEAT_STARHUBSYSMASTER:
+      features.append("Master star-hub card")
+    if bitmap & spcm.SPCM_FEAT_STARHUBSYSSLAVE:
+      features.append("Slave star-hub card")
+    if bitmap & spcm.SPCM_FEAT_DIFFMODE:
+      features.append("Differential mode")
+    if bitmap & spcm.SPCM_FEAT_SEQUENCE:
+      features.append("Sequence mode")
+    if bitmap & spcm.SPCM_FEAT_AMPMODULE_10V:
+      features.append("10 V amplifier module")
+    if bitmap & spcm.SPCM_FEAT_NETBOX:
+      features.append("NETBOX")
+    if bitmap & spcm.SPCM_FEAT_REMOTESERVER:
+      features.append("Remote server option")
+    if bitmap & spcm.SPCM_FEAT_SCAPP:
+      features.append("SCAPP option")
+    if bitmap & spcm.SPCM_FEAT_DIG16_SMB:
+      features.append("Additional SMB connectors")
+    if bitmap & spcm.SPCM_FEAT_DIG16_FX2:
+      features.append("Additional FX2 connectors")
+    if bitmap & spcm.SPCM_FEAT_DIGITALBWFILTER:
+      features.append("Bandwidth filter")
+    if bitmap & spcm.SPCM_FEAT_CUSTOMMOD_MASK:
+      features.append(f"Custom modification {bitmap >> 28}")
+
+    bitmap = self.get_extended_features()
+    if bitmap & spcm.SPCM_FEAT_EXTFW_SEGSTAT:
+      features.append("Block statistics firmware option")
+    if bitmap & spcm.SPCM_FEAT_EXTFW_SEGAVERAGE:
+      features.append("Block average firmware option")
+    if bitmap & spcm.SPCM_FEAT_EXTFW_BOXCAR:
+      features.append("Boxcar average firmware option")
+
+    SPCM_AO_SET = 0x00000002
+    SPCM_AO_DIFF = 0x00000004
+    SPCM_AO_PROGFILTER = 0x00000008
+    SPCM_AO_PROGOFFSET = 0x00000010
+    SPCM_AO_PROGGAIN = 0x00000020
+    SPCM_AO_PROGSTOPLEVEL = 0x00000040
+    SPCM_AO_DOUBLEOUT = 0x00000080
+    SPCM_AO_ENABLEOUT = 0x00000100
+    bitmap = self.get_readout_features()
+    if bitmap & SPCM_AO_SET:
+      features.append("Single ended output")
+    if bitmap & SPCM_AO_DIFF:
+      features.append("Differential output")
+    if bitmap & SPCM_AO_PROGFILTER:
+      features.append("Output filters")
+    if bitmap & SPCM_AO_PROGOFFSET:
+      features.append("Programmable output offset")
+    if bitmap & SPCM_AO_PROGGAIN:
+      features.append("Programmable output gain")
+    if bitmap & SPCM_AO_PROGSTOPLEVEL:
+      features.append("Programmable output stop level")
+    if bitmap & SPCM_AO_DOUBLEOUT:
+      features.append("Double output")
+    if bitmap & SPCM_AO_ENABLEOUT:
+      features.append("Output enable functions")
+
+    bitmap = self.get_available_sequence_features()
+    if bitmap & spcm.SPCSEQ_ENDLOOPONTRIG:
+      features.append("Loop step until trigger")
+    if bitmap & spcm.SPCSEQ_END:
+      features.append("Final step")
+    
+    return features
+  
+  def get_functions(self):
+    """
+    Reads :obj:`SPC_FNCTYPE`.
+    For decoded information, use :obj:`get_functions_information` instead.
+
+    Returns
+    -------
+    features : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_FNCTYPE)
+  
+  def get_functions_information(self):
+    """
+    Reads :obj:`SPC_FNCTYP` and displays each function of the card in a list.
+
+    Returns
+    -------
+    functions : :obj:`list` of :obj:`str`
+      A list of each available function written as a :obj:`str`.
+    """
+    bitmap = self.get_functions()
+    functions = []
+    if bitmap & spcm.SPCM_TYPE_AI:
+      functions.append("Analogue input")
+    if bitmap & spcm.SPCM_TYPE_AO:
+      functions.append("Analogue output")
+    if bitmap & spcm.SPCM_TYPE_DI:
+      functions.append("Digital input")
+    if bitmap & spcm.SPCM_TYPE_DO:
+      functions.append("Digital output")
+    if bitmap & spcm.SPCM_TYPE_DIO:
+      functions.append("Digital input/output")
+    return functions
+  
+  # Card mode -------------------------------------------------------------------
+  # =============================================================================
+  
+  def set_mode(self, mode):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card.
+    To do this without using bit codes, use :obj:`use_mode_single`, :obj:`use_mode_multi`, :obj:`use_mode_gate`, :obj:`use_mode_single_restart`, :obj:`use_mode_sequence`, :obj:`use_mode_fifo_single`, :obj:`use_mode_fifo_multi`, or :obj:`use_mode_fifo_gate` instead.
+
+    Parameters
+    ----------
+    features : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_CARDMODE, mode)
+
+  def use_mode_single(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_STD_SINGLE`.
+    """
+    self.set_mode(spcm.SPC_REP_STD_SINGLE)
+  
+  def use_mode_multi(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_STD_MULTI`.
+    """
+    self.set_mode(spcm.SPC_REP_STD_MULTI)
+
+  def use_mode_gate(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_STD_GATE`.
+    """
+    self.set_mode(spcm.SPC_REP_STD_GATE)
+
+  def use_mode_single_restart(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_STD_SINGLERESTART`.
+    """
+    self.set_mode(spcm.SPC_REP_STD_SINGLERESTART)
+
+  def use_mode_sequence(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_STD_SEQUENCE`.
+    """
+    self.set_mode(spcm.SPC_REP_STD_SEQUENCE)
+
+  def use_mode_fifo_single(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_FIFO_SINGLE`.
+    """
+    self.set_mode(spcm.SPC_REP_FIFO_SINGLE)
+  
+  def use_mode_fifo_multi(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_FIFO_MULTI`.
+    """
+    self.set_mode(spcm.SPC_REP_FIFO_MULTI)
+
+  def use_mode_fifo_gate(self):
+    """
+    Writes to :obj:`SPC_CARDMODE` to set the mode of the card to :obj:`SPC_REP_FIFO_GATE`.
+    """
+    self.set_mode(spcm.SPC_REP_FIFO_GATE)
+
+  def get_mode(self, verify = False):
+    """
+    Reads :obj:`SPC_CARDMODE` to find the current mode that the card is in.
+    For decoded information, use :obj:`get_mode_information` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_CARDMODE, verify)
+  
+  def get_mode_information(self):
+    """
+    Reads :obj:`SPC_CARDMODE` and displays the current card mode as a :obj:`str`.
+
+    Returns
+    -------
+    mode : :obj:`str`
+      The mode the card is in as a :obj:`str`.
+    """
+    mode = self.get_mode()
+    if mode & spcm.SPC_REP_STD_SINGLE:
+      return "Single"
+    if mode & spcm.SPC_REP_STD_MULTI:
+      return "Multi"
+    if mode & spcm.SPC_REP_STD_GATE:
+      return "Gate"
+    if mode & spcm.SPC_REP_STD_SINGLERESTART:
+      return "Single restart"
+    if mode & spcm.SPC_REP_STD_SEQUENCE:
+      return "Sequence"
+    if mode & spcm.SPC_REP_FIFO_SINGLE:
+      return "FIFO single"
+    if mode & spcm.SPC_REP_FIFO_MULTI:
+      return "FIFO multi"
+    if mode & spcm.SPC_REP_FIFO_GATE:
+      return "FIFO gate"
+    
+  def get_available_modes(self):
+    """
+    Reads :obj:`SPC_AVAILCARDMODES`.
+    For decoded information, use :obj:`get_available_modes_information` instead.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_AVAILCARDMODES)
+  
+  def get_available_modes_information(self):
+    """
+    Reads :obj:`SPC_AVAILCARDMODES` and displays each available mode for the card in a list.
+
+    Returns
+    -------
+    modes : :obj:`list` of :obj:`str`
+      A list of each available mode written as a :obj:`str`.
+    """
+    mode = self.get_available_modes()
+    modes = []
+    if mode & spcm.SPC_REP_STD_SINGLE:
+      modes.append("Single")
+    if mode & spcm.SPC_REP_STD_MULTI:
+      modes.append("Multi")
+    if mode & spcm.SPC_REP_STD_GATE:
+      modes.append("Gate")
+    if mode & spcm.SPC_REP_STD_SINGLERESTART:
+      modes.append("Single restart")
+    if mode & spcm.SPC_REP_STD_SEQUENCE:
+      modes.append("Sequence")
+    if mode & spcm.SPC_REP_FIFO_SINGLE:
+      modes.append("FIFO single")
+    if mode & spcm.SPC_REP_FIFO_MULTI:
+      modes.append("FIFO multi")
+    if mode & spcm.SPC_REP_FIFO_GATE:
+      modes.append("FIFO gate")
+    return modes
+
+  # Sample rate -----------------------------------------------------------------
+  # =============================================================================
+  
+  def set_sample_rate(self, sample_rate, multiplier = ""):
+    """
+    Writes a sample rate to :obj:`SPC_SAMPLERATE`.
+
+    Parameters
+    ----------
+    sample_rate : :obj:`int`
+      The sample rate in S/s.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), :obj:`"k"`, :obj:`"M"` or :obj:`"G"`.
+    """
+    if multiplier == "k":
+      sample_rate *= 1e3
+    elif multiplier == "M":
+      sample_rate *= 1e6
+    elif multiplier == "G":
+      sample_rate *= 1e9
+    elif multiplier != "":
+      raise ValueError("multiplier must be either \"k\", \"M\", \"G\" or \"\".")
+    self._set_int64(spcm.SPC_SAMPLERATE, int(sample_rate))
+
+  def get_sample_rate(self, verify = False):
+    """
+    Reads :obj:`SPC_SAMPLERATE`.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    sample_rate : :obj:`int`
+      The current sample rate in Sa/s.
+    """
+    return self._get_config_int64(spcm.SPC_SAMPLERATE, verify)
+
+  def get_max_sample_rate(self):
+    """
+    Reads :obj:`SPC_PCISAMPLERATE`.
+
+    Returns
+    -------
+    sample_rate : :obj:`int`
+      The card's maximum sample rate in Sa/s.
+    """
+    return self._get_capability_int64(spcm.SPC_PCISAMPLERATE)
+  
+  def get_sample_resolution(self):
+    """
+    Reads :obj:`SPC_MIINST_BYTESPERSAMPLE`.
+
+    Returns
+    -------
+    resolution : :obj:`int`
+      The resolution of each sample in Bytes/sample.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_BYTESPERSAMPLE)
+  
+  def get_sample_resolution_bits(self):
+    """
+    Reads :obj:`SPC_MIINST_BITSPERSAMPLE`.
+
+    Returns
+    -------
+    resolution : :obj:`int`
+      The resolution of each sample in bits/sample.
+    """
+    return self._get_capability_int32(spcm.SPC_MIINST_BITSPERSAMPLE)
+
+  # Clock -----------------------------------------------------------------------
+  # =============================================================================
+  
+  def set_clock_output(self, enable):
+    """
+    Writes to :obj:`SPC_CLOCKOUT`.
+    You may instead want to use :obj:`clock_output_enable` and :obj:`clock_output_disable`.
+
+    Parameters
+    ----------
+    enable : :obj:`int`
+      :obj:`1` if output is enabled, :obj:`0` otherwise.
+    """
+    self._set_int32(spcm.SPC_CLOCKOUT, enable)
+
+  def clock_output_enable(self):
+    """
+    Writes to :obj:`SPC_CLOCKOUT` to enable the clock output.
+    """
+    self.set_clock_output(1)
+  
+  def clock_output_disable(self):
+    """
+    Writes to :obj:`SPC_CLOCKOUT` to disable the clock output.
+    """
+    self.set_clock_output(0)
+
+  def get_clock_output(self, verify = False):
+    """
+    Reads :obj:`SPC_CLOCKOUT`.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    enabled : :obj:`int`
+      :obj:`1` if output is enabled, :obj:`0` otherwise.
+    """
+    return self._get_config_int32(spcm.SPC_CLOCKOUT, verify)
+  
+  def get_clock_output_frequency(self):
+    """
+    Reads :obj:`SPC_CLOCKOUTFREQUENCY`.
+
+    Returns
+    -------
+    frequency : :obj:`int`
+      Output frequency in Hz.
+    """
+    return self._get_int32(spcm.SPC_CLOCKOUTFREQUENCY)
+  
+  def set_external_reference_frequency(self, frequency, multiplier = ""):
+    """
+    Writes to :obj:`SPC_REFERENCECLOCK`.
+
+    Parameters
+    ----------
+    frequency : :obj:`int`
+      Reference frequency in Hz.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), :obj:`"k"`, :obj:`"M"` or :obj:`"G"`.
+    """
+    if multiplier == "k":
+      frequency *= 1e3
+    elif multiplier == "M":
+      frequency *= 1e6
+    elif multiplier == "G":
+      frequency *= 1e9
+    elif multiplier != "":
+      raise ValueError("multiplier must be either \"k\", \"M\", \"G\" or \"\".")
+    self._set_int64(spcm.SPC_REFERENCECLOCK, int(frequency))
+
+  def get_external_reference_frequency(self, verify = False):
+    """
+    Reads :obj:`SPC_REFERENCECLOCK`.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    frequency : :obj:`int`
+      Reference frequency in Hz.
+    """
+    return self._get_config_int32(spcm.SPC_REFERENCECLOCK, verify)
+  
+  def get_available_clock_modes(self):
+    """
+    Reads :obj:`SPC_AVAILCLOCKMODES`.
+    For decoded information, use :obj:`get_available_clock_modes_information` instead.
+
+    Returns
+    -------
+    modes : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_AVAILCLOCKMODES)
+  
+  def get_available_clock_modes_information(self):
+    """
+    Reads :obj:`SPC_AVAILCLOCKMODES` and displays each available mode for the clock in a list.
+
+    Returns
+    -------
+    modes : :obj:`list` of :obj:`str`
+      A list of each available mode written as a :obj:`str`.
+    """
+    bitmap = self.get_available_clock_modes()
+    clock_modes = []
+    if bitmap & spcm.SPC_CM_INTPLL:
+      clock_modes.append("Primary internal quartz")
+    if bitmap & spcm.SPC_CM_QUARTZ2:
+      clock_modes.append("Secondary internal quartz")
+    if bitmap & spcm.SPC_CM_EXTREFCLOCK:
+      clock_modes.append("External reference")
+    if bitmap & spcm.SPC_CM_PXIREFCLOCK:
+      clock_modes.append("PXIe backplane clock reference")
+    return clock_modes
+
+  def set_clock_mode(self, clock_mode):
+    """
+    Writes to :obj:`SPC_CLOCKMODE`.
+    To do this without using bit codes, use :obj:`use_clock_primary_internal`, :obj:`use_clock_secondary_internal`, :obj:`use_clock_external_reference`, or :obj:`use_clock_pxie_reference` instead.
+
+    Parameters
+    ----------
+    mode : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_CLOCKMODE, clock_mode)
+
+  def use_clock_primary_internal(self):
+    """
+    Writes :obj:`SPC_CM_INTPLL` to :obj:`SPC_CLOCKMODE`.
+    """
+    self.set_clock_mode(spcm.SPC_CM_INTPLL)
+
+  def use_clock_secondary_internal(self):
+    """
+    Writes :obj:`SPC_CM_QUARTZ2` to :obj:`SPC_CLOCKMODE`.
+    """
+    self.set_clock_mode(spcm.SPC_CM_QUARTZ2)
+
+  def use_clock_external_reference(self):
+    """
+    Writes :obj:`SPC_CM_EXTREFCLOCK` to :obj:`SPC_CLOCKMODE`.
+    """
+    self.set_clock_mode(spcm.SPC_CM_EXTREFCLOCK)
+
+  def use_clock_pxie_reference(self):
+    """
+    Writes :obj:`SPC_CM_PXIREFCLOCK` to :obj:`SPC_CLOCKMODE`.
+    """
+    self.set_clock_mode(spcm.SPC_CM_PXIREFCLOCK)
+
+  def get_clock_mode(self, verify = False):
+    """
+    Reads :obj:`SPC_CLOCKMODE`.
+    For decoded information, use :obj:`get_clock_mode_information` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_CLOCKMODE, verify)
+
+  def get_clock_mode_information(self):
+    """
+    Reads :obj:`SPC_CLOCKMODE` and displays the current clock mode as a string.
+
+    Returns
+    -------
+    mode : :obj:`str`
+      The current clock mode written as a :obj:`str`.
+    """
+    bitmap = self.get_clock_mode()
+    if bitmap == spcm.SPC_CM_INTPLL:
+      return "Primary internal quartz"
+    if bitmap == spcm.SPC_CM_QUARTZ2:
+      return "Secondary internal quartz"
+    if bitmap == spcm.SPC_CM_EXTREFCLOCK:
+      return "External reference"
+    if bitmap == spcm.SPC_CM_PXIREFCLOCK:
+      return "PXIe backplane clock reference"
+
+  # Trigger masks ---------------------------------------------------------------
+  # =============================================================================
+
+  def set_trigger_or_mask(self, mask):
+    """
+    Writes to :obj:`SPC_TRIG_ORMASK`.
+    To do this without using bit codes, use :obj:`set_sufficient_triggers`.
+
+    Parameters
+    ----------
+    mask : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_ORMASK, mask)
+
+  def set_sufficient_triggers(
+      self,
+      software = False,
+      external_0 = False,
+      external_1 = False,
+      # pxi_0 = False,
+      # pxi_1 = False,
+      # pxi_2 = False,
+      # pxi_3 = False,
+      # pxi_4 = False,
+      # pxi_5 = False,
+      # pxi_6 = False,
+      # pxi_7 = False,
+      # pxi_star = False,
+      # pxid_star_b = False
+    ):
+    """
+    Writes to :obj:`SPC_TRIG_ORMASK`.
+    Set each parameter to :obj:`True` to add it to the OR mask.
+    """
+    mask = 0
+    if software:
+      mask |= spcm.SPC_TMASK_SOFTWARE
+    if external_0:
+      mask |= spcm.SPC_TMASK_EXT0
+    if external_1:
+      mask |= spcm.SPC_TMASK_EXT1
+    # if pxi_0:
+    #   mask |= spcm.SPC_TMASK_PXI0
+    # if pxi_1:
+    #   mask |= spcm.SPC_TMASK_PXI1
+    # if pxi_2:
+    #   mask |= spcm.SPC_TMASK_PXI2
+    # if pxi_3:
+    #   mask |= spcm.SPC_TMASK_PXI3
+    # if pxi_4:
+    #   mask |= spcm.SPC_TMASK_PXI4
+    # if pxi_5:
+    #   mask |= spcm.SPC_TMASK_PXI5
+    # if pxi_6:
+    #   mask |= spcm.SPC_TMASK_PXI6
+    # if pxi_7:
+    #   mask |= spcm.SPC_TMASK_PXI7
+    # if pxi_star:
+    #   mask |= spcm.SPC_TMASK_PXISTAR
+    # if pxid_star_b:
+    #   mask |= spcm.SPC_TMASK_PXIDSTARB
+    self.set_trigger_or_mask(mask)
+
+  def get_trigger_or_mask(self, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_ORMASK`.
+    For decoded information, use :obj:`get_sufficient_triggers` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_ORMASK, verify)
+  
+  def get_sufficient_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_ORMASK` and displays each sufficient trigger in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each sufficient trigger written as a :obj:`str`.
+    """
+    mask = self.get_trigger_or_mask()
+    triggers = []
+    if mask & spcm.SPC_TMASK_SOFTWARE:
+      triggers.append("Software")
+    if mask & spcm.SPC_TMASK_EXT0:
+      triggers.append("External 0")
+    if mask & spcm.SPC_TMASK_EXT1:
+      triggers.append("External 1")
+    if mask & spcm.SPC_TMASK_PXI0:
+      triggers.append("PXI 0")
+    if mask & spcm.SPC_TMASK_PXI1:
+      triggers.append("PXI 1")
+    if mask & spcm.SPC_TMASK_PXI2:
+      triggers.append("PXI 2")
+    if mask & spcm.SPC_TMASK_PXI3:
+      triggers.append("PXI 3")
+    if mask & spcm.SPC_TMASK_PXI4:
+      triggers.append("PXI 4")
+    if mask & spcm.SPC_TMASK_PXI5:
+      triggers.append("PXI 5")
+    if mask & spcm.SPC_TMASK_PXI6:
+      triggers.append("PXI 6")
+    if mask & spcm.SPC_TMASK_PXI7:
+      triggers.append("PXI 7")
+    if mask & spcm.SPC_TMASK_PXISTAR:
+      triggers.append("PXI star")
+    if mask & spcm.SPC_TMASK_PXIDSTARB:
+      triggers.append("PXID star B")
+    return triggers
+  
+  def get_available_triggers_for_or_mask(self):
+    """
+    Reads :obj:`SPC_TRIG_AVAILORMASK`.
+    For decoded information, use :obj:`get_available_sufficient_triggers` instead.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_AVAILORMASK)
+
+  def get_available_sufficient_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_AVAILORMASK` and displays each available sufficient trigger in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each available sufficient trigger written as a :obj:`str`.
+    """
+    mask = self.get_available_triggers_for_or_mask()
+    triggers = []
+    if mask & spcm.SPC_TMASK_SOFTWARE:
+      triggers.append("Software")
+    if mask & spcm.SPC_TMASK_EXT0:
+      triggers.append("External 0")
+    if mask & spcm.SPC_TMASK_EXT1:
+      triggers.append("External 1")
+    if mask & spcm.SPC_TMASK_PXI0:
+      triggers.append("PXI 0")
+    if mask & spcm.SPC_TMASK_PXI1:
+      triggers.append("PXI 1")
+    if mask & spcm.SPC_TMASK_PXI2:
+      triggers.append("PXI 2")
+    if mask & spcm.SPC_TMASK_PXI3:
+      triggers.append("PXI 3")
+    if mask & spcm.SPC_TMASK_PXI4:
+      triggers.append("PXI 4")
+    if mask & spcm.SPC_TMASK_PXI5:
+      triggers.append("PXI 5")
+    if mask & spcm.SPC_TMASK_PXI6:
+      triggers.append("PXI 6")
+    if mask & spcm.SPC_TMASK_PXI7:
+      triggers.append("PXI 7")
+    if mask & spcm.SPC_TMASK_PXISTAR:
+      triggers.append("PXI star")
+    if mask & spcm.SPC_TMASK_PXIDSTARB:
+      triggers.append("PXID star B")
+    return triggers
+  
+  def set_channels_triggered_by_or_mask(self, mask):
+    """
+    Writes to :obj:`SPC_TRIG_CH_ORMASK0`.
+    To do this without using bit codes, use :obj:`set_channels_for_sufficient_triggers`.
+
+    Parameters
+    ----------
+    channels : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_CH_ORMASK0, mask)
+
+  def set_channels_for_sufficient_triggers(
+      self,
+      channel_0 = False,
+      channel_1 = False,
+      channel_2 = False,
+      channel_3 = False,
+      channel_4 = False,
+      channel_5 = False,
+      channel_6 = False,
+      channel_7 = False
+    ):
+    """
+    Writes to :obj:`SPC_TRIG_CH_ORMASK0`.
+    Set each parameter to :obj:`True` to add the channel to those effected by the OR mask.
+    """
+    mask = 0
+    if channel_0:
+      mask |= spcm.SPC_TMASK0_CH0
+    if channel_1:
+      mask |= spcm.SPC_TMASK0_CH1
+    if channel_2:
+      mask |= spcm.SPC_TMASK0_CH2
+    if channel_3:
+      mask |= spcm.SPC_TMASK0_CH3
+    if channel_4:
+      mask |= spcm.SPC_TMASK0_CH4
+    if channel_5:
+      mask |= spcm.SPC_TMASK0_CH5
+    if channel_6:
+      mask |= spcm.SPC_TMASK0_CH6
+    if channel_7:
+      mask |= spcm.SPC_TMASK0_CH7
+    self.set_channels_triggered_by_or_mask(mask)
+
+  def get_channels_triggered_by_or_mask(self, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_CH_ORMASK0`.
+    For decoded information, use :obj:`get_channels_for_sufficient_triggers` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    channels : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_CH_ORMASK0, verify)
+  
+  def get_channels_for_sufficient_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_CH_ORMASK0` and displays each channel in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each channel written as a :obj:`str`.
+    """
+    mask = self.get_channels_triggered_by_or_mask()
+    channels = []
+    if mask & spcm.SPC_TMASK0_CH0:
+      channels.append("Channel 0")
+    if mask & spcm.SPC_TMASK0_CH1:
+      channels.append("Channel 1")
+    if mask & spcm.SPC_TMASK0_CH2:
+      channels.append("Channel 2")
+    if mask & spcm.SPC_TMASK0_CH3:
+      channels.append("Channel 3")
+    if mask & spcm.SPC_TMASK0_CH4:
+      channels.append("Channel 4")
+    if mask & spcm.SPC_TMASK0_CH5:
+      channels.append("Channel 5")
+    if mask & spcm.SPC_TMASK0_CH6:
+      channels.append("Channel 6")
+    if mask & spcm.SPC_TMASK0_CH7:
+      channels.append("Channel 7")
+    return channels
+  
+  def get_available_channels_triggered_by_or_mask(self):
+    """
+    Reads :obj:`SPC_TRIG_CH_AVAILORMASK0`.
+    For decoded information, use :obj:`get_available_channels_for_sufficient_triggers` instead.
+
+    Returns
+    -------
+    channels : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_CH_AVAILORMASK0)
+  
+  def get_available_channels_for_sufficient_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_CH_AVAILORMASK0` and displays each channel in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each channel written as a :obj:`str`.
+    """
+    mask = self.get_available_channels_triggered_by_or_mask()
+    channels = []
+    if mask & spcm.SPC_TMASK0_CH0:
+      channels.append("Channel 0")
+    if mask & spcm.SPC_TMASK0_CH1:
+      channels.append("Channel 1")
+    if mask & spcm.SPC_TMASK0_CH2:
+      channels.append("Channel 2")
+    if mask & spcm.SPC_TMASK0_CH3:
+      channels.append("Channel 3")
+    if mask & spcm.SPC_TMASK0_CH4:
+      channels.append("Channel 4")
+    if mask & spcm.SPC_TMASK0_CH5:
+      channels.append("Channel 5")
+    if mask & spcm.SPC_TMASK0_CH6:
+      channels.append("Channel 6")
+    if mask & spcm.SPC_TMASK0_CH7:
+      channels.append("Channel 7")
+    return channels
+  
+  def set_trigger_and_mask(self, mask):
+    """
+    Writes to :obj:`SPC_TRIG_ANDMASK`.
+    To do this without using bit codes, use :obj:`set_necessary_triggers`.
+
+    Parameters
+    ----------
+    mask : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_ANDMASK, mask)
+
+  def set_necessary_triggers(
+      self,
+      external_0 = False,
+      external_1 = False,
+      # pxi_0 = False,
+      # pxi_1 = False,
+      # pxi_2 = False,
+      # pxi_3 = False,
+      # pxi_4 = False,
+      # pxi_5 = False,
+      # pxi_6 = False,
+      # pxi_7 = False,
+      # pxi_star = False,
+      # pxid_star_b = False
+    ):
+    """
+    Writes to :obj:`SPC_TRIG_ANDMASK`.
+    Set each parameter to :obj:`True` to add it to the AND mask.
+    """
+    mask = 0
+    if external_0:
+      mask |= spcm.SPC_TMASK_EXT0
+    if external_1:
+      mask |= spcm.SPC_TMASK_EXT1
+    # if pxi_0:
+    #   mask |= spcm.SPC_TMASK_PXI0
+    # if pxi_1:
+    #   mask |= spcm.SPC_TMASK_PXI1
+    # if pxi_2:
+    #   mask |= spcm.SPC_TMASK_PXI2
+    # if pxi_3:
+    #   mask |= spcm.SPC_TMASK_PXI3
+    # if pxi_4:
+    #   mask |= spcm.SPC_TMASK_PXI4
+    # if pxi_5:
+    #   mask |= spcm.SPC_TMASK_PXI5
+    # if pxi_6:
+    #   mask |= spcm.SPC_TMASK_PXI6
+    # if pxi_7:
+    #   mask |= spcm.SPC_TMASK_PXI7
+    # if pxi_star:
+    #   mask |= spcm.SPC_TMASK_PXISTAR
+    # if pxid_star_b:
+    #   mask |= spcm.SPC_TMASK_PXIDSTARB
+    self.set_trigger_and_mask(mask)
+
+  def get_trigger_and_mask(self, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_ANDMASK`.
+    For decoded information, use :obj:`get_necessary_triggers` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_ANDMASK, verify)
+  
+  def get_necessary_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_ANDMASK` and displays each necessary trigger in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each necessary trigger written as a :obj:`str`.
+    """
+    mask = self.get_trigger_and_mask()
+    triggers = []
+    if mask & spcm.SPC_TMASK_EXT0:
+      triggers.append("External 0")
+    if mask & spcm.SPC_TMASK_EXT1:
+      triggers.append("External 1")
+    if mask & spcm.SPC_TMASK_PXI0:
+      triggers.append("PXI 0")
+    if mask & spcm.SPC_TMASK_PXI1:
+      triggers.append("PXI 1")
+    if mask & spcm.SPC_TMASK_PXI2:
+      triggers.append("PXI 2")
+    if mask & spcm.SPC_TMASK_PXI3:
+      triggers.append("PXI 3")
+    if mask & spcm.SPC_TMASK_PXI4:
+      triggers.append("PXI 4")
+    if mask & spcm.SPC_TMASK_PXI5:
+      triggers.append("PXI 5")
+    if mask & spcm.SPC_TMASK_PXI6:
+      triggers.append("PXI 6")
+    if mask & spcm.SPC_TMASK_PXI7:
+      triggers.append("PXI 7")
+    if mask & spcm.SPC_TMASK_PXISTAR:
+      triggers.append("PXI star")
+    if mask & spcm.SPC_TMASK_PXIDSTARB:
+      triggers.append("PXID star B")
+    return triggers
+  
+  def get_available_triggers_for_and_mask(self):
+    """
+    Reads :obj:`SPC_TRIG_AVAILANDMASK`.
+    For decoded information, use :obj:`get_available_necessary_triggers` instead.
+
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_AVAILANDMASK)
+  
+  def get_available_necessary_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_AVAILANDMASK` and displays each available necessary trigger in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each available necessary trigger written as a :obj:`str`.
+    """
+    mask = self.get_available_triggers_for_and_mask()
+    triggers = []
+    if mask & spcm.SPC_TMASK_EXT0:
+      triggers.append("External 0")
+    if mask & spcm.SPC_TMASK_EXT1:
+      triggers.append("External 1")
+    if mask & spcm.SPC_TMASK_PXI0:
+      triggers.append("PXI 0")
+    if mask & spcm.SPC_TMASK_PXI1:
+      triggers.append("PXI 1")
+    if mask & spcm.SPC_TMASK_PXI2:
+      triggers.append("PXI 2")
+    if mask & spcm.SPC_TMASK_PXI3:
+      triggers.append("PXI 3")
+    if mask & spcm.SPC_TMASK_PXI4:
+      triggers.append("PXI 4")
+    if mask & spcm.SPC_TMASK_PXI5:
+      triggers.append("PXI 5")
+    if mask & spcm.SPC_TMASK_PXI6:
+      triggers.append("PXI 6")
+    if mask & spcm.SPC_TMASK_PXI7:
+      triggers.append("PXI 7")
+    if mask & spcm.SPC_TMASK_PXISTAR:
+      triggers.append("PXI star")
+    if mask & spcm.SPC_TMASK_PXIDSTARB:
+      triggers.append("PXID star B")
+    return triggers
+  
+  def set_channels_triggered_by_and_mask(self, mask):
+    """
+    Writes to :obj:`SPC_TRIG_CH_ANDMASK0`.
+    To do this without using bit codes, use :obj:`set_channels_for_necessary_triggers`.
+
+    Parameters
+    ----------
+    channels : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_CH_ANDMASK0, mask)
+
+  def set_channels_for_necessary_triggers(
+      self,
+      channel_0 = False,
+      channel_1 = False,
+      channel_2 = False,
+      channel_3 = False,
+      channel_4 = False,
+      channel_5 = False,
+      channel_6 = False,
+      channel_7 = False
+    ):
+    """
+    Writes to :obj:`SPC_TRIG_CH_ANDMASK0`.
+    Set each parameter to :obj:`True` to add the channel to those effected by the AND mask.
+    """
+    mask = 0
+    if channel_0:
+      mask |= spcm.SPC_TMASK0_CH0
+    if channel_1:
+      mask |= spcm.SPC_TMASK0_CH1
+    if channel_2:
+      mask |= spcm.SPC_TMASK0_CH2
+    if channel_3:
+      mask |= spcm.SPC_TMASK0_CH3
+    if channel_4:
+      mask |= spcm.SPC_TMASK0_CH4
+    if channel_5:
+      mask |= spcm.SPC_TMASK0_CH5
+    if channel_6:
+      mask |= spcm.SPC_TMASK0_CH6
+    if channel_7:
+      mask |= spcm.SPC_TMASK0_CH7
+    self.set_channels_triggered_by_and_mask(mask)
+
+  def get_channels_triggered_by_and_mask(self, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_CH_ANDMASK0`.
+    For decoded information, use :obj:`get_channels_for_necessary_triggers` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    channels : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_CH_ANDMASK0, verify)
+  
+  def get_channels_for_necessary_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_CH_ANDMASK0` and displays each channel in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each channel written as a :obj:`str`.
+    """
+    mask = self.get_channels_triggered_by_and_mask()
+    channels = []
+    if mask & spcm.SPC_TMASK0_CH0:
+      channels.append("Channel 0")
+    if mask & spcm.SPC_TMASK0_CH1:
+      channels.append("Channel 1")
+    if mask & spcm.SPC_TMASK0_CH2:
+      channels.append("Channel 2")
+    if mask & spcm.SPC_TMASK0_CH3:
+      channels.append("Channel 3")
+    if mask & spcm.SPC_TMASK0_CH4:
+      channels.append("Channel 4")
+    if mask & spcm.SPC_TMASK0_CH5:
+      channels.append("Channel 5")
+    if mask & spcm.SPC_TMASK0_CH6:
+      channels.append("Channel 6")
+    if mask & spcm.SPC_TMASK0_CH7:
+      channels.append("Channel 7")
+    return channels
+  
+  def get_available_channels_triggered_by_and_mask(self):
+    """
+    Reads :obj:`SPC_TRIG_CH_AVAILANDMASK0`.
+    For decoded information, use :obj:`get_available_channels_for_necessary_triggers` instead.
+
+    Returns
+    -------
+    channels : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_CH_AVAILANDMASK0)
+  
+  def get_available_channels_for_necessary_triggers(self):
+    """
+    Reads :obj:`SPC_TRIG_CH_AVAILANDMASK0` and displays each channel in a :obj:`list` of :obj:`str`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      A list of each channel written as a :obj:`str`.
+    """
+    mask = self.get_available_channels_triggered_by_and_mask()
+    channels = []
+    if mask & spcm.SPC_TMASK0_CH0:
+      channels.append("Channel 0")
+    if mask & spcm.SPC_TMASK0_CH1:
+      channels.append("Channel 1")
+    if mask & spcm.SPC_TMASK0_CH2:
+      channels.append("Channel 2")
+    if mask & spcm.SPC_TMASK0_CH3:
+      channels.append("Channel 3")
+    if mask & spcm.SPC_TMASK0_CH4:
+      channels.append("Channel 4")
+    if mask & spcm.SPC_TMASK0_CH5:
+      channels.append("Channel 5")
+    if mask & spcm.SPC_TMASK0_CH6:
+      channels.append("Channel 6")
+    if mask & spcm.SPC_TMASK0_CH7:
+      channels.append("Channel 7")
+    return channels
+  
+  # Triggers --------------------------------------------------------------------
+  # =============================================================================
+
+  def set_trigger_delay(self, delay):
+    """
+    Writes to :obj:`SPC_TRIG_DELAY`.
+
+    Parameters
+    ----------
+    delay : :obj:`int`
+      Delay in number of samples.
+    """
+    return self._set_int64(spcm.SPC_TRIG_DELAY, delay)
+  
+  def get_trigger_delay(self, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_DELAY`.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    delay : :obj:`int`
+      Delay in number of samples.
+    """
+    return self._get_config_int64(spcm.SPC_TRIG_DELAY, verify)
+  
+  def get_max_trigger_delay(self):
+    """
+    Reads :obj:`SPC_TRIG_AVAILDELAY`.
+
+    Returns
+    -------
+    delay : :obj:`int`
+      Delay in number of samples.
+    """
+    return self._get_capability_int64(spcm.SPC_TRIG_AVAILDELAY)
+
+  def set_trigger_input_termination(self, type):
+    """
+    Writes to :obj:`SPC_TRIG_TERM`.
+    To do this without using bit codes, use :obj:`trigger_impedance_use_high` and :obj:`trigger_impedance_use_50`.
+
+    Parameters
+    ----------
+    type : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_TERM, type)
+
+  def trigger_impedance_use_high(self):
+    """
+    Writes to :obj:`SPC_TRIG_TERM`.
+    Sets impedance to 1 kOhm.
+    """
+    self.set_trigger_input_termination(1)
+
+  def trigger_impedance_use_50(self):
+    """
+    Writes to :obj:`SPC_TRIG_TERM`.
+    Sets impedance to 50 Ohm.
+    """
+    self.set_trigger_input_termination(0)
+
+  def get_trigger_input_termination(self, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_TERM`.
+    For decoded information, use :obj:`get_trigger_impedance` instead.
+
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    type : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_TERM, verify)
+  
+  def get_trigger_impedance(self):
+    """
+    Reads :obj:`SPC_TRIG_TERM`.
+    Returns either :obj:`"High"` or :obj:`"50 Ohm"`.
+
+    Returns
+    -------
+    impedance : :obj:`str`
+      String of input impedance.
+    """
+    bit_code = self.get_trigger_input_termination()
+    if bit_code == 0:
+      return "High"
+    if bit_code == 1:
+      return "50 Ohm"
+    
+  def set_trigger_input_coupling(self, trigger_index, type):
+    """
+    Writes to :obj:`SPC_TRIG_EXT0_ACDC` or :obj:`SPC_TRIG_EXT1_ACDC`.
+    To do this without using bit codes, use :obj:`trigger_coupling_use_dc` and :obj:`trigger_coupling_use_ac`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    type : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_EXT0_ACDC + (spcm.SPC_TRIG_EXT1_ACDC - spcm.SPC_TRIG_EXT0_ACDC)*trigger_index, type)
+
+  def trigger_coupling_use_dc(self, trigger_index = 1):
+    """
+    Writes to :obj:`SPC_TRIG_EXT0_ACDC` or :obj:`SPC_TRIG_EXT1_ACDC`.
+    Sets trigger coupling to dc.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    """
+    self.set_trigger_input_coupling(trigger_index, 0)
+
+  def trigger_coupling_use_ac(self, trigger_index = 1):
+    """
+    Writes to :obj:`SPC_TRIG_EXT0_ACDC` or :obj:`SPC_TRIG_EXT1_ACDC`.
+    Sets trigger coupling to ac.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    """
+    self.set_trigger_input_coupling(trigger_index, 1)
+
+  def get_trigger_input_coupling(self, trigger_index, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_ACDC` or :obj:`SPC_TRIG_EXT1_ACDC`.
+    For decoded information, use :obj:`get_trigger_coupling` instead.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    coupling : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_EXT0_ACDC + (spcm.SPC_TRIG_EXT1_ACDC - spcm.SPC_TRIG_EXT0_ACDC)*trigger_index, verify)
+  
+  def get_trigger_coupling(self, trigger_index):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_ACDC` or :obj:`SPC_TRIG_EXT1_ACDC`.
+    Returns either :obj:`"dc"` or :obj:`"ac"`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    
+    Returns
+    -------
+    impedance : :obj:`str`
+      String of input impedance.
+    """
+    bit_code = self.get_trigger_input_coupling(trigger_index)
+    if bit_code == 0:
+      return "dc"
+    if bit_code == 1:
+      return "ac"
+    
+  def set_trigger_mode(self, trigger_index, mode):
+    """
+    Writes to :obj:`SPC_TRIG_EXT0_MODE`.
+    To do this without using bit codes, use :obj:`trigger_disable`, :obj:`use_trigger_positive_edge`, :obj:`use_trigger_negative_edge`, :obj:`use_trigger_both_edge`, :obj:`use_trigger_enter_window`, :obj:`use_trigger_leave_window`, :obj:`use_trigger_high_gate`, :obj:`use_trigger_low_gate`, :obj:`use_trigger_inside_window_gate`, or :obj:`use_trigger_outside_window_gate`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    mode : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_TRIG_EXT0_MODE + (spcm.SPC_TRIG_EXT1_MODE - spcm.SPC_TRIG_EXT0_MODE)*trigger_index, mode)
+
+  @_atomic
+  def trigger_disable(self, trigger_index, make_sufficient = True):
+    """
+    Writes :obj:`SPC_TM_NONE` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (default), removes this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_NONE)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask & (~((spcm.SPC_TMASK_EXT0 & 3) << trigger_index)))
+
+  @_atomic
+  def use_trigger_positive_edge(self, trigger_index, threshold, multiplier = "", re_arm_threshold = None, make_sufficient = True):
+    """
+    Writes :obj:`SPC_TM_POS` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    re_arm_threshold : :obj:`float`
+      Is :obj:`None` by default.
+      Can be set to a voltage (in units determined by :obj:`multiplier`) such that the trigger level must go under this threshold to be re-armed after a trigger (using flag :obj:`SPC_TM_REARM`).
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    if re_arm_threshold is None:
+      self.set_trigger_mode(trigger_index, spcm.SPC_TM_POS)
+    else:
+      self.set_trigger_mode(trigger_index, spcm.SPC_TM_POS | spcm.SPC_TM_REARM)
+      self.set_lower_trigger_threshold(trigger_index, re_arm_threshold, multiplier)
+    self.set_upper_trigger_threshold(trigger_index, threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_negative_edge(self, trigger_index, threshold, multiplier = "", re_arm_threshold = None, make_sufficient = True):
+    """
+    Writes :obj:`SPC_TM_NEG` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    re_arm_threshold : :obj:`float`
+      Is :obj:`None` by default.
+      Can be set to a voltage (in units determined by :obj:`multiplier`) such that the trigger level must go over this threshold to be re-armed after a trigger (using flag :obj:`SPC_TM_REARM`).
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    if re_arm_threshold is None:
+      self.set_trigger_mode(trigger_index, spcm.SPC_TM_NEG)
+      self.set_upper_trigger_threshold(trigger_index, threshold, multiplier)
+    else:
+      self.set_trigger_mode(trigger_index, spcm.SPC_TM_NEG | spcm.SPC_TM_REARM)
+      self.set_lower_trigger_threshold(trigger_index, threshold, multiplier)
+      self.set_upper_trigger_threshold(trigger_index, re_arm_threshold, multiplier)
+    
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_both_edge(self, trigger_index, threshold, multiplier = "", make_sufficient = True):
+    """
+    Writes :obj:`SPC_TM_BOTH` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_BOTH)
+    self.set_upper_trigger_threshold(trigger_index, threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_enter_window(self, trigger_index, lower_threshold, upper_threshold, multiplier = "", make_sufficient = True):
+    """
+    Writes :obj:`SPC_TM_WINENTER` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    lower_threshold : :obj:`float`
+      Voltage.
+    upper_threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_WINENTER)
+    self.set_upper_trigger_threshold(trigger_index, upper_threshold, multiplier)
+    self.set_lower_trigger_threshold(trigger_index, lower_threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_leave_window(self, trigger_index, lower_threshold, upper_threshold, multiplier = "", make_sufficient = True):
+    """
+    Writes :obj:`SPC_TM_WINLEAVE` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    lower_threshold : :obj:`float`
+      Voltage.
+    upper_threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_WINLEAVE)
+    self.set_upper_trigger_threshold(trigger_index, upper_threshold, multiplier)
+    self.set_lower_trigger_threshold(trigger_index, lower_threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_high_gate(self, trigger_index, threshold, multiplier = "", make_sufficient = False):
+    """
+    Writes :obj:`SPC_TM_HIGH` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (:obj:`False` is default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_HIGH)
+    self.set_upper_trigger_threshold(trigger_index, threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_low_gate(self, trigger_index, threshold, multiplier = "", make_sufficient = False):
+    """
+    Writes :obj:`SPC_TM_LOW` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (:obj:`False` is default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_LOW)
+    self.set_upper_trigger_threshold(trigger_index, threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_inside_window_gate(self, trigger_index, lower_threshold ,upper_threshold, multiplier = "", make_sufficient = False):
+    """
+    Writes :obj:`SPC_TM_INWIN` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    lower_threshold : :obj:`float`
+      Voltage.
+    upper_threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (:obj:`False` is default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_INWIN)
+    self.set_upper_trigger_threshold(trigger_index, upper_threshold, multiplier)
+    self.set_lower_trigger_threshold(trigger_index, lower_threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  @_atomic
+  def use_trigger_outside_window_gate(self, trigger_index, lower_threshold ,upper_threshold, multiplier = "", make_sufficient = False):
+    """
+    Writes :obj:`SPC_TM_OUTSIDEWIN` to :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    lower_threshold : :obj:`float`
+      Voltage.
+    upper_threshold : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    make_sufficient : :obj:`bool`
+      If :obj:`True` (:obj:`False` is default), adds this trigger to the OR mask (see :obj:`set_sufficient_triggers`).
+    """
+    self.set_trigger_mode(trigger_index, spcm.SPC_TM_OUTSIDEWIN)
+    self.set_upper_trigger_threshold(trigger_index, upper_threshold, multiplier)
+    self.set_lower_trigger_threshold(trigger_index, lower_threshold, multiplier)
+    if make_sufficient:
+      or_mask = self.get_trigger_or_mask()
+      self.set_trigger_or_mask(or_mask | ((spcm.SPC_TMASK_EXT0 & 3) << trigger_index))
+
+  def get_trigger_mode(self, trigger_index, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_MODE`.
+    For decoded information, use :obj:`get_trigger_mode_information` instead.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    mode : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_EXT0_MODE + (spcm.SPC_TRIG_EXT1_MODE - spcm.SPC_TRIG_EXT0_MODE)*trigger_index, verify)
+  
+  def get_trigger_mode_information(self, trigger_index):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_MODE`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    
+    Returns
+    -------
+    mode : :obj:`str`
+      Current mode in :obj:`str` form.
+    """
+    bit_code = self.get_trigger_mode(trigger_index)
+    re_arm = bit_code & spcm.SPC_TM_REARM != 0
+    bit_code &= spcm.SPC_TM_MODEMASK
+    if bit_code == spcm.SPC_TM_NONE:
+      return "None"
+    elif bit_code == spcm.SPC_TM_POS:
+      if re_arm:
+        return "Positive edge (re-arming)"
+      return "Positive edge"
+    elif bit_code == spcm.SPC_TM_NEG:
+      if re_arm:
+        return "Negative edge (re-arming)"
+      return "Negative edge"
+    elif bit_code == spcm.SPC_TM_BOTH:
+      return "Both edge"
+    elif bit_code == spcm.SPC_TM_HIGH:
+      return "High gate"
+    elif bit_code == spcm.SPC_TM_LOW:
+      return "Low gate"
+    elif bit_code == spcm.SPC_TM_WINENTER:
+      return "Enter window"
+    elif bit_code == spcm.SPC_TM_WINLEAVE:
+      return "Leave window"
+    elif bit_code == spcm.SPC_TM_INWIN:
+      return "Inside window gate"
+    elif bit_code == spcm.SPC_TM_OUTSIDEWIN:
+      return "Outside window gate"
+    
+  def get_available_trigger_modes(self, trigger_index):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_AVAILMODES`.
+    For decoded information, use :obj:`get_available_trigger_modes_information` instead.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    
+    Returns
+    -------
+    modes : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT0_AVAILMODES + (spcm.SPC_TRIG_EXT1_MODE - spcm.SPC_TRIG_EXT0_MODE)*trigger_index)
+  
+  def get_available_trigger_modes_information(self, trigger_index):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_AVAILMODES`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    
+    Returns
+    -------
+    modes : :obj:`list` of :obj:`str`
+      Available modes in :obj:`str` form.
+    """
+    bit_code = self.get_available_trigger_modes(trigger_index)
+    modes = []
+    if bit_code & spcm.SPC_TM_REARM:
+      modes.append("Re-arming")
+    if bit_code & spcm.SPC_TM_POS:
+      modes.append("Positive edge")
+    if bit_code & spcm.SPC_TM_NEG:
+      modes.append("Negative edge")
+    if bit_code & spcm.SPC_TM_BOTH:
+      modes.append("Both edge")
+    if bit_code & spcm.SPC_TM_HIGH:
+      modes.append("High gate")
+    if bit_code & spcm.SPC_TM_LOW:
+      modes.append("Low gate")
+    if bit_code & spcm.SPC_TM_WINENTER:
+      modes.append("Enter window")
+    if bit_code & spcm.SPC_TM_WINLEAVE:
+      modes.append("Leave window")
+    if bit_code & spcm.SPC_TM_INWIN:
+      modes.append("Inside window gate")
+    if bit_code & spcm.SPC_TM_OUTSIDEWIN:
+      modes.append("Outside window gate")
+    return modes
+  
+  def set_upper_trigger_threshold(self, trigger_index, threshold, multiplier = ""):
+    """
+    Writes to :obj:`SPC_TRIG_EXT0_LEVEL0`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    """
+    if multiplier == "":
+      threshold = int(threshold*1e3)
+    elif multiplier != "m":
+      raise ValueError("multiplier must be either \"m\" or \"\".")
+    self._set_int32(spcm.SPC_TRIG_EXT0_LEVEL0 + (spcm.SPC_TRIG_EXT1_LEVEL0 - spcm.SPC_TRIG_EXT0_LEVEL0)*trigger_index, threshold)
+  
+  def get_upper_trigger_threshold(self, trigger_index, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_LEVEL0`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Lower voltage in V.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_EXT0_LEVEL0 + (spcm.SPC_TRIG_EXT1_LEVEL0 - spcm.SPC_TRIG_EXT0_LEVEL0)*trigger_index, verify)*1e-3
+
+  def get_upper_trigger_threshold_min(self):
+    """
+    Reads :obj:`SPC_TRIG_EXT_AVAIL0_MIN`.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Lower voltage in V.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT_AVAIL0_MIN)*1e-3
+  
+  def get_upper_trigger_threshold_max(self):
+    """
+    Reads :obj:`SPC_TRIG_EXT_AVAIL0_MAX`.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Lower voltage in V.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT_AVAIL0_MAX)*1e-3
+  
+  def get_upper_trigger_threshold_step(self):
+    """
+    Reads :obj:`SPC_TRIG_EXT_AVAIL0_STEP`.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Lower voltage in V.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT_AVAIL0_STEP)*1e-3
+  
+  def set_lower_trigger_threshold(self, trigger_index, threshold, multiplier = ""):
+    """
+    Writes to :obj:`SPC_TRIG_EXT0_LEVEL1`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    threshold : :obj:`float`
+      Voltage
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    """
+    if multiplier == "":
+      threshold = int(threshold*1e3)
+    elif multiplier != "m":
+      raise ValueError("multiplier must be either \"m\" or \"\".")
+    self._set_int32(spcm.SPC_TRIG_EXT0_LEVEL1 + (spcm.SPC_TRIG_EXT1_LEVEL0 - spcm.SPC_TRIG_EXT0_LEVEL0)*trigger_index, threshold)
+  
+  def get_lower_trigger_threshold(self, trigger_index, verify = False):
+    """
+    Reads :obj:`SPC_TRIG_EXT0_LEVEL1`.
+
+    Parameters
+    ----------
+    trigger_index : :obj:`int`
+      Which trigger.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Upper voltage in V.
+    """
+    return self._get_config_int32(spcm.SPC_TRIG_EXT0_LEVEL1 + (spcm.SPC_TRIG_EXT1_LEVEL1 - spcm.SPC_TRIG_EXT0_LEVEL1)*trigger_index, verify)*1e-3
+  
+  def get_lower_trigger_threshold_min(self):
+    """
+    Reads :obj:`SPC_TRIG_EXT_AVAIL1_MIN`.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Upper voltage in V.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT_AVAIL0_MIN)*1e-3
+  
+  def get_lower_trigger_threshold_max(self):
+    """
+    Reads :obj:`SPC_TRIG_EXT_AVAIL1_MAX`.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Upper voltage in V.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT_AVAIL0_MAX)*1e-3
+  
+  def get_lower_trigger_threshold_step(self):
+    """
+    Reads :obj:`SPC_TRIG_EXT_AVAIL1_STEP`.
+    
+    Returns
+    -------
+    threshold : :obj:`float`
+      Upper voltage in V.
+    """
+    return self._get_capability_int32(spcm.SPC_TRIG_EXT_AVAIL0_STEP)*1e-3
+
+  
+  # Channels --------------------------------------------------------------------
+  # =============================================================================
+  
+  def set_channel_enable(self, channels):
+    """
+    Writes to :obj:`SPC_CHENABLE`.
+    To do this without using bit codes, use :obj:`set_channels_enable`.
+
+    Parameters
+    ----------
+    channels : :obj:`int`
+      Bit code.
+    """
+    self._set_int64(spcm.SPC_CHENABLE, channels)
+
+  def set_channels_enable(
+      self,
+      channel_0 = False,
+      channel_1 = False,
+      channel_2 = False,
+      channel_3 = False
+    ):
+    """
+    Writes to :obj:`SPC_CHENABLE`.
+    Set any of the parameters to :obj:`True` to enable that channel.
+    """
+    bit_code = 0
+    if channel_0:
+      bit_code |= spcm.CHANNEL0
+    if channel_1:
+      bit_code |= spcm.CHANNEL1
+    if channel_2:
+      bit_code |= spcm.CHANNEL2
+    if channel_3:
+      bit_code |= spcm.CHANNEL3
+    self.set_channel_enable(bit_code)
+
+  def get_channel_enable(self, verify = False):
+    """
+    Reads :obj:`SPC_CHENABLE`.
+    For decoded information, use :obj:`get_channels_enable`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    channels : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int64(spcm.SPC_CHENABLE, verify)
+  
+  def get_channels_enable(self):
+    """
+    Reads :obj:`SPC_CHENABLE`.
+    
+    Returns
+    -------
+    channels : :obj:`list` of :obj:`str`
+      List of enabled channels in string form.
+    """
+    bit_code = self.get_channel_enable()
+    channels = []
+    if bit_code & spcm.CHANNEL0:
+      channels.append("Channel 0")
+    if bit_code & spcm.CHANNEL1:
+      channels.append("Channel 1")
+    if bit_code & spcm.CHANNEL2:
+      channels.append("Channel 2")
+    if bit_code & spcm.CHANNEL3:
+      channels.append("Channel 3")
+    return channels
+  
+  def get_number_of_active_channels(self):
+    """
+    Reads :obj:`SPC_CHCOUNT`.
+    
+    Returns
+    -------
+    channels : :obj:`int`
+      The number of enabled channels.
+    """
+    return self._get_int32(spcm.SPC_CHCOUNT)
+  
+  def set_amplitude(self, channel_index, amplitude, multiplier = ""):
+    """
+    Writes to :obj:`SPC_AMP0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    amplitude : :obj:`float`
+      Voltage.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    """
+    if multiplier == "":
+      amplitude = int(amplitude*1e3)
+    elif multiplier != "m":
+      raise ValueError("multiplier must be either \"m\" or \"\".")
+    self._set_int32(spcm.SPC_AMP0 + channel_index*(spcm.SPC_AMP1 - spcm.SPC_AMP0), amplitude)
+
+  def get_amplitude(self, channel_index, verify = False):
+    """
+    Reads :obj:`SPC_AMP0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    amplitude : :obj:`float`
+      Voltage in V.
+
+    """
+    return (self._get_config_int32(spcm.SPC_AMP0 + channel_index*(spcm.SPC_AMP1 - spcm.SPC_AMP0), verify))*1e-3
+  
+  def set_output_enable(self, channel_index, enable):
+    """
+    Writes to :obj:`SPC_ENABLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    self._set_int32(spcm.SPC_ENABLEOUT0 + channel_index*(spcm.SPC_ENABLEOUT1 - spcm.SPC_ENABLEOUT0), enable)
+
+  def output_enable(self, channel_index):
+    """
+    Writes 1 to :obj:`SPC_ENABLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    """
+    self.set_output_enable(channel_index, 1)
+
+  def output_disable(self, channel_index):
+    """
+    Writes 0 to :obj:`SPC_ENABLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    """
+    self.set_output_enable(channel_index, 0)
+
+  def get_output_enable(self, channel_index, verify = False):
+    """
+    Reads from :obj:`SPC_ENABLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    return self._get_config_int32(spcm.SPC_ENABLEOUT0 + channel_index*(spcm.SPC_ENABLEOUT1 - spcm.SPC_ENABLEOUT0), verify)
+  
+  def set_filter(self, channel_index, enable):
+    """
+    Writes to :obj:`SPC_FILTER0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    self._set_int32(spcm.SPC_FILTER0 + channel_index*(spcm.SPC_FILTER1 - spcm.SPC_FILTER0), enable)
+
+  def channel_filter_enable(self, channel_index):
+    """
+    Writes 1 to :obj:`SPC_FILTER0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    """
+    self.set_filter(channel_index, 1)
+
+  def channel_filter_disable(self, channel_index):
+    """
+    Writes 0 to :obj:`SPC_FILTER0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    """
+    self.set_filter(channel_index, 0)
+
+  def get_filter(self, channel_index, verify = False):
+    """
+    Reads :obj:`SPC_FILTER0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    return self._get_config_int32(spcm.SPC_FILTER0 + channel_index*(spcm.SPC_FILTER1 - spcm.SPC_FILTER0), verify)
+  
+  def set_differential(self, channel_index, enable):
+    """
+    Writes to :obj:`SPC_DIFF0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    self._set_int32(spcm.SPC_DIFF0 + channel_index*(spcm.SPC_DIFF1 - spcm.SPC_DIFF0), enable)
+
+  def differential_enable(self, channel_index):
+    """
+    Writes 1 to :obj:`SPC_DIFF0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    """
+    self.set_differential(channel_index, 1)
+
+  def differential_disable(self, channel_index):
+    """
+    Writes 0 to :obj:`SPC_DIFF0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    """
+    self.set_differential(channel_index, 0)
+
+  def get_differential(self, channel_index, verify = False):
+    """
+    Reads :obj:`SPC_DIFF0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    return self._get_config_int32(spcm.SPC_DIFF0 + channel_index*(spcm.SPC_DIFF1 - spcm.SPC_DIFF0), verify)
+  
+  def set_double(self, channel_index, enable):
+    """
+    Writes to :obj:`SPC_DOUBLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    self._set_int32(spcm.SPC_DOUBLEOUT0 + channel_index*(spcm.SPC_DOUBLEOUT1 - spcm.SPC_DOUBLEOUT0), enable)
+
+  def double_enable(self, channel_index):
+    """
+    Writes 1 to :obj:`SPC_DOUBLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    """
+    self.set_double(channel_index, 1)
+
+  def double_disable(self, channel_index):
+    """
+    Writes 0 to :obj:`SPC_DOUBLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    """
+    self.set_double(channel_index, 0)
+
+  def get_double(self, channel_index, verify = False):
+    """
+    Reads :obj:`SPC_DOUBLEOUT0`.
+
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel (0 for channels 0 and 1, 2 for channels 2 and 3).
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    enable : :obj:`int`
+      :obj:`1` for enabled, :obj:`0` for disabled.
+    """
+    return self._get_config_int32(spcm.SPC_DOUBLEOUT0 + channel_index*(spcm.SPC_DOUBLEOUT1 - spcm.SPC_DOUBLEOUT0), verify)
+  
+  def set_stop_level(self, channel_index, stop_level_code):
+    """
+    Writes to :obj:`SPC_CH0_STOPLEVEL`.
+    To do this without using bit codes, use :obj:`set_channel_stop_level`.
+    
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    stop_level_code : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_CH0_STOPLEVEL + channel_index*(spcm.SPC_CH1_STOPLEVEL - spcm.SPC_CH0_STOPLEVEL), stop_level_code)
+
+  def get_stop_level(self, channel_index, verify = False):
+    """
+    Reads :obj:`SPC_CH0_STOPLEVEL`.
+    For decoded information, use :obj:`get_channel_stop_level`.
+    
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    stop_level_code : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_CH0_STOPLEVEL + channel_index*(spcm.SPC_CH1_STOPLEVEL - spcm.SPC_CH0_STOPLEVEL), verify)
+  
+  def set_stop_level_custom(self, channel_index, value):
+    """
+    Writes to :obj:`SPC_CH0_CUSTOM_STOP`.
+    To do this without using bit codes, use :obj:`set_channel_stop_level`.
+    
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    value : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPC_CH0_CUSTOM_STOP + channel_index*(spcm.SPC_CH1_CUSTOM_STOP - spcm.SPC_CH0_CUSTOM_STOP), value)
+
+  def get_stop_level_custom(self, channel_index, verify = False):
+    """
+    Reads :obj:`SPC_CH0_CUSTOM_STOP`.
+    For decoded information, use :obj:`get_channel_stop_level`.
+    
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    stop_level : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPC_CH0_CUSTOM_STOP + channel_index*(spcm.SPC_CH1_CUSTOM_STOP - spcm.SPC_CH0_CUSTOM_STOP), verify)
+
+  @_atomic
+  def set_channel_stop_level(
+      self,
+      channel_index,
+      zero = False,
+      low = False,
+      high = False,
+      hold_last = False,
+      custom_value = None
+    ):
+    """
+    Writes to :obj:`SPC_CH0_STOPLEVEL` and :obj:`SPC_CH0_CUSTOM_STOP`.
+    To set a custom value, set the parameter :obj:`custom_value` to a :obj:`float` between :obj:`-1.0` and :obj:`1.0`.
+    To set it to any other stop level mode, set that parameter to :obj:`True`.
+    """
+    if zero:
+      self.set_stop_level(channel_index, spcm.SPCM_STOPLVL_ZERO)
+    elif low:
+      self.set_stop_level(channel_index, spcm.SPCM_STOPLVL_LOW)
+    elif high:
+      self.set_stop_level(channel_index, spcm.SPCM_STOPLVL_HIGH)
+    elif hold_last:
+      self.set_stop_level(channel_index, spcm.SPCM_STOPLVL_HOLDLAST)
+    elif custom_value is not None:
+      self.set_stop_level(channel_index, spcm.SPCM_STOPLVL_CUSTOM)
+      limit = int(2**(self.get_sample_resolution_bits() - 1) - 1)
+      self.set_stop_level_custom(channel_index, int(limit*min(max(custom_value, -1), 1)))
+
+  def get_channel_stop_level(self, channel_index):
+    """
+    Reads :obj:`SPC_CH0_STOPLEVEL` and :obj:`SPC_CH0_CUSTOM_STOP`.
+    
+    Parameters
+    ----------
+    channel_index : :obj:`int`
+      Which channel.
+    
+    Returns
+    -------
+    stop_level : :obj:`str` or :obj:`float`
+      If stop level is set to a particular mode, returns that mode as a :obj:`str`.
+      If this mode is :obj:`SPCM_STOPLVL_CUSTOM` then it returns the custom level as a :obj:`float` between :obj:`-1.0` and :obj:`1.0`.
+    """
+    stop_level = self.get_stop_level(channel_index)
+    if stop_level == spcm.SPCM_STOPLVL_ZERO:
+      return "Zero"
+    if stop_level == spcm.SPCM_STOPLVL_LOW:
+      return "Low"
+    if stop_level == spcm.SPCM_STOPLVL_HIGH:
+      return "High"
+    if stop_level == spcm.SPCM_STOPLVL_HOLDLAST:
+      return "Hold last"
+    if stop_level == spcm.SPCM_STOPLVL_CUSTOM:
+      limit = int(2**(self.get_sample_resolution_bits() - 1) - 1)
+      return self.get_stop_level_custom(channel_index)/limit
+  
+  # Commands --------------------------------------------------------------------
+  # =============================================================================
+  
+  def execute_command(self, command):
+    """
+    Writes to :obj:`SPC_M2CMD`.
+    To do this without using bit codes, use :obj:`execute_commands`.
+    
+    Parameters
+    ----------
+    command : :obj:`int`
+      Bit code.
+    """
+    # Only the thread that owns a transaction flushes it, as commands from other threads do not wait for the lock it holds
+    transaction = self._transaction
+    if transaction is not None and transaction.thread == threading.get_ident():
+      transaction.flush()
+    if command & spcm.M2CMD_CARD_RESET:
+      # The card goes back to its default settings, so nothing shadowed is current any more
+      self._shadow.clear()
+      self._segment_sizes.clear()
+    self._set_int32(spcm.SPC_M2CMD, command)
+
+  def execute_commands(
+      self,
+      reset = False,
+      write_setup = False,
+      start = False,
+      enable_trigger = False,
+      force_trigger = False,
+      disable_trigger = False,
+      stop = False,
+      dma_start = False,
+      dma_wait = False,
+      dma_stop = False,
+      wait_for_prefill = False,
+      wait_for_trigger = False,
+      wait_until_ready = False
+    ):
+    """
+    Writes to :obj:`SPC_M2CMD`.
+    To call a command, set the corresponding parameter to :obj:`True`.
+    """
+    command = 0
+    if reset:
+      command |= spcm.M2CMD_CARD_RESET
+    if write_setup:
+      command |= spcm.M2CMD_CARD_WRITESETUP
+    if start:
+      command |= spcm.M2CMD_CARD_START
+    if enable_trigger:
+      command |= spcm.M2CMD_CARD_ENABLETRIGGER
+    if force_trigger:
+      command |= spcm.M2CMD_CARD_FORCETRIGGER
+    if disable_trigger:
+      command |= spcm.M2CMD_CARD_DISABLETRIGGER
+    if stop:
+      command |= spcm.M2CMD_CARD_STOP
+    if dma_start:
+      command |= spcm.M2CMD_DATA_STARTDMA
+    if dma_wait:
+      command |= spcm.M2CMD_DATA_WAITDMA
+    if dma_stop:
+      command |= spcm.M2CMD_DATA_STOPDMA
+    if wait_for_prefill:
+      command |= spcm.M2CMD_CARD_WAITPREFULL
+    if wait_for_trigger:
+      command |= spcm.M2CMD_CARD_WAITTRIGGER
+    if wait_until_ready:
+      command |= spcm.M2CMD_CARD_WAITREADY
+    self.execute_command(command)
+
+  def start(self):
+    """
+    Writes :obj:`M2CMD_CARD_START` to :obj:`SPC_M2CMD`.
+    """
+    self.execute_commands(start = True)
+
+  def arm(self):
+    """
+    Writes :obj:`M2CMD_CARD_START` and :obj:`M2CMD_CARD_ENABLETRIGGER` to :obj:`SPC_M2CMD`.
+    """
+    self.execute_commands(start = True, enable_trigger = True)
+
+  def force_trigger(self):
+    """
+    Writes :obj:`M2CMD_CARD_FORCETRIGGER` to :obj:`SPC_M2CMD`.
+    """
+    self.execute_commands(force_trigger = True)
+
+  def stop(self):
+    """
+    Writes :obj:`M2CMD_CARD_STOP` to :obj:`SPC_M2CMD`.
+    """
+    self.execute_commands(stop = True)
+
+  def reset(self):
+    """
+    Writes :obj:`M2CMD_CARD_RESET` to :obj:`SPC_M2CMD`.
+    """
+    self.execute_commands(reset = True)
+
+  def _wait(self, command, timeout):
+    if timeout is not None:
+      return self._wait_with_timeout(command, timeout)
+    start_time = time.perf_counter()
+    self.execute_command(command)
+    return time.perf_counter() - start_time
+
+  def _wait_with_timeout(self, command, timeout):
+    # The driver times out its waits using SPC_TIMEOUT, so it is changed for this wait only
+    # The lock is only held while SPC_TIMEOUT is changed, not during the wait, so other threads can use the card in the meantime
+    self._set_wait_timeout(max(1, round(timeout*1e3)) if timeout > 0 else 0)
+    try:
+      return self._wait(command, None)
+    finally:
+      self._restore_wait_timeout()
+
+  @_atomic
+  def _set_wait_timeout(self, wait_timeout):
+    # When waits overlap, the first keeps the timeout that was set before any of them, to be put back by the last to finish
+    if self._number_of_timed_waits == 0:
+      self._timeout_before_waits = self._get_config_int32(spcm.SPC_TIMEOUT)
+    self._number_of_timed_waits += 1
+    self._set_int32(spcm.SPC_TIMEOUT, wait_timeout)
+
+  @_atomic
+  def _restore_wait_timeout(self):
+    self._number_of_timed_waits -= 1
+    if self._number_of_timed_waits == 0:
+      self._set_int32(spcm.SPC_TIMEOUT, self._timeout_before_waits)
+
+  def wait_ready(self, timeout = None):
+    """
+    Writes :obj:`M2CMD_CARD_WAITREADY` to :obj:`SPC_M2CMD`.
+    Blocks until the card has finished replaying, without polling.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, in s.
+    """
+    return self._wait(spcm.M2CMD_CARD_WAITREADY, timeout)
+
+  def wait_trigger(self, timeout = None):
+    """
+    Writes :obj:`M2CMD_CARD_WAITTRIGGER` to :obj:`SPC_M2CMD`.
+    Blocks until the card has been triggered, without polling.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, in s.
+    """
+    return self._wait(spcm.M2CMD_CARD_WAITTRIGGER, timeout)
+
+  def wait_prefill(self, timeout = None):
+    """
+    Writes :obj:`M2CMD_CARD_WAITPREFULL` to :obj:`SPC_M2CMD`.
+    Blocks until the on-board memory has been filled with enough data to start replaying, without polling.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, in s.
+    """
+    return self._wait(spcm.M2CMD_CARD_WAITPREFULL, timeout)
+
+  def wait_dma(self, timeout = None):
+    """
+    Writes :obj:`M2CMD_DATA_WAITDMA` to :obj:`SPC_M2CMD`.
+    Blocks until the DMA transfer has finished, without polling.
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`set_timeout`.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the wait took, in s.
+    """
+    return self._wait(spcm.M2CMD_DATA_WAITDMA, timeout)
+
+  def set_timeout(self, time_to_live, multiplier = ""):
+    """
+    Writes to :obj:`SPC_TIMEOUT`.
+    
+    Parameters
+    ----------
+    time_to_live : :obj:`int`
+      Timeout duration in seconds.
+    multiplier : :obj:`str`
+      Can be metric prefixes :obj:`""` (default), or :obj:`"m"`.
+    """
+    if multiplier == "":
+      time_to_live = int(time_to_live*1e3)
+    elif multiplier != "m":
+      raise ValueError("multiplier must be either \"m\" or \"\".")
+    self._set_int32(spcm.SPC_TIMEOUT, time_to_live)
+
+  def get_timeout(self, verify = False):
+    """
+    Reads :obj:`SPC_TIMEOUT`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    time_to_live : :obj:`int`
+      Timeout duration in seconds.
+    """
+    return self._get_config_int32(spcm.SPC_TIMEOUT, verify)*1e-3
+
+  # DMA and memory --------------------------------------------------------------
+  # =============================================================================
+  
+  def _get_transfer_context(self):
+    # Rebuilt whenever the mode, enabled channels or IO modes in the shadow register file differ from the ones it was built from, however they were written
+    context = self._transfer_context
+    if context is not None and self._transaction is None and context.is_current(self._shadow):
+      return context
+    context = _TransferContext(self)
+    if self._transaction is None:
+      # Values waiting in a transaction are not in the shadow yet, so a context built from them is not kept
+      self._transfer_context = context
+    return context
+
+  def _set_up_aux_data(self, context, aux_data_channels):
+    # Sets the IO ports that output markers, writing only the modes that change, and disables digital outs that are no longer used
+    # Returns the markers in each channel, as (index in aux_data, bit) pairs
+    markers = [[] for channel in range(context.number_of_channels)]
+    digital_output_used = [False, False, False]
+    if aux_data_channels is not None:
+      for channel in range(context.number_of_channels):
+        for aux_data_channel_index, aux_data_channel in enumerate(aux_data_channels):
+          if aux_data_channel["Channel"] == channel:
+            bit = aux_data_channel["Bit"]
+            markers[channel].append((aux_data_channel_index, bit))
+            port = aux_data_channel["Port"]
+            io_mode = _get_digital_out_mode(channel, bit)
+            if context.io_modes[port] != io_mode:
+              self.set_io_mode(port, io_mode)
+            digital_output_used[port] = True
+    for port in range(3):
+      if not digital_output_used[port] and context.io_modes[port] & 0x0000FFFF == spcm.SPCM_XMODE_DIGOUT:
+        self.io_port_disable(port)
+    return markers
+
+  def _get_patch_markers(self, context, aux_data, aux_data_channels):
+    # Finds the markers that the IO ports already output, without changing the ports, as they are shared by every segment
+    # Returns the markers in each channel, as (index in the returned binary waveforms, bit) pairs, and the binary waveforms, which are low where aux_data does not give them
+    markers = [[] for channel in range(context.number_of_channels)]
+    marker_indices = {}
+    marker_data = []
+    for port in range(3):
+      for channel in range(context.number_of_channels):
+        for bit in (15, 14, 13):
+          if context.io_modes[port] == _get_digital_out_mode(channel, bit) and (channel, bit) not in marker_indices:
+            marker_indices[channel, bit] = len(marker_data)
+            markers[channel].append((len(marker_data), bit))
+            marker_data.append(False)
+    if aux_data is not None:
+      for aux_data_channel_index, aux_data_channel in enumerate(aux_data_channels):
+        channel = aux_data_channel["Channel"]
+        bit = aux_data_channel["Bit"]
+        if context.io_modes[aux_data_channel["Port"]] != _get_digital_out_mode(channel, bit):
+          raise ValueError(f"Port {aux_data_channel['Port']} is not outputting bit {bit} of channel {channel}, so the segment must be uploaded with these aux_data_channels before it can be patched with them.")
+        marker_data[marker_indices[channel, bit]] = aux_data[aux_data_channel_index]
+    return markers, marker_data
+
+  @_atomic
+  def array_to_device(self, data, segment = 0, aux_data = None, aux_data_channels = None):
+    """
+    Transfers signals from the host to the card using :obj:`_transfer_array_i64`.
+    The page aligned buffer that the signals are written to is taken from :obj:`buffer_pool`, and given back once the transfer has finished.
+    The mode, number of enabled channels, sample resolution and IO port modes are read once, and reused by later uploads until one of :obj:`SPC_CARDMODE`, :obj:`SPC_CHENABLE` or :obj:`SPCM_X0_MODE` to :obj:`SPCM_X2_MODE` changes.
+    IO port modes are only written when they differ from the ones that are needed.
+
+    Parameters
+    ----------
+    data : :obj:`list` of :obj:`numpy.ndarray` of :obj:`float`
+      A :obj:`list` of sampled waveforms to be transferred to the card.
+      The first element in the :obj:`list` is the waveform that is assigned to the first enabled channel, and so on.
+      Values are assumed to be between :obj:`-1.0` and :obj:`1.0`.
+    segment : :obj:`int`
+      The segment that the waveform is loaded into.
+      Only relevant if the card is in a mode that uses segments, such as sequencing.
+    aux_data : :obj:`list` of :obj:`numpy.ndarray` of :obj:`bool`
+      An optional :obj:`list` of binary waveforms to be played out of the IO ports (X0, X1 and/or X2).
+      Requires information given in :obj:`aux_data_channels`.
+      Will automatically set up port modes and signal discretisation based on information given.
+    aux_data_channels : :obj:`list` of :obj:`dict`
+      Information that says where in which channels the binary waveforms in :obj:`aux_data_channels` are taken from, and which port they are output.
+      Each :obj:`dict` in the overall :obj:`list` corresponds to one of the waveforms in :obj:`aux_data_channels`.
+      The dictionary should contain three elements:
+      :obj:`"Port"` is an :obj:`int` that corresponds to which of the digital IO ports that waveform should be sent to;
+      :obj:`"Channel"` is an :obj:`int` that corresponds to which of the channels the digital waveform should be encoded in; and
+      :obj:`"Bit"` is either :obj:`15`, :obj:`14` or :obj:`13`, which corresponds to which bit of the channel should be sacrificed for the digital waveform.
+      Note that this should be consistent for every segment of memory.
+    """
+    self._upload_array(data, segment, aux_data, aux_data_channels, True)
+
+  @_atomic
+  def start_array_to_device(self, data, segment = 0, aux_data = None, aux_data_channels = None):
+    """
+    Transfers signals from the host to the card, as :obj:`array_to_device` does, but returns as soon as the transfer has started, rather than waiting for it to finish.
+    The signals are quantised before anything else, so if a transfer is already running, the next segment is quantised while it finishes, and only then is the new transfer started.
+
+    .. code-block:: python
+
+      for segment, signals in enumerate(segment_signals):
+        card.start_array_to_device(signals, segment)
+      card.get_dma_transfer().wait()
+
+    The signals themselves are not needed once this returns, but nothing else should change the segment selected by :obj:`set_current_segment` until the transfer has finished.
+
+    Parameters
+    ----------
+    data : :obj:`list` of :obj:`numpy.ndarray` of :obj:`float`
+      The waveforms for each enabled channel, see :obj:`array_to_device`.
+    segment : :obj:`int`
+      The segment that the waveform is loaded into, see :obj:`array_to_device`.
+    aux_data : :obj:`list` of :obj:`numpy.ndarray` of :obj:`bool`
+      The binary waveforms, see :obj:`array_to_device`.
+    aux_data_channels : :obj:`list` of :obj:`dict`
+      Where the binary waveforms are encoded and output, see :obj:`array_to_device`.
+
+    Returns
+    -------
+    transfer : :obj:`DmaTransfer`
+      The running transfer, to check or wait for.
+    """
+    return self._upload_array(data, segment, aux_data, aux_data_channels, False)
+
+  def get_dma_transfer(self):
+    """
+    Returns
+    -------
+    transfer : :obj:`DmaTransfer`
+      The transfer started by :obj:`start_array_to_device` that has not yet been found to have finished, or :obj:`None` if there is none.
+    """
+    return self._dma_transfer
+
+  def _wait_for_dma_transfer(self):
+    # Only one transfer can run at a time, and the running one restores the segment it changed when it finishes
+    if self._dma_transfer is not None:
+      self._dma_transfer.wait()
+
+  def _upload_array(self, data, segment, aux_data, aux_data_channels, wait):
+    import numpy as np
+
+    context = self._get_transfer_context()
+
+    # Initialise buffer
+    stride = context.stride
+    channels = context.number_of_channels
+    number_of_bytes = channels*stride*data[0].size
+    data_buffer = self.buffer_pool.acquire(number_of_bytes)
+    try:
+      data_np = np.frombuffer(data_buffer, dtype = np.int16, count = channels*data[0].size)
+
+      # Set up digital outs, then add waveforms and digital outs to buffer
+      markers = self._set_up_aux_data(context, aux_data_channels if aux_data is not None else None)
+      _quantise(data_np, data, aux_data, markers, context.resolution_bits)
+
+      # Change segment, once any running transfer has finished with it
+      self._wait_for_dma_transfer()
+      previous_segment = None
+      if context.is_segmented:
+        previous_segment = self.get_current_segment()
+        self.set_current_segment(segment)
+      try:
+        if context.is_segmented:
+          self.set_segment_size(data[0].size)
+
+        # Transfer buffer to card
+        self._transfer_array_i64(spcm.SPCM_BUF_DATA, spcm.SPCM_DIR_PCTOCARD, 0, data_buffer, 0, number_of_bytes)
+        if not wait:
+          from spectrum_card.dma_transfer import DmaTransfer
+          self.execute_commands(dma_start = True)
+          self._dma_transfer = DmaTransfer(self, number_of_bytes, data_buffer, previous_segment)
+          # The transfer now holds the buffer, and restores the segment when it finishes
+          data_buffer = None
+          previous_segment = None
+          return self._dma_transfer
+        self.execute_commands(dma_start = True, dma_wait = True)
+      finally:
+        # Tidy up, even if the transfer failed
+        if previous_segment is not None:
+          self.set_current_segment(previous_segment)
+    finally:
+      if data_buffer is not None:
+        self.buffer_pool.release(data_buffer)
+
+  @_atomic
+  def patch_segment(self, segment, start_sample, data, aux_data = None, aux_data_channels = None):
+    """
+    Overwrites part of a segment that is already on the card, transferring only the samples that change rather than the whole segment.
+    The samples are written :obj:`start_sample` samples into the segment, using the device offset of :obj:`_transfer_array_i64`, and the length of the segment is left as it is.
+
+    The card can only start a transfer on a page boundary (4096 bytes) of its memory, so :obj:`start_sample` times the number of bytes per sample of all enabled channels must be a multiple of 4096.
+    For example, with four 16 bit channels, :obj:`start_sample` must be a multiple of 512.
+
+    Parameters
+    ----------
+    segment : :obj:`int`
+      The segment to change.
+      Only relevant if the card is in a mode that uses segments, such as sequencing.
+    start_sample : :obj:`int`
+      The first sample (per channel) of the segment to overwrite.
+    data : :obj:`list` of :obj:`numpy.ndarray` of :obj:`float`
+      The new samples for each enabled channel, as they would be given to :obj:`array_to_device`.
+      They must not run past the end of the segment, which is checked before anything is sent to the card.
+    aux_data : :obj:`list` of :obj:`numpy.ndarray` of :obj:`bool`
+      The binary waveforms for the new samples, see :obj:`array_to_device`.
+      Markers that the IO ports output, but that are not given here, are low for the new samples.
+    aux_data_channels : :obj:`list` of :obj:`dict`
+      Where the binary waveforms are encoded and output, see :obj:`array_to_device`.
+      IO port modes are shared by every segment, so are left as they are, and must already output these markers, as set up when the segment was uploaded.
+    """
+    import numpy as np
+
+    context = self._get_transfer_context()
+    channels = context.number_of_channels
+    bytes_per_sample = channels*context.stride
+    device_address = start_sample*bytes_per_sample
+    if start_sample < 0 or device_address % PAGE_SIZE != 0:
+      raise ValueError(f"start_sample must be a multiple of {PAGE_SIZE//math.gcd(PAGE_SIZE, bytes_per_sample)}, so that the transfer starts on a page boundary of card memory.")
+
+    # Check the patch fits in the segment, and its markers are already output, before anything is changed on the card
+    markers, marker_data = self._get_patch_markers(context, aux_data, aux_data_channels)
+    self._wait_for_dma_transfer()
+    if context.is_segmented:
+      # Lengths waiting in a transaction are not in the shadow yet, so are read back instead
+      segment_length = self._segment_sizes.get(segment) if self._transaction is None else None
+      if segment_length is None:
+        segment_length = self.get_segment_length(segment)
+    else:
+      segment_length = self.get_memory_size()
+    if start_sample + data[0].size > segment_length:
+      raise ValueError(f"The patch ends at sample {start_sample + data[0].size}, past the end of the segment, which is {segment_length} samples long.")
+
+    # Change segment, leaving its length as it is
+    if context.is_segmented:
+      previous_segment = self.get_current_segment()
+      self.set_current_segment(segment)
+    try:
+      # Initialise buffer
+      number_of_bytes = bytes_per_sample*data[0].size
+      data_buffer = self.buffer_pool.acquire(number_of_bytes)
+      try:
+        data_np = np.frombuffer(data_buffer, dtype = np.int16, count = channels*data[0].size)
+
+        # Add waveforms and digital outs to buffer
+        _quantise(data_np, data, marker_data, markers, context.resolution_bits)
+
+        # Transfer only the changed samples
+        self._transfer_array_i64(spcm.SPCM_BUF_DATA, spcm.SPCM_DIR_PCTOCARD, 0, data_buffer, device_address, number_of_bytes)
+        self.execute_commands(dma_start = True, dma_wait = True)
+      finally:
+        self.buffer_pool.release(data_buffer)
+    finally:
+      # Tidy up, even if the transfer failed
+      if context.is_segmented:
+        self.set_current_segment(previous_segment)
+
+  @_atomic
+  def int16_to_device(self, data, segment = 0):
+    """
+    Transfers samples that are already quantised from the host to the card using :obj:`_transfer_array_i64`, without the scaling and clipping done by :obj:`array_to_device`.
+    If :obj:`data` is a single C contiguous :obj:`numpy.int16` array that starts on a page boundary (see :obj:`spcm_tools.pvAllocMemPageAligned`), the card reads it straight from the caller's memory.
+    Otherwise, it is copied once into a page aligned buffer taken from :obj:`buffer_pool`, interleaving channels if they are given separately.
+
+    IO port modes are left as they are, so any markers should already be in the samples, and the ports set up with :obj:`use_io_mode_digital_out`.
+
+    Parameters
+    ----------
+    data : :obj:`numpy.ndarray` of :obj:`numpy.int16`, or :obj:`list` of :obj:`numpy.ndarray` of :obj:`numpy.int16`
+      Either a single array of samples already interleaved in the order the card expects (first sample of each enabled channel, then the second of each, and so on), which can also be two dimensional with one column for each enabled channel,
+      or a :obj:`list` with one array for each enabled channel, the first being assigned to the first enabled channel, and so on.
+    segment : :obj:`int`
+      The segment that the waveform is loaded into.
+      Only relevant if the card is in a mode that uses segments, such as sequencing.
+
+    Returns
+    -------
+    path : :obj:`str`
+      :obj:`"Zero copy"` if the card read straight from :obj:`data`, or :obj:`"Copy"` if it was first copied into a buffer.
+    """
+    import numpy as np
+
+    context = self._get_transfer_context()
+    if context.stride != 2:
+      raise ValueError("int16_to_device needs a card with 16 bit samples.")
+    channels = context.number_of_channels
+    if isinstance(data, np.ndarray):
+      interleaved = data
+      if interleaved.ndim == 2 and interleaved.shape[1] != channels:
+        raise ValueError(f"data has {interleaved.shape[1]} columns, but {channels} channels are enabled.")
+      if interleaved.ndim > 2 or interleaved.size % channels != 0:
+        raise ValueError(f"data cannot be split evenly between {channels} enabled channels.")
+      arrays = [interleaved]
+    else:
+      if len(data) != channels:
+        raise ValueError(f"data has {len(data)} arrays, but {channels} channels are enabled.")
+      if any(channel_data.size != data[0].size for channel_data in data):
+        raise ValueError("Every channel in data must have the same number of samples.")
+      arrays = [np.asarray(channel_data) for channel_data in data]
+      # A single channel does not need interleaving, so can be read in place
+      interleaved = arrays[0] if channels == 1 else None
+    for channel_data in arrays:
+      if channel_data.dtype.kind != "i" or channel_data.dtype.itemsize != 2:
+        raise ValueError(f"data must be int16, not {channel_data.dtype}.")
+    number_of_samples = sum(channel_data.size for channel_data in arrays)//channels
+    number_of_bytes = 2*channels*number_of_samples
+
+    # Read from the caller's memory if the card can, otherwise copy once into a pooled buffer
+    data_buffer = None
+    if interleaved is not None and interleaved.dtype == np.int16 and interleaved.flags.c_contiguous and interleaved.ctypes.data % PAGE_SIZE == 0:
+      path = "Zero copy"
+      host_address = spcm.c_void_p(interleaved.ctypes.data)
+    else:
+      path = "Copy"
+      data_buffer = self.buffer_pool.acquire(number_of_bytes)
+      host_address = data_buffer
+      data_np = np.frombuffer(data_buffer, dtype = np.int16, count = channels*number_of_samples)
+      if interleaved is not None:
+        data_np[:] = interleaved.reshape(-1)
+      else:
+        for channel, channel_data in enumerate(arrays):
+          data_np[channel::channels] = channel_data
+
+    try:
+      # Change segment
+      self._wait_for_dma_transfer()
+      if context.is_segmented:
+        previous_segment = self.get_current_segment()
+        self.set_current_segment(segment)
+      try:
+        if context.is_segmented:
+          self.set_segment_size(number_of_samples)
+
+        # Transfer to card
+        self._transfer_array_i64(spcm.SPCM_BUF_DATA, spcm.SPCM_DIR_PCTOCARD, 0, host_address, 0, number_of_bytes)
+        self.execute_commands(dma_start = True, dma_wait = True)
+      finally:
+        # Tidy up, even if the transfer failed
+        if context.is_segmented:
+          self.set_current_segment(previous_segment)
+    finally:
+      if data_buffer is not None:
+        self.buffer_pool.release(data_buffer)
+    return path
+
+  @_atomic
+  def upload_segments(self, segments, aux_data = None, aux_data_channels = None):
+    """
+    Transfers signals for several segments from the host to the card in one go, rather than with one :obj:`array_to_device` call for each segment.
+
+    .. code-block:: python
+
+      card.use_mode_sequence()
+      card.set_number_of_segments(4)
+      timings = card.upload_segments({segment : [signal_sine, signal_square] for segment in range(4)})
+
+    The mode and IO ports are checked and set up once, and :obj:`SPC_MEMSIZE` is increased if the segments would not fit.
+    Every segment is then quantised into one page aligned buffer taken from :obj:`buffer_pool`, before the segments are transferred back to back.
+
+    Parameters
+    ----------
+    segments : :obj:`dict` of :obj:`int` to :obj:`list` of :obj:`numpy.ndarray` of :obj:`float`
+      The waveforms for each segment, as they would be given to :obj:`array_to_device`.
+      Segments are transferred in the order they are given.
+      If the card is not in a mode that uses segments, only segment :obj:`0` can be given.
+    aux_data : :obj:`dict` of :obj:`int` to :obj:`list` of :obj:`numpy.ndarray` of :obj:`bool`
+      The binary waveforms for each segment, as they would be given to :obj:`array_to_device`.
+      Every segment must be given.
+    aux_data_channels : :obj:`list` of :obj:`dict`
+      Where the binary waveforms are encoded and output, see :obj:`array_to_device`.
+      These are the same for every segment.
+
+    Returns
+    -------
+    timings : :obj:`dict`
+      :obj:`"Total time"`, the time taken by the whole upload, :obj:`"Quantise time"`, the time taken to plan and quantise every segment before the first transfer, and :obj:`"Segments"`, a :obj:`dict` from each segment to a :obj:`dict` of its :obj:`"Samples"` (per channel), :obj:`"Bytes"` and :obj:`"Transfer time"`.
+      Times are in s.
+    """
+    import numpy as np
+
+    start_time = time.perf_counter()
+    context = self._get_transfer_context()
+    if not context.is_segmented and set(segments) - {0}:
+      raise ValueError("Only segment 0 can be uploaded to a card that is not in a mode that uses segments.")
+    channels = context.number_of_channels
+    lengths = {segment : data[0].size for segment, data in segments.items()}
+
+    # Plan where each segment goes, both on the card and in the buffer
+    if context.is_segmented:
+      number_of_segments = self.get_number_of_segments()
+      if any(segment < 0 or segment >= number_of_segments for segment in segments):
+        raise ValueError(f"Segments must be between 0 and {number_of_segments - 1}.")
+      memory_size = number_of_segments*max(lengths.values())
+    else:
+      memory_size = max(lengths.values())
+    if self.get_memory_size() < memory_size:
+      self.set_memory_size(memory_size)
+    buffer_offsets = {}
+    buffer_size = 0
+    for segment, length in lengths.items():
+      # Each segment starts on a page boundary, as the start of a transfer should
+      buffer_offsets[segment] = buffer_size
+      buffer_size += -(-channels*context.stride*length//PAGE_SIZE)*PAGE_SIZE
+
+    # Quantise every segment
+    data_buffer = self.buffer_pool.acquire(buffer_size)
+    try:
+      buffer_address = spcm.addressof(data_buffer)
+      markers = self._set_up_aux_data(context, aux_data_channels if aux_data is not None else None)
+      for segment, data in segments.items():
+        data_np = np.frombuffer(data_buffer, dtype = np.int16, count = channels*lengths[segment], offset = buffer_offsets[segment])
+        _quantise(data_np, data, aux_data[segment] if aux_data is not None else None, markers, context.resolution_bits)
+      quantise_time = time.perf_counter() - start_time
+
+      # Transfer segments back to back
+      self._wait_for_dma_transfer()
+      if context.is_segmented:
+        previous_segment = self.get_current_segment()
+      try:
+        segment_timings = {}
+        for segment, length in lengths.items():
+          transfer_start_time = time.perf_counter()
+          number_of_bytes = channels*context.stride*length
+          if context.is_segmented:
+            self.set_current_segment(segment)
+            self.set_segment_size(length)
+          self._transfer_array_i64(spcm.SPCM_BUF_DATA, spcm.SPCM_DIR_PCTOCARD, 0, spcm.c_void_p(buffer_address + buffer_offsets[segment]), 0, number_of_bytes)
+          self.execute_commands(dma_start = True, dma_wait = True)
+          segment_timings[segment] = {
+            "Samples" : length,
+            "Bytes" : number_of_bytes,
+            "Transfer time" : time.perf_counter() - transfer_start_time
+          }
+      finally:
+        # Tidy up, even if a transfer failed
+        if context.is_segmented:
+          self.set_current_segment(previous_segment)
+    finally:
+      self.buffer_pool.release(data_buffer)
+    return {
+      "Total time" : time.perf_counter() - start_time,
+      "Quantise time" : quantise_time,
+      "Segments" : segment_timings
+    }
+  
+  def set_memory_size(self, size):
+    """
+    Writes to :obj:`SPC_MEMSIZE`.
+    
+    Parameters
+    ----------
+    size : :obj:`int`
+      Memory size in samples per channel.
+    """
+    self._set_int64(spcm.SPC_MEMSIZE, size)
+  
+  def get_memory_size(self, verify = False):
+    """
+    Reads :obj:`SPC_MEMSIZE`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    size : :obj:`int`
+      Memory size in samples per channel.
+    """
+    return self._get_config_int64(spcm.SPC_MEMSIZE, verify)
+  
+  def get_max_memory_size(self):
+    """
+    Reads :obj:`SPC_PCIMEMSIZE`.
+    
+    Returns
+    -------
+    size : :obj:`int`
+      Memory size on the card in Bytes.
+    """
+    return self._get_capability_int64(spcm.SPC_PCIMEMSIZE)
+  
+  def set_memory_test(self, enable):
+    """
+    Writes to :obj:`SPC_MEMTEST`.
+    
+    Parameters
+    ----------
+    enable : :obj:`int`
+      :obj:`1` if mode is enabled, :obj:`0` otherwise.
+    """
+    self._set_int64(spcm.SPC_MEMTEST, enable)
+
+  def memory_test_start(self):
+    """
+    Writes :obj:`1` to :obj:`SPC_MEMTEST`.
+    """
+    self.set_memory_test(self, 1)
+
+  def memory_test_stop(self):
+    """
+    Writes :obj:`0` to :obj:`SPC_MEMTEST`.
+    """
+    self.set_memory_test(self, 0)
+
+  def get_memory_test(self):
+    """
+    Reads :obj:`SPC_MEMTEST`.
+    
+    Returns
+    -------
+    enable : :obj:`int`
+      :obj:`1` if mode is enabled, :obj:`0` otherwise.
+    """
+    return self._get_int64(spcm.SPC_MEMTEST)
+  
+  # Playback --------------------------------------------------------------------
+  # =============================================================================
+  
+  def set_number_of_loops(self, number_of_loops):
+    """
+    Writes to :obj:`SPC_LOOPS`.
+    
+    Parameters
+    ----------
+    number_of_loops : :obj:`int`
+      How many times the waveform should be looped.
+      If set to :obj:`0`, will loop indefinitely.
+    """
+    self._set_int32(spcm.SPC_LOOPS, number_of_loops)
+  
+  def get_number_of_loops(self, verify = False):
+    """
+    Writes to :obj:`SPC_LOOPS`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    number_of_loops : :obj:`int`
+      How many times the waveform should be looped.
+      If set to :obj:`0`, will loop indefinitely.
+    """
+    return self._get_config_int32(spcm.SPC_LOOPS, verify)
+
+  # Sequencing ------------------------------------------------------------------
+  # =============================================================================
+  
+  def get_max_number_of_segments(self):
+    """
+    Reads :obj:`SPC_SEQMODE_AVAILMAXSEGMENT`.
+    
+    Returns
+    -------
+    size : :obj:`int`
+      Max number of segments that can be used with the card.
+    """
+    return self._get_capability_int64(spcm.SPC_SEQMODE_AVAILMAXSEGMENT)
+  
+  def get_max_number_of_sequence_steps(self):
+    """
+    Reads :obj:`SPC_SEQMODE_AVAILMAXSTEPS`.
+    
+    Returns
+    -------
+    size : :obj:`int`
+      Max number of steps that can be used with the card.
+    """
+    return self._get_capability_int64(spcm.SPC_SEQMODE_AVAILMAXSTEPS)
+  
+  def get_max_number_of_loops_per_sequence_step(self):
+    """
+    Reads :obj:`SPC_SEQMODE_AVAILMAXLOOP`.
+    
+    Returns
+    -------
+    loops : :obj:`int`
+      Max number of loops that can be used in each sequence step.
+      Note that steps can also be set to loop indefinitely. 
+    """
+    return self._get_capability_int64(spcm.SPC_SEQMODE_AVAILMAXLOOP)
+  
+  def get_available_sequence_features(self):
+    """
+    Reads :obj:`SPC_SEQMODE_AVAILFEATURES`.
+    For decoded information, use :obj:`get_features_information` or :obj:`get_available_sequence_features_information` instead.
+
+    Returns
+    -------
+    features : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int64(spcm.SPC_SEQMODE_AVAILFEATURES)
+  
+  def get_available_sequence_features_information(self):
+    """
+    Reads :obj:`SPC_SEQMODE_AVAILFEATURES`.
+
+    Returns
+    -------
+    features : :obj:`list` of :obj:`str`
+      The features that can be used in sequence mode in :obj:`str` format.
+    """
+    bitmap = self.get_available_sequence_features()
+    features = []
+    if bitmap & spcm.SPCSEQ_ENDLOOPONTRIG:
+      features.append("Loop step until trigger")
+    if bitmap & spcm.SPCSEQ_END:
+      features.append("Final step")
+    return features
+  
+  def set_number_of_segments(self, number_of_segments):
+    """
+    Writes to :obj:`SPC_SEQMODE_MAXSEGMENTS`.
+    
+    Parameters
+    ----------
+    number_of_segments : :obj:`int`
+      The number of segments to split the memory into.
+    """
+    self._set_int64(spcm.SPC_SEQMODE_MAXSEGMENTS, number_of_segments)
+
+  def get_number_of_segments(self, verify = False):
+    """
+    Reads :obj:`SPC_SEQMODE_MAXSEGMENTS`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    number_of_segments : :obj:`int`
+      The number of segments to split the memory into.
+    """
+    return self._get_config_int64(spcm.SPC_SEQMODE_MAXSEGMENTS, verify)
+  
+  def set_current_segment(self, segment):
+    """
+    Writes to :obj:`SPC_SEQMODE_WRITESEGMENT`.
+    
+    Parameters
+    ----------
+    segment : :obj:`int`
+      The segment currently "armed" for reading and writing to.
+    """
+    self._set_int64(spcm.SPC_SEQMODE_WRITESEGMENT, segment)
+
+  def get_current_segment(self, verify = False):
+    """
+    Reads :obj:`SPC_SEQMODE_WRITESEGMENT`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    segment : :obj:`int`
+      The segment currently "armed" for reading and writing to.
+    """
+    return self._get_config_int64(spcm.SPC_SEQMODE_WRITESEGMENT, verify)
+  
+  def set_segment_size(self, size):
+    """
+    Writes to :obj:`SPC_SEQMODE_SEGMENTSIZE`.
+    Sets the length of the currently armed segment.
+    
+    Parameters
+    ----------
+    size : :obj:`int`
+      Length of segment in samples per channel.
+    """
+    self._set_int64(spcm.SPC_SEQMODE_SEGMENTSIZE, size)
+
+  @_atomic
+  def set_segment_length(self, segment, length):
+    """
+    Writes to :obj:`SPC_SEQMODE_SEGMENTSIZE`.
+    Sets the length of any segment segment.
+    
+    Parameters
+    ----------
+    segment : :obj:`int`
+      The segment to set the length of.
+    size : :obj:`int`
+      Length of segment in samples per channel.
+    """
+    previous_segment = self.get_current_segment()
+    self.set_current_segment(segment)
+    self.set_segment_size(length)
+    self.set_current_segment(previous_segment)
+
+  def get_segment_size(self):
+    """
+    Reads :obj:`SPC_SEQMODE_SEGMENTSIZE`.
+    Reads the length of the currently armed segment.
+    
+    Returns
+    -------
+    size : :obj:`int`
+      Length of segment in samples per channel.
+    """
+    size = self._get_int64(spcm.SPC_SEQMODE_SEGMENTSIZE)
+    if self._transaction is None:
+      self._shadow_segment_size(size)
+    return size
+
+  @_atomic
+  def get_segment_length(self, segment):
+    """
+    Reads :obj:`SPC_SEQMODE_SEGMENTSIZE`.
+    Reads the length of any segment segment.
+    
+    Parameters
+    ----------
+    segment : :obj:`int`
+      The segment to get the length of.
+    
+    Returns
+    -------
+    size : :obj:`int`
+      Length of segment in samples per channel.
+    """
+    previous_segment = self.get_current_segment()
+    self.set_current_segment(segment)
+    length = self.get_segment_size()
+    self.set_current_segment(previous_segment)
+    return length
+  
+  def set_sequence_instruction(self, step, instruction):
+    """
+    Writes to :obj:`SPC_SEQMODE_STEPMEM0`.
+    To do this without using bit codes, use :obj:`set_step_instruction`.
+    
+    Parameters
+    ----------
+    step : :obj:`int`
+      The step to write to.
+    instruction : :obj:`int`
+      Bit code.
+    """
+    self._set_int64(spcm.SPC_SEQMODE_STEPMEM0 + step, instruction)
+
+  def set_step_instruction(
+      self,
+      step,
+      segment,
+      number_of_loops = 1,
+      next_step = None, 
+      loop_until_trigger = False,
+      end_of_sequence = False
+      ):
+    """
+    Writes to :obj:`SPC_SEQMODE_STEPMEM0`.
+    
+    Parameters
+    ----------
+    step : :obj:`int`
+      The step to write to.
+    segment : :obj:`int`
+      The segment the step points to.
+    number_of_loops : :obj:`int`
+      How many times the step should be looped.
+    next_step : :obj:`int`
+      The step that follows this one.
+      If :obj:`None` (default), will either point to step :obj:`step + 1` or, if :obj:`end_of_sequence` is set to :obj:`True`, will point to step :obj:`0`.
+    loop_until_trigger : :obj:`bool`
+      Whether to wait for a trigger until proceeding to the next step.
+    end_of_sequence : :obj:`bool`
+      Whether or not the step is the final step in the sequence.
+    """
+    instruction = 0x0000000000000000
+
+    instruction |= segment & spcm.SPCSEQ_SEGMENTMASK
+
+    if next_step is None:
+      if end_of_sequence:
+        next_step = 0
+      else:
+        next_step = step + 1
+    instruction |= (next_step << 16) & spcm.SPCSEQ_NEXTSTEPMASK
+
+    instruction |= (number_of_loops << 32) & (spcm.SPCSEQ_LOOPMASK << 32)
+
+    if loop_until_trigger:
+      instruction |= spcm.SPCSEQ_ENDLOOPONTRIG << 32
+    
+    if end_of_sequence:
+      instruction |= spcm.SPCSEQ_END << 32
+    
+    self.set_sequence_instruction(step, instruction)
+
+  def get_sequence_instruction(self, step, verify = False):
+    """
+    Reads :obj:`SPC_SEQMODE_STEPMEM0`.
+    For decoded information, use :obj:`get_step_instruction` instead.
+    
+    Parameters
+    ----------
+    step : :obj:`int`
+      The step to write to.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    instruction : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int64(spcm.SPC_SEQMODE_STEPMEM0 + step, verify)
+  
+  def get_step_instruction(self, step):
+    """
+    Reads :obj:`SPC_SEQMODE_STEPMEM0`.
+    
+    Parameters
+    ----------
+    step : :obj:`int`
+      The step to write to.
+
+    Returns
+    -------
+    instruction : :obj:`dict`
+      Contains information under keys of :obj:`"Segment"`, :obj:`"Next step"`, :obj:`"Number of loops"`, :obj:`"Loop until trigger"` and :obj:`"End of sequence"`.
+      Each has the same meaning as in the parameters for :obj:`set_step_instruction`.
+    """
+    bit_code = self.get_sequence_instruction(step)
+    segment = bit_code & spcm.SPCSEQ_SEGMENTMASK
+    next_step = (bit_code & spcm.SPCSEQ_NEXTSTEPMASK) >> 16
+    number_of_loops = (bit_code >> 32) & spcm.SPCSEQ_LOOPMASK
+    loop_until_trigger = (((bit_code >> 32) & spcm.SPCSEQ_ENDLOOPONTRIG) != 0)
+    end_of_sequence = (((bit_code >> 32) & spcm.SPCSEQ_END) != 0)
+    return {"Segment":segment, "Next step":next_step, "Number of loops":number_of_loops, "Loop until trigger":loop_until_trigger, "End of sequence":end_of_sequence}
+
+  def set_start_step(self, step):
+    """
+    Writes to :obj:`SPC_SEQMODE_STARTSTEP`.
+    
+    Parameters
+    ----------
+    step : :obj:`int`
+      The starting step of the sequence.
+    """
+    self._set_int64(spcm.SPC_SEQMODE_STARTSTEP, step)
+
+  def get_start_step(self, verify = False):
+    """
+    Reads :obj:`SPC_SEQMODE_STARTSTEP`.
+    
+    Parameters
+    ----------
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+
+    Returns
+    -------
+    step : :obj:`int`
+      The starting step of the sequence.
+    """
+    return self._get_config_int64(spcm.SPC_SEQMODE_STARTSTEP, verify)
+
+  # Status ----------------------------------------------------------------------
+  # =============================================================================
+  
+  def get_status(self):
+    """
+    Reads :obj:`SPC_M2STATUS`.
+    For decoded information, use :obj:`get_status_information` instead.
+    
+    Returns
+    -------
+    status : :obj:`int`
+      Bit code.
+    """
+    return self._get_int32(spcm.SPC_M2STATUS)
+  
+  def get_status_information(self):
+    """
+    Reads :obj:`SPC_M2STATUS`.
+    
+    Returns
+    -------
+    status : :obj:`list` of :obj:`list`
+      A list describing the status of the card.
+    """
+    status = []
+    response = self.get_status()
+
+    if response & spcm.M2STAT_CARD_PRETRIGGER:
+      status.append("Pre-trigger")
+    if response & spcm.M2STAT_CARD_TRIGGER:
+      status.append("Trigger")
+    if response & spcm.M2STAT_CARD_READY:
+      status.append("Ready")
+    if response & spcm.M2STAT_CARD_SEGMENT_PRETRG:
+      status.append("Segment pre-trigger")
+
+    if response & spcm.M2STAT_DATA_BLOCKREADY:
+      status.append("DMA: Block ready")
+    if response & spcm.M2STAT_DATA_END:
+      status.append("DMA: End")
+    if response & spcm.M2STAT_DATA_OVERRUN:
+      status.append("DMA: Over-run")
+    if response & spcm.M2STAT_DATA_ERROR:
+      status.append("DMA: Error")
+
+    return status
+  
+  # IO lines --------------------------------------------------------------------
+  # =============================================================================
+  def set_io_mode(self, port, mode):
+    """
+    Writes to :obj:`SPCM_X0_MODE`.
+    To do this without using bit codes, use :obj:`io_port_disable`, :obj:`use_io_mode_digital_out`, :obj:`use_io_mode_asynchronous_input`, :obj:`use_io_mode_asynchronous_output`, :obj:`use_io_mode_trigger_output`, :obj:`use_io_mode_run_state_output`, :obj:`use_io_mode_arm_state_output`, :obj:`use_io_mode_continuous_marker_output`, :obj:`use_io_mode_reference_clock_output` or :obj:`use_io_mode_system_clock_output` instead.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    mode : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPCM_X0_MODE + (spcm.SPCM_X1_MODE - spcm.SPCM_X0_MODE)*port, mode)
+  
+  def io_port_disable(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_DISABLE` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_DISABLE)
+
+  def use_io_mode_digital_out(self, port, channel, bit):
+    """
+    Writes :obj:`SPCM_XMODE_DIGOUT` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, _get_digital_out_mode(channel, bit))
+
+  def use_io_mode_asynchronous_input(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_ASYNCIN` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_ASYNCIN)
+
+  def use_io_mode_asynchronous_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_ASYNCOUT` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_ASYNCOUT)
+
+  def use_io_mode_trigger_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_TRIGOUT` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_TRIGOUT)
+
+  def use_io_mode_run_state_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_RUNSTATE` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_RUNSTATE)
+
+  def use_io_mode_arm_state_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_ARMSTATE` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_RUNSTATE)
+
+  def use_io_mode_continuous_marker_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_CONTOUTMARK` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_RUNSTATE)
+
+  def use_io_mode_reference_clock_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_REFCLKOUT` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_REFCLKOUT)
+
+  def use_io_mode_system_clock_output(self, port):
+    """
+    Writes :obj:`SPCM_XMODE_SYSCLKOUT` to :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    """
+    self.set_io_mode(port, spcm.SPCM_XMODE_SYSCLKOUT)
+  
+  def get_io_mode(self, port, verify = False):
+    """
+    Reads :obj:`SPCM_X0_MODE`.
+    For decoded information, use :obj:`get_available_io_modes_information` instead.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    verify : :obj:`bool`
+      If :obj:`True`, reads the register from the driver, rather than using the value last written to it.
+    
+    Returns
+    -------
+    modes : :obj:`int`
+      Bit code.
+    """
+    return self._get_config_int32(spcm.SPCM_X0_MODE + (spcm.SPCM_X1_MODE - spcm.SPCM_X0_MODE)*port, verify)
+  
+  def get_io_mode_information(self, port):
+    """
+    Reads :obj:`SPCM_X0_MODE`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    
+    Returns
+    -------
+    mode : :obj:`str`
+      Mode in :obj:`str` format
+    """
+    bit_code = self.get_io_mode(port)
+    bit_code_digital_out = bit_code & 0xFFFF0000
+    bit_code &= 0x0000FFFF
+    if bit_code == spcm.SPCM_XMODE_DISABLE:
+      return "Disabled"
+    elif bit_code == spcm.SPCM_XMODE_ASYNCIN:
+      return "Asynchronous input"
+    elif bit_code == spcm.SPCM_XMODE_ASYNCOUT:
+      return "Asynchronous output"
+    elif bit_code == spcm.SPCM_XMODE_DIGIN:
+      return "Digital input"
+    elif bit_code == spcm.SPCM_XMODE_DIGOUT:
+      mode = "Digital output; Channel"
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_CH0:
+        mode += " 0"
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_CH1:
+        mode += " 1"
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_CH2:
+        mode += " 2"
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_CH3:
+        mode += " 3"
+      mode += "; Bit "
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_BIT15:
+        mode += " 15"
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_BIT14:
+        mode += " 14"
+      if bit_code_digital_out & spcm.SPCM_XMODE_DIGOUTSRC_BIT13:
+        mode += " 13"
+      mode += ";"
+      return mode
+    elif bit_code == spcm.SPCM_XMODE_TRIGOUT:
+      return "Trigger output"
+    elif bit_code == spcm.SPCM_XMODE_DIGIN2BIT:
+      return "Digital (2 bit) input"
+    elif bit_code == spcm.SPCM_XMODE_RUNSTATE:
+      return "Run state output"
+    elif bit_code == spcm.SPCM_XMODE_ARMSTATE:
+      return "Arm state output"
+    elif bit_code == spcm.SPCM_XMODE_REFCLKOUT:
+      return "Reference clock output"
+    elif bit_code == spcm.SPCM_XMODE_SYSCLKOUT:
+      return "System clock output"
+    elif bit_code == spcm.SPCM_XMODE_CONTOUTMARK:
+      return "Continuous marker output"
+  
+  def get_available_io_modes(self, port):
+    """
+    Reads :obj:`SPCM_X0_AVAILMODES`.
+    For decoded information, use :obj:`get_available_io_modes_information` instead.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    
+    Returns
+    -------
+    modes : :obj:`int`
+      Bit code.
+    """
+    return self._get_capability_int32(spcm.SPCM_X0_AVAILMODES + (spcm.SPCM_X1_MODE - spcm.SPCM_X0_MODE)*port)
+
+  def get_available_io_modes_information(self, port):
+    """
+    Reads :obj:`SPCM_X0_AVAILMODES`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    
+    Returns
+    -------
+    modes : :obj:`list` of :obj:`str`
+      Modes in :obj:`str` format
+    """
+    bit_code = self.get_available_io_modes(port)
+    modes = []
+    if bit_code & spcm.SPCM_XMODE_ASYNCIN:
+      modes.append("Asynchronous input")
+    if bit_code & spcm.SPCM_XMODE_ASYNCOUT:
+      modes.append("Asynchronous output")
+    if bit_code & spcm.SPCM_XMODE_DIGIN:
+      modes.append("Digital input")
+    if bit_code & spcm.SPCM_XMODE_DIGOUT:
+      modes.append("Digital output")
+    if bit_code & spcm.SPCM_XMODE_TRIGOUT:
+      modes.append("Trigger output")
+    if bit_code & spcm.SPCM_XMODE_DIGIN2BIT:
+      modes.append("Digital (2 bit) input")
+    if bit_code & spcm.SPCM_XMODE_RUNSTATE:
+      modes.append("Run state output")
+    if bit_code & spcm.SPCM_XMODE_ARMSTATE:
+      modes.append("Arm state output")
+    if bit_code & spcm.SPCM_XMODE_REFCLKOUT:
+      modes.append("Reference clock output")
+    if bit_code & spcm.SPCM_XMODE_SYSCLKOUT:
+      modes.append("System clock output")
+    if bit_code & spcm.SPCM_XMODE_CONTOUTMARK:
+      modes.append("Continuous marker output")
+    return modes
+  
+  def set_io_asynchronous_register(self, value):
+    """
+    Writes to :obj:`SPCM_XX_ASYNCIO`.
+    To do this without using bit codes, use ... instead.
+
+    Parameters
+    ----------
+    value : :obj:`int`
+      Bit code.
+    """
+    self._set_int32(spcm.SPCM_XX_ASYNCIO, value)
+
+  @_atomic
+  def set_io_asynchronous(self, port, value):
+    """
+    Writes to :obj:`SPCM_XX_ASYNCIO`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    value : :obj:`bool`
+      Port value.
+    """
+    bit_code = self.get_io_asynchronous_register()  # Get previous output
+    if value:
+      bit_code |= (1 << port)
+    else:
+      bit_code &= ~(1 << port)
+    self.set_io_asynchronous_register(bit_code)
+    return (bit_code & (1 << port)) != 0
+  
+  def get_io_asynchronous_register(self):
+    """
+    Reads :obj:`SPCM_XX_ASYNCIO`.
+    For decoded information, use ... instead.
+
+    Returns
+    -------
+    value : :obj:`int`
+      Bit code.
+    """
+    return self._get_int32(spcm.SPCM_XX_ASYNCIO)
+  
+  def get_io_asynchronous(self, port):
+    """
+    Reads :obj:`SPCM_XX_ASYNCIO`.
+
+    Parameters
+    ----------
+    port : :obj:`int`
+      Which IO port.
+    
+    Returns
+    -------
+    value : :obj:`bool`
+      Port value.
+    """
+    bit_code = self.get_io_asynchronous_register()
+    return (bit_code & (1 << port)) != 0
@@ -0,0 +1,169 @@
+"""
+The :obj:`CardConfiguration` class, which describes how a :obj:`Card` should be set up.
+"""
+
+from spectrum_card.spectrum_header import pyspcm as spcm
+
+class CardConfiguration:
+  """
+  A description of how a :obj:`Card` should be set up, which can be written to the card using :obj:`Card.apply`.
+  Any setting left as :obj:`None` is not written.
+  Settings can be changed between calls to :obj:`Card.apply`, for example,
+
+  .. code-block:: python
+
+    configuration = sc.CardConfiguration(
+      mode = spcm.SPC_REP_STD_SEQUENCE,
+      sample_rate = 50e6,
+      channels_enable = 0b0011,
+      amplitudes = {0 : 0.5, 1 : 0.5},
+      output_enables = {0 : True, 1 : True}
+    )
+    card.apply(configuration)
+    configuration.amplitudes[1] = 0.25
+    card.apply(configuration)
+
+  Parameters
+  ----------
+  mode : :obj:`int`
+    Bit code for :obj:`SPC_CARDMODE`, see :obj:`Card.set_mode`.
+  sample_rate : :obj:`int`
+    Sample rate in Sa/s.
+  clock_mode : :obj:`int`
+    Bit code for :obj:`SPC_CLOCKMODE`, see :obj:`Card.set_clock_mode`.
+  clock_output : :obj:`bool`
+    Whether the clock output is enabled.
+  external_reference_frequency : :obj:`int`
+    Reference clock frequency in Hz.
+  channels_enable : :obj:`int`
+    Bit mask of enabled channels for :obj:`SPC_CHENABLE`, see :obj:`Card.set_channel_enable`.
+  amplitudes : :obj:`dict` of :obj:`int` to :obj:`float`
+    Amplitude in V, for each channel index.
+  output_enables : :obj:`dict` of :obj:`int` to :obj:`bool`
+    Whether the output is enabled, for each channel index.
+  filters : :obj:`dict` of :obj:`int` to :obj:`bool`
+    Whether the filter is enabled, for each channel index.
+  stop_levels : :obj:`dict` of :obj:`int` to :obj:`int`
+    Bit code for :obj:`SPC_CH0_STOPLEVEL`, for each channel index, see :obj:`Card.set_stop_level`.
+  custom_stop_levels : :obj:`dict` of :obj:`int` to :obj:`int`
+    Value for :obj:`SPC_CH0_CUSTOM_STOP`, for each channel index, see :obj:`Card.set_stop_level_custom`.
+  trigger_or_mask : :obj:`int`
+    Bit code for :obj:`SPC_TRIG_ORMASK`.
+  trigger_and_mask : :obj:`int`
+    Bit code for :obj:`SPC_TRIG_ANDMASK`.
+  trigger_modes : :obj:`dict` of :obj:`int` to :obj:`int`
+    Bit code for :obj:`SPC_TRIG_EXT0_MODE`, for each trigger index.
+  upper_trigger_thresholds : :obj:`dict` of :obj:`int` to :obj:`float`
+    Upper (or only) trigger threshold in V, for each trigger index.
+  lower_trigger_thresholds : :obj:`dict` of :obj:`int` to :obj:`float`
+    Lower (or re-arm) trigger threshold in V, for each trigger index.
+  trigger_couplings : :obj:`dict` of :obj:`int` to :obj:`int`
+    :obj:`COUPLING_DC` or :obj:`COUPLING_AC`, for each trigger index.
+  io_modes : :obj:`dict` of :obj:`int` to :obj:`int`
+    Bit code for :obj:`SPCM_X0_MODE`, for each IO port.
+  memory_size : :obj:`int`
+    Number of samples per channel, for :obj:`SPC_MEMSIZE`.
+  number_of_loops : :obj:`int`
+    Number of times to replay memory, for :obj:`SPC_LOOPS`.
+  number_of_segments : :obj:`int`
+    Number of segments in sequence mode, for :obj:`SPC_SEQMODE_MAXSEGMENTS`.
+  """
+  def __init__(
+      self,
+      mode = None,
+      sample_rate = None,
+      clock_mode = None,
+      clock_output = None,
+      external_reference_frequency = None,
+      channels_enable = None,
+      amplitudes = None,
+      output_enables = None,
+      filters = None,
+      stop_levels = None,
+      custom_stop_levels = None,
+      trigger_or_mask = None,
+      trigger_and_mask = None,
+      trigger_modes = None,
+      upper_trigger_thresholds = None,
+      lower_trigger_thresholds = None,
+      trigger_couplings = None,
+      io_modes = None,
+      memory_size = None,
+      number_of_loops = None,
+      number_of_segments = None
+    ):
+    self.mode = mode
+    self.sample_rate = sample_rate
+    self.clock_mode = clock_mode
+    self.clock_output = clock_output
+    self.external_reference_frequency = external_reference_frequency
+    self.channels_enable = channels_enable
+    self.amplitudes = {} if amplitudes is None else dict(amplitudes)
+    self.output_enables = {} if output_enables is None else dict(output_enables)
+    self.filters = {} if filters is None else dict(filters)
+    self.stop_levels = {} if stop_levels is None else dict(stop_levels)
+    self.custom_stop_levels = {} if custom_stop_levels is None else dict(custom_stop_levels)
+    self.trigger_or_mask = trigger_or_mask
+    self.trigger_and_mask = trigger_and_mask
+    self.trigger_modes = {} if trigger_modes is None else dict(trigger_modes)
+    self.upper_trigger_thresholds = {} if upper_trigger_thresholds is None else dict(upper_trigger_thresholds)
+    self.lower_trigger_thresholds = {} if lower_trigger_thresholds is None else dict(lower_trigger_thresholds)
+    self.trigger_couplings = {} if trigger_couplings is None else dict(trigger_couplings)
+    self.io_modes = {} if io_modes is None else dict(io_modes)
+    self.memory_size = memory_size
+    self.number_of_loops = number_of_loops
+    self.number_of_segments = number_of_segments
+
+  def get_registers(self):
+    """
+    Translates the configuration into the register values that would be written to the card.
+
+    Returns
+    -------
+    registers : :obj:`dict` of :obj:`int` to :obj:`tuple`
+      For each register address, a :obj:`tuple` of the register width in bits (:obj:`32` or :obj:`64`), and the value to write.
+    """
+    registers = {}
+    if self.mode is not None:
+      registers[spcm.SPC_CARDMODE] = (32, int(self.mode))
+    if self.channels_enable is not None:
+      registers[spcm.SPC_CHENABLE] = (64, int(self.channels_enable))
+    if self.clock_mode is not None:
+      registers[spcm.SPC_CLOCKMODE] = (32, int(self.clock_mode))
+    if self.external_reference_frequency is not None:
+      registers[spcm.SPC_REFERENCECLOCK] = (64, int(self.external_reference_frequency))
+    if self.sample_rate is not None:
+      registers[spcm.SPC_SAMPLERATE] = (64, int(self.sample_rate))
+    if self.clock_output is not None:
+      registers[spcm.SPC_CLOCKOUT] = (32, int(self.clock_output))
+    if self.memory_size is not None:
+      registers[spcm.SPC_MEMSIZE] = (64, int(self.memory_size))
+    if self.number_of_loops is not None:
+      registers[spcm.SPC_LOOPS] = (32, int(self.number_of_loops))
+    if self.number_of_segments is not None:
+      registers[spcm.SPC_SEQMODE_MAXSEGMENTS] = (64, int(self.number_of_segments))
+    for channel_index, amplitude in self.amplitudes.items():
+      registers[spcm.SPC_AMP0 + channel_index*(spcm.SPC_AMP1 - spcm.SPC_AMP0)] = (32, int(amplitude*1e3))
+    for channel_index, enable in self.output_enables.items():
+      registers[spcm.SPC_ENABLEOUT0 + channel_index*(spcm.SPC_ENABLEOUT1 - spcm.SPC_ENABLEOUT0)] = (32, int(enable))
+    for channel_index, enable in self.filters.items():
+      registers[spcm.SPC_FILTER0 + channel_index*(spcm.SPC_FILTER1 - spcm.SPC_FILTER0)] = (32, int(enable))
+    for channel_index, stop_level_code in self.stop_levels.items():
+      registers[spcm.SPC_CH0_STOPLEVEL + channel_index*(spcm.SPC_CH1_STOPLEVEL - spcm.SPC_CH0_STOPLEVEL)] = (32, int(stop_level_code))
+    for channel_index, value in self.custom_stop_levels.items():
+      registers[spcm.SPC_CH0_CUSTOM_STOP + channel_index*(spcm.SPC_CH1_CUSTOM_STOP - spcm.SPC_CH0_CUSTOM_STOP)] = (32, int(value))
+    for trigger_index, coupling in self.trigger_couplings.items():
+      registers[spcm.SPC_TRIG_EXT0_ACDC + (spcm.SPC_TRIG_EXT1_ACDC - spcm.SPC_TRIG_EXT0_ACDC)*trigger_index] = (32, int(coupling))
+    for trigger_index, mode in self.trigger_modes.items():
+      registers[spcm.SPC_TRIG_EXT0_MODE + (spcm.SPC_TRIG_EXT1_MODE - spcm.SPC_TRIG_EXT0_MODE)*trigger_index] = (32, int(mode))
+    for trigger_index, threshold in self.upper_trigger_thresholds.items():
+      registers[spcm.SPC_TRIG_EXT0_LEVEL0 + (spcm.SPC_TRIG_EXT1_LEVEL0 - spcm.SPC_TRIG_EXT0_LEVEL0)*trigger_index] = (32, int(threshold*1e3))
+    for trigger_index, threshold in self.lower_trigger_thresholds.items():
+      registers[spcm.SPC_TRIG_EXT0_LEVEL1 + (spcm.SPC_TRIG_EXT1_LEVEL1 - spcm.SPC_TRIG_EXT0_LEVEL1)*trigger_index] = (32, int(threshold*1e3))
+    if self.trigger_or_mask is not None:
+      registers[spcm.SPC_TRIG_ORMASK] = (32, int(self.trigger_or_mask))
+    if self.trigger_and_mask is not None:
+      registers[spcm.SPC_TRIG_ANDMASK] = (32, int(self.trigger_and_mask))
+    for port, mode in self.io_modes.items():
+      registers[spcm.SPCM_X0_MODE + (spcm.SPCM_X1_MODE - spcm.SPCM_X0_MODE)*port] = (32, int(mode))
+    return registers
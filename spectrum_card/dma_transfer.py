@@ -0,0 +1,137 @@
+"""
+The :obj:`DmaTransfer` class, which follows a DMA transfer to a :obj:`Card` that runs in the background.
+"""
+
+from spectrum_card.errors import SpcmError, SpcmTimeout, get_error_type
+from spectrum_card.spectrum_header import pyspcm as spcm
+
+import time
+
+class DmaTransfer:
+  """
+  A transfer from the host to the card that has been started, but that might not have finished.
+  Create one using :obj:`Card.start_array_to_device`, which returns as soon as the transfer has started, so that the host can get on with something else (such as quantising the next segment) while the card reads the data.
+
+  .. code-block:: python
+
+    for segment, signals in enumerate(segment_signals):
+      card.start_array_to_device(signals, segment)
+    card.get_dma_transfer().wait()
+
+  The page aligned buffer the transfer reads from is held until the transfer is found to have finished (or failed), by :obj:`done` or :obj:`wait`, and is then given back to the :obj:`BufferPool` of the card.
+  The segment that was selected before the transfer is also restored then.
+
+  Only one transfer can run at a time.
+  Anything else that transfers data to the card (including another :obj:`Card.start_array_to_device`) waits for the running transfer to finish first.
+
+  It can be used in a :obj:`with` block, which waits for the transfer to finish when the block ends.
+
+  Attributes
+  ----------
+  number_of_bytes : :obj:`int`
+    How many bytes are transferred.
+  start_time : :obj:`float`
+    When the transfer was started, from :obj:`time.perf_counter`.
+  end_time : :obj:`float`
+    When the transfer was found to have finished, from :obj:`time.perf_counter`, or :obj:`None` if it has not been yet.
+  """
+  def __init__(self, card, number_of_bytes, data_buffer, previous_segment = None):
+    self.card = card
+    self.number_of_bytes = number_of_bytes
+    self.start_time = time.perf_counter()
+    self.end_time = None
+    self._data_buffer = data_buffer
+    self._previous_segment = previous_segment
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.wait()
+    return False
+
+  def _finish(self):
+    # Called once the card has read the whole buffer
+    self.end_time = time.perf_counter()
+    self.card._dma_transfer = None
+    self.card.buffer_pool.release(self._data_buffer)
+    self._data_buffer = None
+    if self._previous_segment is not None:
+      self.card.set_current_segment(self._previous_segment)
+
+  def done(self):
+    """
+    Checks whether the transfer has finished, using :obj:`M2STAT_DATA_END` and :obj:`M2STAT_DATA_ERROR` of :obj:`SPC_M2STATUS`, without waiting.
+    If the transfer has failed, raises the :obj:`SpcmError` for the error stored by the driver, or a plain :obj:`SpcmError` if the driver has none stored.
+
+    Returns
+    -------
+    is_done : :obj:`bool`
+      :obj:`True` if the transfer has finished.
+    """
+    if self.end_time is not None:
+      return True
+    status = self.card.get_status()
+    if status & spcm.M2STAT_DATA_ERROR:
+      # The card stops reading the buffer when the transfer fails, so it can be let go of
+      self._finish()
+      error, details = self.card._get_last_error()
+      if error:
+        raise get_error_type(error)(error, lambda: details)
+      raise SpcmError(error, lambda: (None, None, "The DMA transfer failed (M2STAT_DATA_ERROR), but the driver has no error stored."))
+    if status & spcm.M2STAT_DATA_END:
+      self._finish()
+      return True
+    return False
+
+  def wait(self, timeout = None):
+    """
+    Waits until the transfer has finished, using :obj:`M2CMD_DATA_WAITDMA` (see :obj:`Card.wait_dma`).
+
+    Parameters
+    ----------
+    timeout : :obj:`float`
+      How long to wait before raising :obj:`SpcmTimeout`, in s, or :obj:`0` to wait for ever.
+      If :obj:`None` (default), uses the timeout set by :obj:`Card.set_timeout`.
+      If the wait times out, the transfer carries on, and can be waited for again.
+      If the wait fails in any other way, the transfer is finished with, and the error is raised.
+
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the transfer took, from being started to being found to have finished, in s.
+    """
+    if self.end_time is None:
+      try:
+        self.card.wait_dma(timeout)
+      except SpcmTimeout:
+        raise
+      except SpcmError:
+        self._finish()
+        raise
+      self._finish()
+    return self.end_time - self.start_time
+
+  def get_bytes_transferred(self):
+    """
+    Reads :obj:`SPC_DATA_AVAIL_USER_LEN`, to find how far the transfer has got.
+
+    Returns
+    -------
+    number_of_bytes : :obj:`int`
+      How many bytes have been transferred so far.
+    """
+    if self.end_time is not None:
+      return self.number_of_bytes
+    return min(self.number_of_bytes, self.card._get_int64(spcm.SPC_DATA_AVAIL_USER_LEN))
+
+  def get_elapsed_time(self):
+    """
+    Returns
+    -------
+    elapsed_time : :obj:`float`
+      How long the transfer has been running if it has not finished, or how long it took if it has, in s.
+    """
+    if self.end_time is None:
+      return time.perf_counter() - self.start_time
+    return self.end_time - self.start_time
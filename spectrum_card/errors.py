@@ -0,0 +1,261 @@
+"""
+Exceptions raised by :obj:`Card` when the driver returns an error code.
+
+Every exception is a :obj:`SpcmError`, and the most common errors have their own subclasses, so that an expected error can be caught on its own, for example,
+
+.. code-block:: python
+
+  try:
+    card.wait_ready()
+  except sc.SpcmTimeout:
+    pass
+
+The exception types and error descriptions are looked up in tables that are built once, when this module is imported, so raising and catching an error does not do any more work than that.
+Details of the error from :obj:`spcm_dwGetErrorInfo_i32` (which register was being accessed and with what value) are only asked for from the driver the first time they are used, for example when the exception is printed.
+The driver only keeps the details of the latest error, so they should be used before the card is called again.
+"""
+
+from spectrum_card.spectrum_header import pyspcm as spcm
+from spectrum_card.spectrum_header import spcm_names
+
+class SpcmError(Exception):
+  """
+  An error returned by the driver.
+
+  Parameters
+  ----------
+  error : :obj:`int`
+    The error code returned by the driver, including its origin bit.
+  get_error_info : :obj:`callable`
+    Called with no arguments to fetch the details of the error from the driver.
+    Returns the register, value and text from :obj:`spcm_dwGetErrorInfo_i32`.
+    If :obj:`None` (default), there are no details.
+
+  Attributes
+  ----------
+  error : :obj:`int`
+    The error code returned by the driver, including its origin bit.
+  code : :obj:`int`
+    The error code without its origin bit, for example :obj:`ERR_TIMEOUT`.
+  is_remote : :obj:`bool`
+    :obj:`True` if the error came from a remote (network) device.
+  """
+  def __init__(self, error, get_error_info = None):
+    super().__init__(error)
+    self.error = error
+    self.code = error & ~spcm.SPCM_ERROR_ORIGIN_MASK
+    self.is_remote = (error & spcm.SPCM_ERROR_ORIGIN_MASK) == spcm.SPCM_ERROR_ORIGIN_REMOTE
+    self._get_error_info = get_error_info
+    self._error_info = None
+
+  def _get_details(self):
+    if self._error_info is None:
+      if self._get_error_info is None:
+        self._error_info = (None, None, None)
+      else:
+        self._error_info = self._get_error_info()
+        # Let go of the card once the details are kept
+        self._get_error_info = None
+    return self._error_info
+
+  @property
+  def name(self):
+    """
+    :obj:`str`: The name of the error code, for example :obj:`"ERR_TIMEOUT"`.
+    """
+    return spcm_names.get_error_name(self.code)
+
+  @property
+  def description(self):
+    """
+    :obj:`str`: A description of the error, from the driver manual.
+    """
+    return _ERROR_DESCRIPTIONS.get(self.code, self.name)
+
+  @property
+  def register(self):
+    """
+    :obj:`int`: The register that was being accessed when the error occurred, fetched from the driver the first time it is used.
+    """
+    return self._get_details()[0]
+
+  @property
+  def value(self):
+    """
+    :obj:`int`: The value that was being written when the error occurred, fetched from the driver the first time it is used.
+    """
+    return self._get_details()[1]
+
+  @property
+  def driver_text(self):
+    """
+    :obj:`str`: The driver's own description of the error, fetched from the driver the first time it is used.
+    """
+    return self._get_details()[2]
+
+  def __str__(self):
+    message = f"Spectrum Instruments device error {self.error}:\n{'Remote' if self.is_remote else 'Local'} device error.\n{self.description}"
+    register, value, driver_text = self._get_details()
+    if register:
+      message += f"\nRegister {spcm_names.get_register_name(register)} ({register}), value {value}."
+    if driver_text:
+      message += f"\n{driver_text}"
+    return message
+
+class SpcmTimeout(SpcmError):
+  """
+  :obj:`ERR_TIMEOUT` or :obj:`ERR_NETWORKTIMEOUT`: A wait on the card took longer than :obj:`SPC_TIMEOUT`.
+  """
+
+class SpcmValueError(SpcmError, ValueError):
+  """
+  :obj:`ERR_VALUE` or :obj:`ERR_INVALIDPARAM`: A register was written with a value that is out of range.
+  Also a :obj:`ValueError`.
+  """
+
+class SpcmRunning(SpcmError):
+  """
+  :obj:`ERR_RUNNING`: The card is running, so the register cannot be written.
+  """
+
+class SpcmRegisterError(SpcmError):
+  """
+  :obj:`ERR_REG`: The register does not exist on this card.
+  """
+
+class SpcmFeatureError(SpcmError):
+  """
+  :obj:`ERR_FEATURE` or :obj:`ERR_FNCNOTSUPPORTED`: The card does not have the feature or option that was used.
+  """
+
+class SpcmSequenceError(SpcmError):
+  """
+  :obj:`ERR_SEQUENCE`: The command is not allowed in the current state of the card.
+  """
+
+class SpcmAbort(SpcmError):
+  """
+  :obj:`ERR_ABORT`: A wait was stopped by :obj:`M2CMD_CARD_STOP`.
+  """
+
+class SpcmFifoError(SpcmError):
+  """
+  :obj:`ERR_FIFOBUFOVERRUN`, :obj:`ERR_FIFOHWOVERRUN`, :obj:`ERR_FIFOFINISHED` or :obj:`ERR_FIFOSETUP`: A FIFO transfer failed or has finished.
+  """
+
+# The exception type raised for each error code, errors not listed here raise SpcmError
+_ERROR_TYPES = {
+  spcm.ERR_TIMEOUT : SpcmTimeout,
+  spcm.ERR_NETWORKTIMEOUT : SpcmTimeout,
+  spcm.ERR_VALUE : SpcmValueError,
+  spcm.ERR_INVALIDPARAM : SpcmValueError,
+  spcm.ERR_RUNNING : SpcmRunning,
+  spcm.ERR_REG : SpcmRegisterError,
+  spcm.ERR_FEATURE : SpcmFeatureError,
+  spcm.ERR_FNCNOTSUPPORTED : SpcmFeatureError,
+  spcm.ERR_SEQUENCE : SpcmSequenceError,
+  spcm.ERR_ABORT : SpcmAbort,
+  spcm.ERR_FIFOBUFOVERRUN : SpcmFifoError,
+  spcm.ERR_FIFOHWOVERRUN : SpcmFifoError,
+  spcm.ERR_FIFOFINISHED : SpcmFifoError,
+  spcm.ERR_FIFOSETUP : SpcmFifoError
+}
+
+def get_error_type(error):
+  """
+  Finds the exception type that is raised for an error code.
+
+  Parameters
+  ----------
+  error : :obj:`int`
+    The error code, with or without its origin bit.
+
+  Returns
+  -------
+  error_type : :obj:`type`
+    A subclass of :obj:`SpcmError`.
+  """
+  return _ERROR_TYPES.get(error & ~spcm.SPCM_ERROR_ORIGIN_MASK, SpcmError)
+
+# Descriptions of each error code, from the driver manual
+_ERROR_DESCRIPTIONS = {
+  spcm.ERR_INIT : "ERR_INIT: An error occurred when initializing the given card. Either the card has already been opened by another process or an hardware error occurred.",
+  spcm.ERR_NR : "ERR_NR",
+  spcm.ERR_TYP : "ERR_TYP: Initialization only: The type of board is unknown. This is a critical error. Please check whether the board is correctly plugged in the slot and whether you have the latest driver version.",
+  spcm.ERR_FNCNOTSUPPORTED : "ERR_FNCNOTSUPPORTED: This function is not supported by the hardware version.",
+  spcm.ERR_BRDREMAP : "ERR_BRDREMAP: The board index re map table in the registry is wrong. Either delete this table or check it carefully for double values.",
+  spcm.ERR_KERNELVERSION : "ERR_KERNELVERSION: The version of the kernel driver is not matching the version of the DLL. Please do a complete re-installation of the hardware driver. This error normally only occurs if someone copies the driver library and the kernel driver manually.",
+  spcm.ERR_HWDRVVERSION : "ERR_HWDRVVERSION: The hardware needs a newer driver version to run properly. Please install the driver that was delivered together with the card.",
+  spcm.ERR_ADRRANGE : "ERR_ADRRANGE: One of the address ranges is disabled (fatal error), can only occur under Linux.",
+  spcm.ERR_INVALIDHANDLE : "ERR_INVALIDHANDLE: The used handle is not valid.",
+  spcm.ERR_BOARDNOTFOUND : "ERR_BOARDNOTFOUND: A card with the given name has not been found.",
+  spcm.ERR_BOARDINUSE : "ERR_BOARDINUSE: A card with given name is already in use by another application.",
+  spcm.ERR_EXPHW64BITADR : "ERR_EXPHW64BITADR: Express hardware version not able to handle 64 bit addressing -> update needed.",
+  spcm.ERR_FWVERSION : "ERR_FWVERSION: Firmware versions of synchronized cards or for this driver do not match -> update needed.",
+  spcm.ERR_SYNCPROTOCOL : "ERR_SYNCPROTOCOL: Synchronization protocol versions of synchronized cards do not match -> update needed",
+  spcm.ERR_KERNEL : "ERR_KERNEL",
+  spcm.ERR_LASTERR : "ERR_LASTERR: Old error waiting to be read. Please read the full error information before proceeding. The driver is locked until the error information has been read.",
+  spcm.ERR_ABORT : "ERR_ABORT: Abort of wait function. This return value just tells that the function has been aborted from another thread. The driver library is not locked if this error occurs.",
+  spcm.ERR_BOARDLOCKED : "ERR_BOARDLOCKED: The card is already in access and therefore locked by another process. It is not possible to access one card through multiple processes. Only one process can access a specific card at the time.",
+  spcm.ERR_DEVICE_MAPPING : "ERR_DEVICE_MAPPING: The device is mapped to an invalid device. The device mapping can be accessed via the Control Center.",
+  spcm.ERR_NETWORKSETUP : "ERR_NETWORKSETUP: The network setup of a digitizerNETBOX has failed.",
+  spcm.ERR_NETWORKTRANSFER : "ERR_NETWORKTRANSFER: The network data transfer from/to a digitizerNETBOX has failed.",
+  spcm.ERR_FWPOWERCYCLE : "ERR_FWPOWERCYCLE: Power cycle (PC off/on) is needed to update the card's firmware (a simple OS reboot is not sufficient !)",
+  spcm.ERR_NETWORKTIMEOUT : "ERR_NETWORKTIMEOUT : A network timeout has occurred.",
+  spcm.ERR_BUFFERSIZE : "ERR_BUFFERSIZE: The buffer size is not sufficient (too small).",
+  spcm.ERR_RESTRICTEDACCESS : "ERR_RESTRICTEDACCESS: The access to the card has been intentionally restricted.",
+  spcm.ERR_INVALIDPARAM : "ERR_INVALIDPARAM: An invalid parameter has been used for a certain function.",
+  spcm.ERR_TEMPERATURE : "ERR_TEMPERATURE: The temperature of at least one of the card's sensors measures a temperature, that is too high for the hardware.",
+  spcm.ERR_FAN : "ERR_FAN",
+  spcm.ERR_REG : "ERR_REG: The register is not valid for this type of board",
+  spcm.ERR_VALUE : "ERR_VALUE: The value for this register is not in a valid range. The allowed values and ranges are listed in the board specific documentation.",
+  spcm.ERR_FEATURE : "RR_FEATURE: Feature (option) is not installed on this board. It's not possible to access this feature if it's not installed.",
+  spcm.ERR_SEQUENCE : "ERR_SEQUENCE: Command sequence is not allowed. Please check the manual carefully to see which command sequences are possible.",
+  spcm.ERR_READABORT : "ERR_READABORT: Data read is not allowed after aborting the data acquisition.",
+  spcm.ERR_NOACCESS : "ERR_NOACCESS: Access to this register is denied. This register is not accessible for users.",
+  spcm.ERR_POWERDOWN : "ERR_POWERDOWN",
+  spcm.ERR_TIMEOUT : "ERR_TIMEOUT: A timeout occurred while waiting for an interrupt. This error does not lock the driver.",
+  spcm.ERR_CALLTYPE : "ERR_CALLTYPE: The access to the register is only allowed with one 64 bit access but not with the multiplexed 32 bit (high and low double word) version.",
+  spcm.ERR_EXCEEDSINT32 : "ERR_EXCEEDSINT32: The return value is int32 but the software register exceeds the 32 bit integer range. Use double int32 or int64 accesses instead, to get correct return values.",
+  spcm.ERR_NOWRITEALLOWED : "ERR_NOWRITEALLOWED: The register that should be written is a read-only register. No write accesses are allowed.",
+  spcm.ERR_SETUP : "ERR_SETUP: The programmed setup for the card is not valid. The error register will show you which setting generates the error message. This error is returned if the card is started or the setup is written.",
+  spcm.ERR_CLOCKNOTLOCKED : "ERR_CLOCKNOTLOCKED: Synchronization to external clock failed: no signal connected or signal not stable. Please check external clock or try to use a different sampling clock to make the PLL locking easier.",
+  spcm.ERR_MEMINIT : "ERR_MEMINIT: On-board memory initialization error. Power cycle the PC and try another PCIe slot (if possible). In case that the error persists, please contact Spectrum support for further assistance.",
+  spcm.ERR_POWERSUPPLY : "ERR_POWERSUPPLY: On-board power supply error. Power cycle the PC and try another PCIe slot (if possible). In case that the error persists, please contact Spectrum support for further assistance.",
+  spcm.ERR_ADCCOMMUNICATION : "ERR_ADCCOMMUNICATION: Communication with ADC failed.P ower cycle the PC and try another PCIe slot (if possible). In case that the error persists, please contact Spectrum support for further assistance.",
+  spcm.ERR_CHANNEL : "ERR_CHANNEL: The channel number may not be accessed on the board: Either it is not a valid channel number or the channel is not accessible due to the current setup (e.g. Only channel 0 is accessible in interlace mode) ",
+  spcm.ERR_NOTIFYSIZE : "ERR_NOTIFYSIZE: The notify size of the last spcm_dwDefTransfer call is not valid. The notify size must be a multiple of the page size of 4096. For data transfer it may also be a fraction of 4k in the range of 16, 32, 64, 128, 256, 512, 1k or 2k. For ABA and timestamp the notify size can be 2k as a minimum.",
+  spcm.ERR_RUNNING : "ERR_RUNNING: The board is still running, this function is not available now or this register is not accessible now.",
+  spcm.ERR_ADJUST : "ERR_ADJUST: Automatic card calibration has reported an error. Please check the card inputs.",
+  spcm.ERR_PRETRIGGERLEN : "ERR_PRETRIGGERLEN: The calculated pretrigger size (resulting from the user defined posttrigger values) exceeds the allowed limit.",
+  spcm.ERR_DIRMISMATCH : "ERR_DIRMISMATCH: The direction of card and memory transfer mismatch. In normal operation mode it is not possible to transfer data from PC memory to card if the card is an acquisition card nor it is possible to transfer data from card to PC memory if the card is a generation card.",
+  spcm.ERR_POSTEXCDSEGMENT : "ERR_POSTEXCDSEGMENT: The posttrigger value exceeds the programmed segment size in multiple recording/ABA mode. A delay of the multiple recording segments is only possible by using the delay trigger!",
+  spcm.ERR_SEGMENTINMEM : "ERR_SEGMENTINMEM: Memsize is not a multiple of segment size when using Multiple Recording/Replay or ABA mode. The programmed segment size must match the programmed memory size.",
+  spcm.ERR_MULTIPLEPW : "ERR_MULTIPLEPW: Multiple pulsewidth counters used but card only supports one at the time.",
+  spcm.ERR_NOCHANNELPWOR : "ERR_NOCHANNELPWOR: The channel pulsewidth on this card can’t be used together with the OR conjunction. Please use the AND conjunction of the channel trigger sources.",
+  spcm.ERR_ANDORMASKOVRLAP : "ERR_ANDORMASKOVRLAP: Trigger AND mask and OR mask overlap in at least one channel. Each trigger source can only be used either in the AND mask or in the OR mask, no source can be used for both.",
+  spcm.ERR_ANDMASKEDGE : "RR_ANDMASKEDGE: One channel is activated for trigger detection in the AND mask but has been programmed to a trigger mode using an edge trigger. The AND mask can only work with level trigger modes.",
+  spcm.ERR_ORMASKLEVEL : "RR_ORMASKLEVEL: One channel is activated for trigger detection in the OR mask but has been programmed to a trigger mode using a level trigger. The OR mask can only work together with edge trigger modes.",
+  spcm.ERR_EDGEPERMOD : "ERR_EDGEPERMOD: This card is only capable to have one programmed trigger edge for each module that is installed. It is not possible to mix different trigger edges on one module.",
+  spcm.ERR_DOLEVELMINDIFF : "ERR_DOLEVELMINDIFF: The minimum difference between low output level and high output level is not reached.",
+  spcm.ERR_STARHUBENABLE : "ERR_STARHUBENABLE: The card holding the star-hub must be enabled when doing synchronization",
+  spcm.ERR_PATPWSMALLEDGE : "ERR_PATPWSMALLEDGE: Combination of pattern with pulsewidth smaller and edge is not allowed.",
+  spcm.ERR_XMODESETUP : "ERR_XMODESETUP: The chosen setup for (SPCM_X0_MODE .. SPCM_X19_MODE) is not valid. See hardware manual for details.",
+  spcm.ERR_AVRG_TDA : "ERR_AVRG_LSA: Setup for Average LSA Mode not valid. Check Threshold and Replacement values for chosen AVRGMODE.",
+  spcm.ERR_NOPCI : "ERR_NOPCI",
+  spcm.ERR_PCIVERSION : "ERR_PCIVERSION",
+  spcm.ERR_PCINOBOARDS : "ERR_PCINOBOARDS",
+  spcm.ERR_PCICHECKSUM : "ERR_PCICHECKSUM: The check sum of the card information has failed. This could be a critical hardware failure. Restart the system and check the connection of the card in the slot.",
+  spcm.ERR_DMALOCKED : "ERR_DMALOCKED",
+  spcm.ERR_MEMALLOC : "ERR_MEMALLOC: Internal memory allocation failed. Please restart the system and be sure that there is enough free memory.",
+  spcm.ERR_EEPROMLOAD : "ERR_EEPROMLOAD: Timeout occurred while loading information from the on-board EEProm. This could be a critical hardware failure. Please restart the system and check the PCI connector.",
+  spcm.ERR_CARDNOSUPPORT : "ERR_CARDNOSUPPORT: The card that has been found in the system seems to be a valid Spectrum card of a type that is supported by the driver but the driver did not find this special type internally. Please get the latest driver from www.spectrum-instrumentation.com and install this one.",
+  spcm.ERR_CONFIGACCESS : "ERR_CONFIGACCESS: Internal error occured during config writes or reads. Please contact Spectrum support for further assistance",
+  spcm.ERR_FIFOBUFOVERRUN : "ERR_FIFOBUFOVERRUN",
+  spcm.ERR_FIFOHWOVERRUN : "ERR_FIFOHWOVERRUN: FIFO acquisition: Hardware buffer overrun in FIFO mode. The complete on-board memory has been filled with data and data wasn’t transferred fast enough to PC memory. FIFO replay: Hardware buffer underrun in FIFO mode. The complete on-board memory has been replayed and data wasn’t transferred fast enough from PC memory. If acquisition or replay throughput is lower than the theoretical bus throughput, check the application buffer setup.",
+  spcm.ERR_FIFOFINISHED : "ERR_FIFOFINISHED: FIFO transfer has been finished, programmed data length has been transferred completely.",
+  spcm.ERR_FIFOSETUP : "ERR_FIFOSETUP",
+  spcm.ERR_TIMESTAMP_SYNC : "ERR_TIMESTAMP_SYNC: Synchronization to timestamp reference clock failed. Please check the connection and the signal levels of the reference clock input.",
+  spcm.ERR_STARHUB : "ERR_STARHUB: The auto routing function of the Star-Hub initialization has failed. Please check whether all cables are mounted correctly",
+  spcm.ERR_INTERNAL_ERROR : "ERR_INTERNAL_ERROR: Internal hardware error detected. Please check for driver and firmware update of the card."
+}
@@ -1,13 +1,9 @@
 import os
-import platform
 import sys 
 from ctypes import *
 
-# load registers for easier access
-from spectrum_card.spectrum_header.py_header.regs import *
-
-# load registers for easier access
-from spectrum_card.spectrum_header.py_header.spcerr import *
+# registers (regs) and error codes (spcerr) are loaded the first time one of them is asked for, see __getattr__
+_constant_modules = None
 
 SPCM_DIR_PCTOCARD = 0
 SPCM_DIR_CARDTOPC = 1
@@ -18,8 +14,8 @@ SPCM_BUF_TIMESTAMP = 3000 # buffer for timestamps
 
 
 # determine bit width of os
-oPlatform = platform.architecture()
-if (oPlatform[0] == '64bit'):
+# (from the size of a pointer, as platform.architecture () takes longer than the rest of the import)
+if (sys.maxsize > 2**32):
     bIs64Bit = 1
 else:
     bIs64Bit = 0
@@ -45,7 +41,40 @@ uptr16 = POINTER (uint16)
 uptr32 = POINTER (uint32)
 uptr64 = POINTER (uint64)
 
-try:
+# names of the driver functions, which are bound when the library is loaded
+_FUNCTION_NAMES = (
+    "spcm_hOpen",
+    "spcm_vClose",
+    "spcm_dwGetErrorInfo_i32",
+    "spcm_dwGetParam_i32",
+    "spcm_dwGetParam_i64",
+    "spcm_dwSetParam_i32",
+    "spcm_dwSetParam_i64",
+    "spcm_dwSetParam_i64m",
+    "spcm_dwDefTransfer_i64",
+    "spcm_dwInvalidateBuf",
+    "spcm_dwGetContBuf_i64",
+)
+
+_is_loaded = False
+
+def load_library ():
+    """
+    Loads the driver library and binds the driver functions to this module.
+    This is done the first time a driver function is used (or a card is opened), rather than on import, so that the package can be imported on machines without the driver.
+    Raises an :obj:`OSError` if the library cannot be found.
+
+    Returns
+    -------
+    driver : :obj:`module`
+      This module, with the driver functions bound.
+    """
+    global _is_loaded
+    global drv_handle, spcmDll
+    global spcm_hOpen, spcm_vClose, spcm_dwGetErrorInfo_i32, spcm_dwGetParam_i32, spcm_dwGetParam_i64, spcm_dwSetParam_i32
+    global spcm_dwSetParam_i64, spcm_dwSetParam_i64_, spcm_dwSetParam_i64m, spcm_dwDefTransfer_i64, spcm_dwInvalidateBuf, spcm_dwGetContBuf_i64
+    if _is_loaded:
+        return sys.modules[__name__]
     # Windows
     if os.name == 'nt':
         # sys.stdout.write("Python Version: {0} on Windows\n\n".format (platform.python_version()))
@@ -69,7 +98,7 @@ try:
             spcm_hOpen = getattr (spcmDll, "spcm_hOpen")
         else:
             spcm_hOpen = getattr (spcmDll, "_spcm_hOpen@4")
-        spcm_hOpen.argtype = [c_char_p]
+        spcm_hOpen.argtypes = [c_char_p]
         spcm_hOpen.restype = drv_handle 
 
         # load spcm_vClose
@@ -77,7 +106,7 @@ try:
             spcm_vClose = getattr (spcmDll, "spcm_vClose")
         else:
             spcm_vClose = getattr (spcmDll, "_spcm_vClose@4")
-        spcm_vClose.argtype = [drv_handle]
+        spcm_vClose.argtypes = [drv_handle]
         spcm_vClose.restype = None
 
         # load spcm_dwGetErrorInfo
@@ -85,7 +114,7 @@ try:
             spcm_dwGetErrorInfo_i32 = getattr (spcmDll, "spcm_dwGetErrorInfo_i32")
         else:
             spcm_dwGetErrorInfo_i32 = getattr (spcmDll, "_spcm_dwGetErrorInfo_i32@16")
-        spcm_dwGetErrorInfo_i32.argtype = [drv_handle, uptr32, ptr32, c_char_p]
+        spcm_dwGetErrorInfo_i32.argtypes = [drv_handle, uptr32, ptr32, c_char_p]
         spcm_dwGetErrorInfo_i32.restype = uint32
 
         # load spcm_dwGetParam_i32
@@ -93,7 +122,7 @@ try:
             spcm_dwGetParam_i32 = getattr (spcmDll, "spcm_dwGetParam_i32")
         else:
             spcm_dwGetParam_i32 = getattr (spcmDll, "_spcm_dwGetParam_i32@12")
-        spcm_dwGetParam_i32.argtype = [drv_handle, int32, ptr32]
+        spcm_dwGetParam_i32.argtypes = [drv_handle, int32, ptr32]
         spcm_dwGetParam_i32.restype = uint32
 
         # load spcm_dwGetParam_i64
@@ -101,7 +130,7 @@ try:
             spcm_dwGetParam_i64 = getattr (spcmDll, "spcm_dwGetParam_i64")
         else:
             spcm_dwGetParam_i64 = getattr (spcmDll, "_spcm_dwGetParam_i64@12")
-        spcm_dwGetParam_i64.argtype = [drv_handle, int32, ptr64]
+        spcm_dwGetParam_i64.argtypes = [drv_handle, int32, ptr64]
         spcm_dwGetParam_i64.restype = uint32
 
         # load spcm_dwSetParam_i32
@@ -109,7 +138,7 @@ try:
             spcm_dwSetParam_i32 = getattr (spcmDll, "spcm_dwSetParam_i32")
         else:
             spcm_dwSetParam_i32 = getattr (spcmDll, "_spcm_dwSetParam_i32@12")
-        spcm_dwSetParam_i32.argtype = [drv_handle, int32, int32]
+        spcm_dwSetParam_i32.argtypes = [drv_handle, int32, int32]
         spcm_dwSetParam_i32.restype = uint32
 
         # load spcm_dwSetParam_i64
@@ -117,7 +146,7 @@ try:
             spcm_dwSetParam_i64_ = getattr (spcmDll, "spcm_dwSetParam_i64")
         else:
             spcm_dwSetParam_i64_ = getattr (spcmDll, "_spcm_dwSetParam_i64@16")
-        spcm_dwSetParam_i64_.argtype = [drv_handle, int32, int64]
+        spcm_dwSetParam_i64_.argtypes = [drv_handle, int32, int64]
         spcm_dwSetParam_i64_.restype = uint32
         
         def spcm_dwSetParam_i64 (hDrv, lReg, Val):
@@ -132,7 +161,7 @@ try:
             spcm_dwSetParam_i64m = getattr (spcmDll, "spcm_dwSetParam_i64m")
         else:
             spcm_dwSetParam_i64m = getattr (spcmDll, "_spcm_dwSetParam_i64m@16")
-        spcm_dwSetParam_i64m.argtype = [drv_handle, int32, int32, int32]
+        spcm_dwSetParam_i64m.argtypes = [drv_handle, int32, int32, int32]
         spcm_dwSetParam_i64m.restype = uint32
 
         # load spcm_dwDefTransfer_i64
@@ -140,7 +169,7 @@ try:
             spcm_dwDefTransfer_i64 = getattr (spcmDll, "spcm_dwDefTransfer_i64")
         else:
             spcm_dwDefTransfer_i64 = getattr (spcmDll, "_spcm_dwDefTransfer_i64@36")
-        spcm_dwDefTransfer_i64.argtype = [drv_handle, uint32, uint32, uint32, c_void_p, uint64, uint64]
+        spcm_dwDefTransfer_i64.argtypes = [drv_handle, uint32, uint32, uint32, c_void_p, uint64, uint64]
         spcm_dwDefTransfer_i64.restype = uint32
 
         # load spcm_dwInvalidateBuf
@@ -148,7 +177,7 @@ try:
             spcm_dwInvalidateBuf = getattr (spcmDll, "spcm_dwInvalidateBuf")
         else:
             spcm_dwInvalidateBuf = getattr (spcmDll, "_spcm_dwInvalidateBuf@8")
-        spcm_dwInvalidateBuf.argtype = [drv_handle, uint32]
+        spcm_dwInvalidateBuf.argtypes = [drv_handle, uint32]
         spcm_dwInvalidateBuf.restype = uint32
 
         # load spcm_dwGetContBuf_i64
@@ -156,7 +185,7 @@ try:
             spcm_dwGetContBuf_i64 = getattr (spcmDll, "spcm_dwGetContBuf_i64")
         else:
             spcm_dwGetContBuf_i64 = getattr (spcmDll, "_spcm_dwGetContBuf_i64@16")
-        spcm_dwGetContBuf_i64.argtype = [drv_handle, uint32, POINTER(c_void_p), uptr64]
+        spcm_dwGetContBuf_i64.argtypes = [drv_handle, uint32, POINTER(c_void_p), uptr64]
         spcm_dwGetContBuf_i64.restype = uint32
 
 
@@ -175,60 +204,88 @@ try:
 
         # load spcm_hOpen
         spcm_hOpen = getattr (spcmDll, "spcm_hOpen")
-        spcm_hOpen.argtype = [c_char_p]
+        spcm_hOpen.argtypes = [c_char_p]
         spcm_hOpen.restype = drv_handle 
 
         # load spcm_vClose
         spcm_vClose = getattr (spcmDll, "spcm_vClose")
-        spcm_vClose.argtype = [drv_handle]
+        spcm_vClose.argtypes = [drv_handle]
         spcm_vClose.restype = None
 
         # load spcm_dwGetErrorInfo
         spcm_dwGetErrorInfo_i32 = getattr (spcmDll, "spcm_dwGetErrorInfo_i32")
-        spcm_dwGetErrorInfo_i32.argtype = [drv_handle, uptr32, ptr32, c_char_p]
+        spcm_dwGetErrorInfo_i32.argtypes = [drv_handle, uptr32, ptr32, c_char_p]
         spcm_dwGetErrorInfo_i32.restype = uint32
 
         # load spcm_dwGetParam_i32
         spcm_dwGetParam_i32 = getattr (spcmDll, "spcm_dwGetParam_i32")
-        spcm_dwGetParam_i32.argtype = [drv_handle, int32, ptr32]
+        spcm_dwGetParam_i32.argtypes = [drv_handle, int32, ptr32]
         spcm_dwGetParam_i32.restype = uint32
 
         # load spcm_dwGetParam_i64
         spcm_dwGetParam_i64 = getattr (spcmDll, "spcm_dwGetParam_i64")
-        spcm_dwGetParam_i64.argtype = [drv_handle, int32, ptr64]
+        spcm_dwGetParam_i64.argtypes = [drv_handle, int32, ptr64]
         spcm_dwGetParam_i64.restype = uint32
 
         # load spcm_dwSetParam_i32
         spcm_dwSetParam_i32 = getattr (spcmDll, "spcm_dwSetParam_i32")
-        spcm_dwSetParam_i32.argtype = [drv_handle, int32, int32]
+        spcm_dwSetParam_i32.argtypes = [drv_handle, int32, int32]
         spcm_dwSetParam_i32.restype = uint32
 
         # load spcm_dwSetParam_i64
         spcm_dwSetParam_i64 = getattr (spcmDll, "spcm_dwSetParam_i64")
-        spcm_dwSetParam_i64.argtype = [drv_handle, int32, int64]
+        spcm_dwSetParam_i64.argtypes = [drv_handle, int32, int64]
         spcm_dwSetParam_i64.restype = uint32
 
         # load spcm_dwSetParam_i64m
         spcm_dwSetParam_i64m = getattr (spcmDll, "spcm_dwSetParam_i64m")
-        spcm_dwSetParam_i64m.argtype = [drv_handle, int32, int32, int32]
+        spcm_dwSetParam_i64m.argtypes = [drv_handle, int32, int32, int32]
         spcm_dwSetParam_i64m.restype = uint32
 
         # load spcm_dwDefTransfer_i64
         spcm_dwDefTransfer_i64 = getattr (spcmDll, "spcm_dwDefTransfer_i64")
-        spcm_dwDefTransfer_i64.argtype = [drv_handle, uint32, uint32, uint32, c_void_p, uint64, uint64]
+        spcm_dwDefTransfer_i64.argtypes = [drv_handle, uint32, uint32, uint32, c_void_p, uint64, uint64]
         spcm_dwDefTransfer_i64.restype = uint32
 
         # load spcm_dwInvalidateBuf
         spcm_dwInvalidateBuf = getattr (spcmDll, "spcm_dwInvalidateBuf")
-        spcm_dwInvalidateBuf.argtype = [drv_handle, uint32]
+        spcm_dwInvalidateBuf.argtypes = [drv_handle, uint32]
         spcm_dwInvalidateBuf.restype = uint32
 
         # load spcm_dwGetContBuf_i64
         spcm_dwGetContBuf_i64 = getattr (spcmDll, "spcm_dwGetContBuf_i64")
-        spcm_dwGetContBuf_i64.argtype = [drv_handle, uint32, POINTER(c_void_p), uptr64]
+        spcm_dwGetContBuf_i64.argtypes = [drv_handle, uint32, POINTER(c_void_p), uptr64]
         spcm_dwGetContBuf_i64.restype = uint32
 
     else:
         raise Exception ('Operating system not supported by pySpcm')
-except Exception as exception:
-    print(exception)
\ No newline at end of file
+
+    _is_loaded = True
+    return sys.modules[__name__]
+
+def _get_constant_modules ():
+    global _constant_modules
+    if _constant_modules is None:
+        from spectrum_card.spectrum_header.py_header import regs, spcerr
+        _constant_modules = (regs, spcerr)
+    return _constant_modules
+
+def __getattr__ (name):
+    # load the library the first time one of its functions is asked for
+    if name in _FUNCTION_NAMES:
+        load_library ()
+        return globals ()[name]
+    # look up registers and error codes, and keep them in this module so that the next look up is direct
+    if not name.startswith ("__"):
+        for module in _get_constant_modules ():
+            if name in module.__dict__:
+                value = module.__dict__[name]
+                globals ()[name] = value
+                return value
+    raise AttributeError ("module {0!r} has no attribute {1!r}".format (__name__, name))
+
+def __dir__ ():
+    names = set (globals ())
+    for module in _get_constant_modules ():
+        names.update (name for name in vars (module) if not name.startswith ("_"))
+    return sorted (names)
@@ -0,0 +1,106 @@
+"""
+A registry of driver backends that :obj:`spectrum_card.Card` can be opened with.
+
+A backend is any object with the driver functions of :obj:`pyspcm` (:obj:`spcm_hOpen`, :obj:`spcm_dwGetParam_i32`, etc.).
+Backends are registered by name with a factory, and are only created the first time they are asked for, so that nothing is loaded on import.
+Each backend is created once, and the time taken to create it (for the real driver, the time taken to load and bind the library) is kept in :obj:`load_times`.
+
+The built in backends are
+
+* :obj:`"driver"`: the driver library, through :obj:`pyspcm`.
+* :obj:`"simulated"`: a :obj:`spcm_simulated.SimulatedDriver`.
+* :obj:`"recording"`: a :obj:`spcm_recording.RecordingDriver` around the driver library.
+
+The backend used by default is :obj:`"driver"`, unless the environment variable :obj:`SPECTRUM_CARD_BACKEND` names a different one, or :obj:`set_default_backend` is called.
+"""
+
+import os
+import time
+
+_factories = {}
+_backends = {}
+load_times = {}
+_default_backend = os.environ.get("SPECTRUM_CARD_BACKEND", "driver")
+
+def register_backend(name, factory):
+  """
+  Registers a backend.
+  Any backend already created under the same name is forgotten.
+
+  Parameters
+  ----------
+  name : :obj:`str`
+    The name the backend is asked for by.
+  factory : :obj:`callable`
+    Called with no arguments to create the backend.
+  """
+  _factories[name] = factory
+  _backends.pop(name, None)
+  load_times.pop(name, None)
+
+def get_backend(name = None):
+  """
+  Finds a backend, creating it if this is the first time it has been asked for.
+
+  Parameters
+  ----------
+  name : :obj:`str`
+    The name of the backend.
+    If :obj:`None` (default), uses the default backend.
+
+  Returns
+  -------
+  backend : :obj:`object`
+    An object with the driver functions of :obj:`pyspcm`.
+  """
+  if name is None:
+    name = _default_backend
+  backend = _backends.get(name)
+  if backend is None:
+    if name not in _factories:
+      raise ValueError(f"No driver backend called \"{name}\". Available backends are {list(_factories)}.")
+    start_time = time.perf_counter()
+    backend = _factories[name]()
+    load_times[name] = time.perf_counter() - start_time
+    _backends[name] = backend
+  return backend
+
+def set_default_backend(name):
+  """
+  Chooses the backend that is used when a :obj:`spectrum_card.Card` is opened without one.
+
+  Parameters
+  ----------
+  name : :obj:`str`
+    The name of a registered backend.
+  """
+  global _default_backend
+  if name not in _factories:
+    raise ValueError(f"No driver backend called \"{name}\". Available backends are {list(_factories)}.")
+  _default_backend = name
+
+def get_available_backends():
+  """
+  Lists the names of every registered backend.
+
+  Returns
+  -------
+  names : :obj:`list` of :obj:`str`
+  """
+  return list(_factories)
+
+def _load_driver():
+  from spectrum_card.spectrum_header import pyspcm
+  return pyspcm.load_library()
+
+def _load_simulated():
+  from spectrum_card.spectrum_header import spcm_simulated
+  return spcm_simulated.SimulatedDriver()
+
+def _load_recording():
+  from spectrum_card.spectrum_header import spcm_recording
+  return spcm_recording.RecordingDriver(get_backend("driver"))
+
+register_backend("driver", _load_driver)
+register_backend("simulated", _load_simulated)
+register_backend("recording", _load_recording)
@@ -0,0 +1,158 @@
+"""
+A reverse index from the values of the constants in :obj:`regs` and :obj:`spcerr` back to their names.
+
+Many values are shared by constants of different kinds (for example, :obj:`SPC_M2CMD` and :obj:`M2CMD_CARD_RESET` are unrelated, but :obj:`SPC_TMASK_EXT0` and :obj:`SPC_REP_STD_MULTI` are both :obj:`2`), so each constant is filed under a namespace, which is the longest of the prefixes in :obj:`NAMESPACES` that its name starts with.
+Constants that match none of them are filed under :obj:`""`.
+Within a namespace, a constant that is defined later in :obj:`regs` supersedes an earlier one with the same value, as later definitions are the current names for legacy registers.
+
+The index is built the first time it is used, after which each look up is a :obj:`dict` access.
+"""
+
+NAMESPACES = (
+  "SPC_",           # Registers
+  "SPC_REP_",       # Replay modes
+  "SPC_REC_",       # Recording modes
+  "SPC_CM_",        # Clock modes
+  "SPC_TM_",        # Trigger modes
+  "SPC_TMASK",      # Trigger masks
+  "SPCM_",          # Registers
+  "SPCM_X",         # IO port registers
+  "SPCM_XMODE_",    # IO port modes
+  "SPCM_FEAT_",     # Features
+  "SPCM_STOPLVL_",  # Stop levels
+  "SPCSEQ_",        # Sequence step flags
+  "M2CMD_",         # Commands
+  "M2STAT_",        # Status flags
+  "ERR_",           # Error codes
+  "TYP_",           # Card types
+  "DRVTYP_"         # Driver types
+)
+
+# Namespaces that registers are looked up in, in order of preference
+REGISTER_NAMESPACES = ("SPC_", "SPCM_X", "SPCM_")
+
+_index = None
+
+def _get_namespace(name):
+  namespace = ""
+  for prefix in NAMESPACES:
+    if name.startswith(prefix) and len(prefix) > len(namespace):
+      namespace = prefix
+  return namespace
+
+def get_index():
+  """
+  Finds the reverse index, building it if this is the first time it has been asked for.
+
+  Returns
+  -------
+  index : :obj:`dict` of :obj:`str` to :obj:`dict` of :obj:`int` to :obj:`str`
+    For each namespace, a :obj:`dict` from the value of each constant to its name.
+  """
+  global _index
+  if _index is None:
+    from spectrum_card.spectrum_header.py_header import regs
+    from spectrum_card.spectrum_header.py_header import spcerr
+
+    index = {namespace : {} for namespace in NAMESPACES + ("",)}
+    for module in (regs, spcerr):
+      for name, value in vars(module).items():
+        if name.startswith("_") or not name.isupper() or not isinstance(value, int):
+          continue
+        index[_get_namespace(name)][value] = name
+    _index = index
+  return _index
+
+def get_name(value, namespace):
+  """
+  Looks up the name of a constant.
+
+  Parameters
+  ----------
+  value : :obj:`int`
+    Value of the constant.
+  namespace : :obj:`str`
+    One of :obj:`NAMESPACES`, such as :obj:`"M2STAT_"`.
+
+  Returns
+  -------
+  name : :obj:`str`
+    The name of the constant, or :obj:`None` if there is none with that value in the namespace.
+  """
+  return get_index()[namespace].get(value)
+
+def get_names(value):
+  """
+  Looks up the names of every constant with a value, in any namespace.
+
+  Parameters
+  ----------
+  value : :obj:`int`
+    Value of the constants.
+
+  Returns
+  -------
+  names : :obj:`dict` of :obj:`str` to :obj:`str`
+    The name of the constant with that value in each namespace that has one.
+  """
+  names = {}
+  for namespace, namespace_index in get_index().items():
+    name = namespace_index.get(value)
+    if name is not None:
+      names[namespace] = name
+  return names
+
+def get_register_name(address):
+  """
+  Looks up the name of a register.
+
+  Parameters
+  ----------
+  address : :obj:`int`
+    The register, for example :obj:`349940`.
+
+  Returns
+  -------
+  name : :obj:`str`
+    The name of the register, for example :obj:`"SPC_SEQMODE_SEGMENTSIZE"`, or the address as a :obj:`str` if it has no name.
+  """
+  index = get_index()
+  for namespace in REGISTER_NAMESPACES:
+    name = index[namespace].get(address)
+    if name is not None:
+      return name
+  return str(address)
+
+def get_command_name(command):
+  """
+  Decodes an :obj:`SPC_M2CMD` bit code into the names of its commands.
+
+  Parameters
+  ----------
+  command : :obj:`int`
+    Bit code of :obj:`M2CMD` commands.
+
+  Returns
+  -------
+  name : :obj:`str`
+    Names of the commands joined by :obj:`" | "`, for example :obj:`"M2CMD_CARD_START | M2CMD_CARD_ENABLETRIGGER"`.
+  """
+  names = [name for value, name in get_index()["M2CMD_"].items() if value and value & (value - 1) == 0 and command & value]
+  return " | ".join(names) if names else str(command)
+
+def get_error_name(error):
+  """
+  Looks up the name of an error code.
+
+  Parameters
+  ----------
+  error : :obj:`int`
+    The error code, without its origin bits.
+
+  Returns
+  -------
+  name : :obj:`str`
+    The name of the error, for example :obj:`"ERR_TIMEOUT"`, or the code as a :obj:`str` if it has no name.
+  """
+  name = get_index()["ERR_"].get(error)
+  return str(error) if name is None else name
@@ -0,0 +1,339 @@
+"""
+Recording and replaying driver calls.
+
+:obj:`RecordingDriver` passes every call through to another backend, and records it.
+Recorded calls can be saved to a compact binary trace file with :obj:`save_trace`, loaded again with :obj:`load_trace`, and played back through a :obj:`ReplayDriver`, which stands in for the driver and answers each call the way it was answered when it was recorded.
+
+A trace file starts with :obj:`TRACE_MAGIC`, followed by one little endian :obj:`"<BIqIqqH"` entry per call: the index of the function in :obj:`FUNCTION_NAMES`, the register, the value, the error code, the start and end times in ns, and the length of the text that follows the entry (the error text of :obj:`spcm_dwGetErrorInfo_i32`, and empty for other calls).
+Traces saved in the first version of the format, which had no text, can still be loaded.
+"""
+
+import collections
+import ctypes
+import struct
+import time
+
+FUNCTION_NAMES = (
+  "spcm_hOpen",
+  "spcm_vClose",
+  "spcm_dwGetErrorInfo_i32",
+  "spcm_dwGetParam_i32",
+  "spcm_dwGetParam_i64",
+  "spcm_dwSetParam_i32",
+  "spcm_dwSetParam_i64",
+  "spcm_dwSetParam_i64m",
+  "spcm_dwDefTransfer_i64",
+  "spcm_dwInvalidateBuf",
+  "spcm_dwGetContBuf_i64"
+)
+_FUNCTION_INDICES = {function : function_index for function_index, function in enumerate(FUNCTION_NAMES)}
+
+TRACE_MAGIC = b"SPCMTRACE\x02"
+_TRACE_ENTRY = struct.Struct("<BIqIqqH")
+
+# The first version of the format, without error text
+_TRACE_MAGIC_VERSION_1 = b"SPCMTRACE\x01"
+_TRACE_ENTRY_VERSION_1 = struct.Struct("<BIqIqq")
+
+DriverCall = collections.namedtuple("DriverCall", ["function", "register", "value", "error", "start_time", "end_time", "text"], defaults = (b"",))
+DriverCall.__doc__ = """
+One recorded driver call.
+
+Attributes
+----------
+function : :obj:`str`
+  Name of the driver function, for example :obj:`"spcm_dwGetParam_i32"`.
+register : :obj:`int`
+  The register that was read or written.
+  For :obj:`spcm_dwDefTransfer_i64`, :obj:`spcm_dwInvalidateBuf` and :obj:`spcm_dwGetContBuf_i64`, the buffer type (for example :obj:`SPCM_BUF_DATA`), and for :obj:`spcm_dwGetErrorInfo_i32`, the register the error was raised for.
+  :obj:`0` for functions that take neither.
+value : :obj:`int`
+  The value that was written, the value that was read back, or for :obj:`spcm_dwDefTransfer_i64`, the number of bytes.
+error : :obj:`int`
+  The error code returned by the driver.
+start_time : :obj:`int`
+  When the call started, in ns from :obj:`time.perf_counter_ns`.
+end_time : :obj:`int`
+  When the call returned, in ns from :obj:`time.perf_counter_ns`.
+text : :obj:`bytes`
+  For :obj:`spcm_dwGetErrorInfo_i32`, the error text written by the driver, otherwise empty.
+"""
+
+def _value_of(argument):
+  argument = getattr(argument, "_obj", argument)
+  return getattr(argument, "value", argument)
+
+class RecordingDriver:
+  """
+  Wraps a driver backend, and records each call made through it to :obj:`calls`.
+
+  Parameters
+  ----------
+  driver : :obj:`object`
+    The backend that calls are passed through to, such as :obj:`pyspcm` or a :obj:`spcm_simulated.SimulatedDriver`.
+  """
+  def __init__(self, driver):
+    self.driver = driver
+    self.calls = []
+
+  def _record(self, function, register, value, error, start_time, text = b""):
+    self.calls.append(DriverCall(function, register, value, 0 if error is None else int(error), start_time, time.perf_counter_ns(), text))
+
+  def clear(self):
+    """
+    Forgets every recorded call.
+    """
+    self.calls.clear()
+
+  def spcm_hOpen(self, device_address):
+    start_time = time.perf_counter_ns()
+    handle = self.driver.spcm_hOpen(device_address)
+    self._record("spcm_hOpen", 0, 0 if handle is None else 1, 0, start_time)
+    return handle
+
+  def spcm_vClose(self, handle):
+    start_time = time.perf_counter_ns()
+    self.driver.spcm_vClose(handle)
+    self._record("spcm_vClose", 0, 0, 0, start_time)
+
+  def spcm_dwGetErrorInfo_i32(self, handle, error_register, error_value, error_text):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwGetErrorInfo_i32(handle, error_register, error_value, error_text)
+    self._record("spcm_dwGetErrorInfo_i32", _value_of(error_register) or 0, _value_of(error_value) or 0, error, start_time, b"" if error_text is None else error_text.value)
+    return error
+
+  def spcm_dwGetParam_i32(self, handle, register, response):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwGetParam_i32(handle, register, response)
+    self._record("spcm_dwGetParam_i32", register, _value_of(response), error, start_time)
+    return error
+
+  def spcm_dwGetParam_i64(self, handle, register, response):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwGetParam_i64(handle, register, response)
+    self._record("spcm_dwGetParam_i64", register, _value_of(response), error, start_time)
+    return error
+
+  def spcm_dwSetParam_i32(self, handle, register, value):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwSetParam_i32(handle, register, value)
+    self._record("spcm_dwSetParam_i32", register, _value_of(value), error, start_time)
+    return error
+
+  def spcm_dwSetParam_i64(self, handle, register, value):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwSetParam_i64(handle, register, value)
+    self._record("spcm_dwSetParam_i64", register, _value_of(value), error, start_time)
+    return error
+
+  def spcm_dwSetParam_i64m(self, handle, register, value_high, value_low):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwSetParam_i64m(handle, register, value_high, value_low)
+    self._record("spcm_dwSetParam_i64m", register, (_value_of(value_high) << 32) | (_value_of(value_low) & 0xFFFFFFFF), error, start_time)
+    return error
+
+  def spcm_dwDefTransfer_i64(self, handle, buffer_type, direction, notify_size, host_address, device_address, size):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwDefTransfer_i64(handle, buffer_type, direction, notify_size, host_address, device_address, size)
+    self._record("spcm_dwDefTransfer_i64", _value_of(buffer_type), _value_of(size), error, start_time)
+    return error
+
+  def spcm_dwInvalidateBuf(self, handle, buffer_type):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwInvalidateBuf(handle, buffer_type)
+    self._record("spcm_dwInvalidateBuf", _value_of(buffer_type), 0, error, start_time)
+    return error
+
+  def spcm_dwGetContBuf_i64(self, handle, buffer_type, data_pointer, length):
+    start_time = time.perf_counter_ns()
+    error = self.driver.spcm_dwGetContBuf_i64(handle, buffer_type, data_pointer, length)
+    self._record("spcm_dwGetContBuf_i64", _value_of(buffer_type), _value_of(length), error, start_time)
+    return error
+
+  def save(self, path):
+    """
+    Saves every recorded call to a trace file, see :obj:`save_trace`.
+    """
+    save_trace(path, self.calls)
+
+def save_trace(path, calls):
+  """
+  Saves driver calls to a binary trace file.
+
+  Parameters
+  ----------
+  path : :obj:`str`
+    Where to save the trace.
+  calls : :obj:`list` of :obj:`DriverCall`
+    The calls to save, for example :obj:`RecordingDriver.calls`.
+  """
+  with open(path, "wb") as trace_file:
+    trace_file.write(TRACE_MAGIC)
+    for call in calls:
+      trace_file.write(_TRACE_ENTRY.pack(_FUNCTION_INDICES[call.function], call.register & 0xFFFFFFFF, call.value, call.error & 0xFFFFFFFF, call.start_time, call.end_time, len(call.text)))
+      trace_file.write(call.text)
+
+def load_trace(path):
+  """
+  Loads driver calls from a binary trace file saved by :obj:`save_trace`.
+
+  Parameters
+  ----------
+  path : :obj:`str`
+    Where the trace was saved.
+
+  Returns
+  -------
+  calls : :obj:`list` of :obj:`DriverCall`
+  """
+  with open(path, "rb") as trace_file:
+    trace = trace_file.read()
+  if trace.startswith(_TRACE_MAGIC_VERSION_1):
+    if (len(trace) - len(_TRACE_MAGIC_VERSION_1)) % _TRACE_ENTRY_VERSION_1.size:
+      raise ValueError(f"{path} is not a driver trace.")
+    return [
+      DriverCall(FUNCTION_NAMES[function_index], register, value, error, start_time, end_time)
+      for function_index, register, value, error, start_time, end_time in _TRACE_ENTRY_VERSION_1.iter_unpack(memoryview(trace)[len(_TRACE_MAGIC_VERSION_1):])
+    ]
+  if not trace.startswith(TRACE_MAGIC):
+    raise ValueError(f"{path} is not a driver trace.")
+  calls = []
+  offset = len(TRACE_MAGIC)
+  while offset < len(trace):
+    if offset + _TRACE_ENTRY.size > len(trace):
+      raise ValueError(f"{path} is not a driver trace.")
+    function_index, register, value, error, start_time, end_time, text_length = _TRACE_ENTRY.unpack_from(trace, offset)
+    offset += _TRACE_ENTRY.size
+    text = trace[offset:offset + text_length]
+    if len(text) != text_length:
+      raise ValueError(f"{path} is not a driver trace.")
+    offset += text_length
+    calls.append(DriverCall(FUNCTION_NAMES[function_index], register, value, error, start_time, end_time, text))
+  return calls
+
+def summarise_trace(calls):
+  """
+  Counts the calls to each driver function, and how long they took in total.
+  Useful for comparing traces of the same sequence made with different versions of the wrapper.
+
+  Parameters
+  ----------
+  calls : :obj:`list` of :obj:`DriverCall`
+
+  Returns
+  -------
+  summary : :obj:`dict` of :obj:`str` to :obj:`dict`
+    For each function name, a :obj:`dict` with keys :obj:`"Calls"` (the number of calls) and :obj:`"Time"` (the total time spent in them, in s).
+  """
+  summary = {}
+  for call in calls:
+    function_summary = summary.setdefault(call.function, {"Calls" : 0, "Time" : 0.0})
+    function_summary["Calls"] += 1
+    function_summary["Time"] += (call.end_time - call.start_time)*1e-9
+  return summary
+
+class TraceMismatchError(Exception):
+  """
+  Raised by a :obj:`ReplayDriver` when the calls made to it differ from the calls in its trace.
+  """
+
+def _store(pointer, value):
+  target = getattr(pointer, "_obj", pointer)
+  if isinstance(target, ctypes._Pointer):
+    target = target.contents
+  target.value = value
+
+class ReplayDriver:
+  """
+  A stand-in for the driver library that answers calls from a recorded trace, so that a recorded sequence can be run again without a card.
+  Each call returns the error code that was recorded for it, and reads return the values that were recorded.
+
+  Parameters
+  ----------
+  calls : :obj:`list` of :obj:`DriverCall`
+    The trace, for example from :obj:`load_trace`.
+  is_real_time : :obj:`bool`
+    If :obj:`True`, each call takes as long as it did when it was recorded.
+    If :obj:`False` (default), calls return straight away.
+  is_strict : :obj:`bool`
+    If :obj:`True` (default), raises a :obj:`TraceMismatchError` when a call is made to a different function or register than the one recorded next, or when the trace runs out.
+    If :obj:`False`, mismatched calls are answered anyway, which is useful when comparing versions of the wrapper that make different calls.
+  """
+  def __init__(self, calls, is_real_time = False, is_strict = True):
+    self.calls = list(calls)
+    self.is_real_time = is_real_time
+    self.is_strict = is_strict
+    self.call_index = 0
+    self.number_of_mismatches = 0
+
+  def is_finished(self):
+    """
+    Whether every call in the trace has been replayed.
+    """
+    return self.call_index >= len(self.calls)
+
+  def _next(self, function, register = None):
+    if self.call_index >= len(self.calls):
+      self.number_of_mismatches += 1
+      if self.is_strict:
+        raise TraceMismatchError(f"Call {self.call_index} to {function} is past the end of the trace.")
+      return DriverCall(function, 0, 0, 0, 0, 0)
+    call = self.calls[self.call_index]
+    self.call_index += 1
+    if call.function != function or (register is not None and call.register != (register & 0xFFFFFFFF)):
+      self.number_of_mismatches += 1
+      if self.is_strict:
+        raise TraceMismatchError(f"Call {self.call_index - 1} was to {function} with register {register}, but the trace has {call.function} with register {call.register}.")
+    if self.is_real_time:
+      end_time = time.perf_counter_ns() + call.end_time - call.start_time
+      while time.perf_counter_ns() < end_time:
+        pass
+    return call
+
+  def spcm_hOpen(self, device_address):
+    call = self._next("spcm_hOpen")
+    return 1 if call.value else None
+
+  def spcm_vClose(self, handle):
+    self._next("spcm_vClose")
+
+  def spcm_dwGetErrorInfo_i32(self, handle, error_register, error_value, error_text):
+    call = self._next("spcm_dwGetErrorInfo_i32")
+    if error_register is not None:
+      _store(error_register, call.register)
+    if error_value is not None:
+      _store(error_value, call.value)
+    if error_text is not None:
+      # Leave room for the terminating null, as the driver does
+      error_text.value = call.text[:len(error_text) - 1]
+    return call.error
+
+  def spcm_dwGetParam_i32(self, handle, register, response):
+    call = self._next("spcm_dwGetParam_i32", register)
+    _store(response, call.value)
+    return call.error
+
+  def spcm_dwGetParam_i64(self, handle, register, response):
+    call = self._next("spcm_dwGetParam_i64", register)
+    _store(response, call.value)
+    return call.error
+
+  def spcm_dwSetParam_i32(self, handle, register, value):
+    return self._next("spcm_dwSetParam_i32", register).error
+
+  def spcm_dwSetParam_i64(self, handle, register, value):
+    return self._next("spcm_dwSetParam_i64", register).error
+
+  def spcm_dwSetParam_i64m(self, handle, register, value_high, value_low):
+    return self._next("spcm_dwSetParam_i64m", register).error
+
+  def spcm_dwDefTransfer_i64(self, handle, buffer_type, direction, notify_size, host_address, device_address, size):
+    return self._next("spcm_dwDefTransfer_i64", _value_of(buffer_type)).error
+
+  def spcm_dwInvalidateBuf(self, handle, buffer_type):
+    return self._next("spcm_dwInvalidateBuf", _value_of(buffer_type)).error
+
+  def spcm_dwGetContBuf_i64(self, handle, buffer_type, data_pointer, length):
+    call = self._next("spcm_dwGetContBuf_i64", _value_of(buffer_type))
+    _store(length, call.value)
+    return call.error
@@ -0,0 +1,690 @@
+"""
+An in-process simulation of the Spectrum Instruments driver library.
+
+:obj:`SimulatedDriver` has the same call surface as :obj:`pyspcm` (:obj:`spcm_hOpen`, :obj:`spcm_dwGetParam_i32`, :obj:`spcm_dwSetParam_i64`, :obj:`spcm_dwDefTransfer_i64`, and so on), so it can be handed to :obj:`spectrum_card.Card` in place of the real driver.
+Each opened device is a :obj:`SimulatedCard`, which models the card's registers (seeded with the values of an M4i.6622-x8 from :obj:`regs`), its :obj:`SPC_M2CMD` commands, and its on-card memory, which DMA transfers really write into.
+
+Driver calls can be slowed down by a fixed latency per call, and DMA transfers by a latency per byte, so that the cost of a sequence of calls can be measured without a card.
+"""
+
+import ctypes
+import time
+
+from spectrum_card.spectrum_header.py_header import regs
+from spectrum_card.spectrum_header.py_header import spcerr
+from spectrum_card.spectrum_header.pyspcm import SPCM_BUF_DATA, SPCM_DIR_PCTOCARD
+
+# Registers that describe the hardware, and so cannot be written to
+_READ_ONLY_REGISTERS = {
+  regs.SPC_PCITYP : regs.TYP_M4IEXPSERIES | 0x6622,
+  regs.SPC_FNCTYPE : regs.SPCM_TYPE_AO,
+  regs.SPC_PCISERIALNO : 12345,
+  regs.SPC_PCIDATE : (21 << 16) | 2022,
+  regs.SPC_CALIBDATE : (23 << 16) | 2022,
+  regs.SPC_MIINST_ISDEMOCARD : 1,
+  regs.SPC_MIINST_MODULES : 2,
+  regs.SPC_MIINST_CHPERMODULE : 2,
+  regs.SPC_MIINST_BYTESPERSAMPLE : 2,
+  regs.SPC_MIINST_BITSPERSAMPLE : 16,
+  regs.SPC_MIINST_MAXADCVALUE : 32767,
+  regs.SPC_MIINST_MINEXTCLOCK : 10000000,
+  regs.SPC_MIINST_MAXEXTCLOCK : 625000000,
+  regs.SPC_MIINST_MINEXTREFCLOCK : 10000000,
+  regs.SPC_MIINST_MAXEXTREFCLOCK : 1250000000,
+  regs.SPC_PCIVERSION : (1 << 16) | 18,
+  regs.SPC_BASEPCBVERSION : 0x0106,
+  regs.SPC_PCIMODULEVERSION : (1 << 16) | 9,
+  regs.SPC_MODULEPCBVERSION : 0x0103,
+  regs.SPC_PCIEXTVERSION : 0,
+  regs.SPC_EXTPCBVERSION : 0,
+  regs.SPC_PXIHWSLOTNO : 0,
+  regs.SPCM_FW_CTRL : (1 << 16) | 18,
+  regs.SPCM_FW_CTRL_GOLDEN : (1 << 16) | 12,
+  regs.SPCM_FW_CTRL_ACTIVE : 1,
+  regs.SPCM_FW_CLOCK : (1 << 16) | 3,
+  regs.SPCM_FW_CONFIG : (1 << 16) | 5,
+  regs.SPCM_FW_MODULEA : (1 << 16) | 9,
+  regs.SPCM_FW_MODULEB : 0,
+  regs.SPCM_FW_MODEXTRA : 0,
+  regs.SPCM_FW_POWER : (1 << 16) | 2,
+  regs.SPC_GETDRVTYPE : regs.DRVTYP_LINUX64,
+  regs.SPC_GETDRVVERSION : (7 << 24) | (5 << 16) | 21000,
+  regs.SPC_GETKERNELVERSION : (7 << 24) | (5 << 16) | 21000,
+  regs.SPCM_CUSTOMMOD : 0,
+  regs.SPC_PCIFEATURES : regs.SPCM_FEAT_MULTI | regs.SPCM_FEAT_GATE | regs.SPCM_FEAT_DIGITAL | regs.SPCM_FEAT_SEQUENCE | regs.SPCM_FEAT_BASEXIO,
+  regs.SPC_PCIEXTFEATURES : 0,
+  regs.SPC_READAOFEATURES : 0x000001E2,
+  regs.SPC_PCISAMPLERATE : 625000000,
+  regs.SPC_PCIMEMSIZE : 4*1024**3,
+  regs.SPC_AVAILCARDMODES : regs.SPC_REP_STD_SINGLE | regs.SPC_REP_STD_MULTI | regs.SPC_REP_STD_GATE | regs.SPC_REP_STD_SINGLERESTART | regs.SPC_REP_STD_SEQUENCE | regs.SPC_REP_FIFO_SINGLE | regs.SPC_REP_FIFO_MULTI | regs.SPC_REP_FIFO_GATE,
+  regs.SPC_AVAILCLOCKMODES : regs.SPC_CM_INTPLL | regs.SPC_CM_EXTREFCLOCK,
+  regs.SPC_CLOCKOUTFREQUENCY : 0,
+  regs.SPC_TRIG_AVAILDELAY : 8589934560,
+  regs.SPC_TRIG_AVAILORMASK : regs.SPC_TMASK_SOFTWARE | regs.SPC_TMASK_EXT0 | regs.SPC_TMASK_EXT1,
+  regs.SPC_TRIG_AVAILANDMASK : regs.SPC_TMASK_EXT0 | regs.SPC_TMASK_EXT1,
+  regs.SPC_TRIG_CH_AVAILORMASK0 : 0,
+  regs.SPC_TRIG_CH_AVAILANDMASK0 : 0,
+  regs.SPC_TRIG_EXT0_AVAILMODES : regs.SPC_TM_NONE | regs.SPC_TM_POS | regs.SPC_TM_NEG | regs.SPC_TM_BOTH | regs.SPC_TM_HIGH | regs.SPC_TM_LOW | regs.SPC_TM_WINENTER | regs.SPC_TM_WINLEAVE | regs.SPC_TM_INWIN | regs.SPC_TM_OUTSIDEWIN | regs.SPC_TM_REARM,
+  regs.SPC_TRIG_EXT1_AVAILMODES : regs.SPC_TM_NONE | regs.SPC_TM_POS | regs.SPC_TM_NEG | regs.SPC_TM_BOTH | regs.SPC_TM_HIGH | regs.SPC_TM_LOW,
+  regs.SPC_TRIG_EXT_AVAIL0_MIN : -10000,
+  regs.SPC_TRIG_EXT_AVAIL0_MAX : 10000,
+  regs.SPC_TRIG_EXT_AVAIL0_STEP : 1,
+  regs.SPC_TRIG_EXT_AVAIL1_MIN : -10000,
+  regs.SPC_TRIG_EXT_AVAIL1_MAX : 10000,
+  regs.SPC_TRIG_EXT_AVAIL1_STEP : 1,
+  regs.SPC_SEQMODE_AVAILMAXSEGMENT : 65536,
+  regs.SPC_SEQMODE_AVAILMAXSTEPS : 4096,
+  regs.SPC_SEQMODE_AVAILMAXLOOP : regs.SPCSEQ_LOOPMASK,
+  regs.SPC_SEQMODE_AVAILFEATURES : regs.SPCSEQ_ENDLOOPONTRIG | regs.SPCSEQ_END,
+  regs.SPCM_X0_AVAILMODES : regs.SPCM_XMODE_ASYNCIN | regs.SPCM_XMODE_ASYNCOUT | regs.SPCM_XMODE_DIGOUT | regs.SPCM_XMODE_TRIGOUT | regs.SPCM_XMODE_RUNSTATE | regs.SPCM_XMODE_ARMSTATE | regs.SPCM_XMODE_REFCLKOUT | regs.SPCM_XMODE_CONTOUTMARK | regs.SPCM_XMODE_SYSCLKOUT,
+  regs.SPCM_X1_AVAILMODES : regs.SPCM_XMODE_ASYNCIN | regs.SPCM_XMODE_ASYNCOUT | regs.SPCM_XMODE_DIGOUT | regs.SPCM_XMODE_TRIGOUT | regs.SPCM_XMODE_RUNSTATE | regs.SPCM_XMODE_ARMSTATE | regs.SPCM_XMODE_REFCLKOUT | regs.SPCM_XMODE_CONTOUTMARK | regs.SPCM_XMODE_SYSCLKOUT,
+  regs.SPCM_X2_AVAILMODES : regs.SPCM_XMODE_ASYNCIN | regs.SPCM_XMODE_ASYNCOUT | regs.SPCM_XMODE_DIGOUT | regs.SPCM_XMODE_TRIGOUT | regs.SPCM_XMODE_RUNSTATE | regs.SPCM_XMODE_ARMSTATE | regs.SPCM_XMODE_REFCLKOUT | regs.SPCM_XMODE_CONTOUTMARK | regs.SPCM_XMODE_SYSCLKOUT,
+  regs.SPC_MON_TK_BASE_CTRL : 318,
+  regs.SPC_MON_TK_MODULE_0 : 313,
+  regs.SPC_MON_TK_MODULE_1 : 313,
+  regs.SPC_MON_TC_BASE_CTRL : 45,
+  regs.SPC_MON_TC_MODULE_0 : 40,
+  regs.SPC_MON_TC_MODULE_1 : 40,
+  regs.SPC_MON_TF_BASE_CTRL : 113,
+  regs.SPC_MON_TF_MODULE_0 : 104,
+  regs.SPC_MON_TF_MODULE_1 : 104,
+}
+
+# Registers that can be written to, with the values they take after a reset
+_WRITABLE_REGISTERS = {
+  regs.SPC_CARDMODE : regs.SPC_REP_STD_SINGLE,
+  regs.SPC_CHENABLE : regs.CHANNEL0,
+  regs.SPC_SAMPLERATE : 50000000,
+  regs.SPC_CLOCKMODE : regs.SPC_CM_INTPLL,
+  regs.SPC_CLOCKOUT : 0,
+  regs.SPC_REFERENCECLOCK : 10000000,
+  regs.SPC_MEMSIZE : 0,
+  regs.SPC_MEMTEST : 0,
+  regs.SPC_LOOPS : 0,
+  regs.SPC_TIMEOUT : 0,
+  regs.SPC_CARDIDENTIFICATION : 0,
+  regs.SPC_TRIG_ORMASK : regs.SPC_TMASK_SOFTWARE,
+  regs.SPC_TRIG_ANDMASK : 0,
+  regs.SPC_TRIG_CH_ORMASK0 : 0,
+  regs.SPC_TRIG_CH_ANDMASK0 : 0,
+  regs.SPC_TRIG_DELAY : 0,
+  regs.SPC_TRIG_TERM : 0,
+  regs.SPC_TRIG_EXT0_ACDC : 0,
+  regs.SPC_TRIG_EXT1_ACDC : 0,
+  regs.SPC_TRIG_EXT0_MODE : regs.SPC_TM_NONE,
+  regs.SPC_TRIG_EXT1_MODE : regs.SPC_TM_NONE,
+  regs.SPC_TRIG_EXT0_LEVEL0 : 1500,
+  regs.SPC_TRIG_EXT1_LEVEL0 : 1500,
+  regs.SPC_TRIG_EXT0_LEVEL1 : 800,
+  regs.SPC_TRIG_EXT1_LEVEL1 : 800,
+  regs.SPC_SEQMODE_MAXSEGMENTS : 1,
+  regs.SPC_SEQMODE_WRITESEGMENT : 0,
+  regs.SPC_SEQMODE_STARTSTEP : 0,
+  regs.SPCM_X0_MODE : regs.SPCM_XMODE_DISABLE,
+  regs.SPCM_X1_MODE : regs.SPCM_XMODE_DISABLE,
+  regs.SPCM_X2_MODE : regs.SPCM_XMODE_DISABLE,
+  regs.SPCM_XX_ASYNCIO : 0,
+}
+for _channel_index in range(4):
+  _WRITABLE_REGISTERS[regs.SPC_AMP0 + _channel_index*(regs.SPC_AMP1 - regs.SPC_AMP0)] = 1000
+  _WRITABLE_REGISTERS[regs.SPC_ENABLEOUT0 + _channel_index*(regs.SPC_ENABLEOUT1 - regs.SPC_ENABLEOUT0)] = 0
+  _WRITABLE_REGISTERS[regs.SPC_FILTER0 + _channel_index*(regs.SPC_FILTER1 - regs.SPC_FILTER0)] = 0
+  _WRITABLE_REGISTERS[regs.SPC_CH0_STOPLEVEL + _channel_index*(regs.SPC_CH1_STOPLEVEL - regs.SPC_CH0_STOPLEVEL)] = regs.SPCM_STOPLVL_ZERO
+  _WRITABLE_REGISTERS[regs.SPC_CH0_CUSTOM_STOP + _channel_index*(regs.SPC_CH1_CUSTOM_STOP - regs.SPC_CH0_CUSTOM_STOP)] = 0
+for _channel_index in (0, 2):
+  _WRITABLE_REGISTERS[regs.SPC_DIFF0 + _channel_index*(regs.SPC_DIFF1 - regs.SPC_DIFF0)] = 0
+  _WRITABLE_REGISTERS[regs.SPC_DOUBLEOUT0 + _channel_index*(regs.SPC_DOUBLEOUT1 - regs.SPC_DOUBLEOUT0)] = 0
+
+# Registers whose values are worked out by the card itself
+_COMPUTED_REGISTERS = {
+  regs.SPC_CHCOUNT,
+  regs.SPC_M2STATUS,
+  regs.SPC_DATA_AVAIL_USER_LEN,
+  regs.SPC_DATA_AVAIL_USER_POS,
+  regs.SPC_DATA_AVAIL_CARD_LEN,
+}
+
+_INT32_MIN = -2**31
+_INT32_MAX = 2**31 - 1
+
+def _delay(duration):
+  """
+  Waits for :obj:`duration` seconds.
+  Long waits sleep (releasing the GIL, as a driver call would), while short waits spin, as :obj:`time.sleep` is too coarse for them.
+  """
+  if duration <= 0:
+    return
+  end_time = time.perf_counter() + duration
+  if duration >= 1e-4:
+    time.sleep(duration)
+  while time.perf_counter() < end_time:
+    pass
+
+def _value_of(argument):
+  """
+  Reads a value that was passed either as a Python number, a :obj:`ctypes` number, or a :obj:`ctypes.byref` of one.
+  """
+  argument = getattr(argument, "_obj", argument)
+  return getattr(argument, "value", argument)
+
+def _store(pointer, value):
+  """
+  Writes a value to a :obj:`ctypes` object that was passed either directly, as a pointer, or as a :obj:`ctypes.byref`.
+  """
+  if pointer is None:
+    return
+  target = getattr(pointer, "_obj", pointer)
+  if isinstance(target, ctypes._Pointer):
+    target = target.contents
+  target.value = value
+
+def _address_of(host_address):
+  """
+  Finds the address of a host buffer that was passed either as a :obj:`ctypes` array, a :obj:`ctypes.c_void_p`, or an :obj:`int`.
+  """
+  if host_address is None:
+    return None
+  if isinstance(host_address, int):
+    return host_address
+  if isinstance(host_address, ctypes.c_void_p):
+    return host_address.value
+  return ctypes.addressof(host_address)
+
+class SimulatedCard:
+  """
+  The state of one simulated card: its registers, its on-card memory, its run state and its DMA engine.
+
+  Parameters
+  ----------
+  driver : :obj:`SimulatedDriver`
+    The simulated driver library that opened the card, and which sets its latencies.
+  registers : :obj:`dict` of :obj:`int` to :obj:`int`
+    Overrides for the default register values, keyed by register address from :obj:`regs`.
+  """
+  def __init__(self, driver, registers = None):
+    self.driver = driver
+    self.read_only_registers = dict(_READ_ONLY_REGISTERS)
+    self.default_registers = dict(_WRITABLE_REGISTERS)
+    if registers is not None:
+      for address, value in registers.items():
+        if address in self.read_only_registers:
+          self.read_only_registers[address] = value
+        else:
+          self.default_registers[address] = value
+    self.memory = bytearray()
+    self.error = (0, 0, 0)
+    self.reset()
+
+  def reset(self):
+    """
+    Returns every writable register to its default, stops the card and aborts any DMA transfer, as :obj:`M2CMD_CARD_RESET` does.
+    """
+    self.registers = dict(self.default_registers)
+    self.segment_sizes = {}
+    self.step_memory = {}
+    self.running = False
+    self.trigger_enabled = False
+    self.trigger_time = None
+    self.transfer = None
+    self.dma_start_time = None
+    self.dma_end_time = None
+
+  # Registers -------------------------------------------------------------------
+  # =============================================================================
+
+  def read(self, address):
+    """
+    Reads a register.
+
+    Parameters
+    ----------
+    address : :obj:`int`
+      The register.
+
+    Returns
+    -------
+    error : :obj:`int`
+      :obj:`ERR_OK` on success, otherwise the error code the driver would return.
+    value : :obj:`int`
+      The value of the register.
+    """
+    if address in self.registers:
+      return 0, self.registers[address]
+    if address in self.read_only_registers:
+      return 0, self.read_only_registers[address]
+    if address == regs.SPC_CHCOUNT:
+      return 0, bin(self.registers[regs.SPC_CHENABLE]).count("1")
+    if address == regs.SPC_M2STATUS:
+      return 0, self.status()
+    if address == regs.SPC_SEQMODE_SEGMENTSIZE:
+      return 0, self.segment_sizes.get(self.registers[regs.SPC_SEQMODE_WRITESEGMENT], 0)
+    if address in (regs.SPC_DATA_AVAIL_USER_LEN, regs.SPC_DATA_AVAIL_CARD_LEN):
+      return 0, self.bytes_transferred()
+    if address == regs.SPC_DATA_AVAIL_USER_POS:
+      return 0, 0
+    if regs.SPC_SEQMODE_STEPMEM0 <= address <= regs.SPC_SEQMODE_STEPMEM8191:
+      return 0, self.step_memory.get(address - regs.SPC_SEQMODE_STEPMEM0, 0)
+    return spcerr.ERR_REG, 0
+
+  def write(self, address, value):
+    """
+    Writes to a register, or executes a command if the register is :obj:`SPC_M2CMD`.
+
+    Parameters
+    ----------
+    address : :obj:`int`
+      The register.
+    value : :obj:`int`
+      The value to write.
+
+    Returns
+    -------
+    error : :obj:`int`
+      :obj:`ERR_OK` on success, otherwise the error code the driver would return.
+    """
+    if address == regs.SPC_M2CMD:
+      return self.command(value)
+    if regs.SPC_SEQMODE_STEPMEM0 <= address <= regs.SPC_SEQMODE_STEPMEM8191:
+      self.step_memory[address - regs.SPC_SEQMODE_STEPMEM0] = value
+      return 0
+    if address == regs.SPC_SEQMODE_SEGMENTSIZE:
+      self.segment_sizes[self.registers[regs.SPC_SEQMODE_WRITESEGMENT]] = value
+      return 0
+    if address in self.read_only_registers or address in _COMPUTED_REGISTERS:
+      return spcerr.ERR_NOWRITEALLOWED
+    if address not in self.registers:
+      return spcerr.ERR_REG
+    if address == regs.SPC_SAMPLERATE and not (0 < value <= self.read_only_registers[regs.SPC_PCISAMPLERATE]):
+      return spcerr.ERR_VALUE
+    if address == regs.SPC_CHENABLE and (value <= 0 or value & ~0xF):
+      return spcerr.ERR_VALUE
+    if address == regs.SPC_MEMSIZE and (value < 0 or value*self.bytes_per_sample() > self.read_only_registers[regs.SPC_PCIMEMSIZE]):
+      # The memory size is in samples per channel, so has to fit on the card once for each enabled channel
+      return spcerr.ERR_VALUE
+    if address == regs.SPC_SEQMODE_WRITESEGMENT and not (0 <= value < self.registers[regs.SPC_SEQMODE_MAXSEGMENTS]):
+      return spcerr.ERR_VALUE
+    if address == regs.SPC_SEQMODE_MAXSEGMENTS and not (0 < value <= self.read_only_registers[regs.SPC_SEQMODE_AVAILMAXSEGMENT]):
+      return spcerr.ERR_VALUE
+    self.registers[address] = value
+    return 0
+
+  # Commands --------------------------------------------------------------------
+  # =============================================================================
+
+  def command(self, command):
+    """
+    Executes each command in a :obj:`SPC_M2CMD` bit code, in the order the driver does.
+
+    Parameters
+    ----------
+    command : :obj:`int`
+      Bit code of :obj:`M2CMD` commands.
+
+    Returns
+    -------
+    error : :obj:`int`
+      :obj:`ERR_OK` on success, otherwise the error code the driver would return.
+    """
+    if command & regs.M2CMD_CARD_RESET:
+      self.reset()
+    if command & regs.M2CMD_CARD_START:
+      if self.registers[regs.SPC_MEMSIZE] <= 0:
+        return spcerr.ERR_SETUP
+      self.running = True
+      self.trigger_enabled = False
+      self.trigger_time = None
+    if command & regs.M2CMD_CARD_ENABLETRIGGER:
+      if not self.running:
+        return spcerr.ERR_SEQUENCE
+      self.trigger_enabled = True
+      if self.registers[regs.SPC_TRIG_ORMASK] & regs.SPC_TMASK_SOFTWARE:
+        self.trigger_time = time.perf_counter()
+    if command & regs.M2CMD_CARD_FORCETRIGGER:
+      if self.running and self.trigger_time is None:
+        self.trigger_time = time.perf_counter()
+    if command & regs.M2CMD_CARD_DISABLETRIGGER:
+      self.trigger_enabled = False
+    if command & regs.M2CMD_CARD_STOP:
+      self.running = False
+    if command & regs.M2CMD_DATA_STARTDMA:
+      error = self.start_dma()
+      if error:
+        return error
+    if command & regs.M2CMD_DATA_WAITDMA:
+      error = self.wait_until(self.dma_end_time if self.dma_end_time is not None else time.perf_counter())
+      if error:
+        return error
+    if command & regs.M2CMD_DATA_STOPDMA:
+      if self.dma_end_time is not None:
+        self.dma_end_time = min(self.dma_end_time, time.perf_counter())
+    if command & regs.M2CMD_CARD_WAITPREFULL:
+      error = self.wait_until(self.dma_end_time if self.dma_end_time is not None else time.perf_counter())
+      if error:
+        return error
+    if command & regs.M2CMD_CARD_WAITTRIGGER:
+      error = self.wait_until(self.trigger_time if self.running else time.perf_counter())
+      if error:
+        return error
+    if command & regs.M2CMD_CARD_WAITREADY:
+      error = self.wait_until(self.ready_time())
+      if error:
+        return error
+    return 0
+
+  def wait_until(self, end_time):
+    """
+    Blocks until :obj:`end_time`, or until :obj:`SPC_TIMEOUT` runs out.
+    An :obj:`end_time` of :obj:`None` means the event will never happen, so the wait times out straight away if no timeout is set (where the real driver would block forever).
+
+    Returns
+    -------
+    error : :obj:`int`
+      :obj:`ERR_OK` if the event happened, otherwise :obj:`ERR_TIMEOUT`.
+    """
+    timeout = self.registers[regs.SPC_TIMEOUT]*1e-3
+    now = time.perf_counter()
+    if end_time is None:
+      _delay(timeout)
+      return spcerr.ERR_TIMEOUT
+    if timeout > 0 and end_time - now > timeout:
+      _delay(timeout)
+      return spcerr.ERR_TIMEOUT
+    _delay(end_time - now)
+    return 0
+
+  def replay_duration(self):
+    """
+    How long a triggered card takes to finish replaying, in seconds, or :obj:`None` if it replays forever.
+    """
+    loops = self.registers[regs.SPC_LOOPS]
+    if loops == 0 or self.registers[regs.SPC_CARDMODE] == regs.SPC_REP_STD_SEQUENCE:
+      return None
+    return loops*self.registers[regs.SPC_MEMSIZE]/self.registers[regs.SPC_SAMPLERATE]
+
+  def ready_time(self):
+    """
+    When the card finishes (or finished) replaying, as a :obj:`time.perf_counter` time, or :obj:`None` if it will not finish by itself.
+    """
+    if not self.running:
+      return time.perf_counter()
+    duration = self.replay_duration()
+    if self.trigger_time is None or duration is None:
+      return None
+    return self.trigger_time + duration
+
+  def status(self):
+    """
+    Works out the :obj:`SPC_M2STATUS` bit code.
+    """
+    now = time.perf_counter()
+    status = 0
+    if self.running and self.trigger_time is not None:
+      status |= regs.M2STAT_CARD_TRIGGER
+    ready_time = self.ready_time()
+    if not self.running or (ready_time is not None and ready_time <= now):
+      status |= regs.M2STAT_CARD_READY
+    if self.dma_end_time is not None and self.dma_end_time <= now:
+      status |= regs.M2STAT_DATA_BLOCKREADY | regs.M2STAT_DATA_END
+    return status
+
+  # Memory and DMA --------------------------------------------------------------
+  # =============================================================================
+
+  def define_transfer(self, buffer_type, direction, notify_size, host_address, device_address, size):
+    """
+    Stores the description of a transfer, as :obj:`spcm_dwDefTransfer_i64` does.
+
+    Returns
+    -------
+    error : :obj:`int`
+      :obj:`ERR_OK` on success, otherwise the error code the driver would return.
+    """
+    if buffer_type != SPCM_BUF_DATA:
+      return spcerr.ERR_FNCNOTSUPPORTED
+    if direction != SPCM_DIR_PCTOCARD:
+      return spcerr.ERR_DIRMISMATCH
+    if self.dma_end_time is not None and self.dma_end_time > time.perf_counter():
+      return spcerr.ERR_RUNNING
+    if host_address is None or size <= 0 or device_address < 0:
+      return spcerr.ERR_VALUE
+    self.transfer = (host_address, device_address, size)
+    self.dma_start_time = None
+    self.dma_end_time = None
+    return 0
+
+  def bytes_per_sample(self):
+    """
+    How many bytes of on-card memory one sample of every enabled channel takes up.
+    """
+    return self.read_only_registers[regs.SPC_MIINST_BYTESPERSAMPLE]*bin(self.registers[regs.SPC_CHENABLE]).count("1")
+
+  def segment_offset(self):
+    """
+    Finds where in on-card memory the currently written segment starts, and how many bytes it holds.
+    In modes other than sequence mode, the whole of the programmed memory is one segment.
+    """
+    memory_size = self.registers[regs.SPC_MEMSIZE]*self.bytes_per_sample()
+    if self.registers[regs.SPC_CARDMODE] in (regs.SPC_REP_STD_SEQUENCE, regs.SPC_REP_STD_MULTI):
+      segment_size = memory_size//self.registers[regs.SPC_SEQMODE_MAXSEGMENTS]
+      return self.registers[regs.SPC_SEQMODE_WRITESEGMENT]*segment_size, segment_size
+    return 0, memory_size
+
+  def start_dma(self):
+    """
+    Copies the defined transfer into on-card memory, as :obj:`M2CMD_DATA_STARTDMA` does.
+    The copy itself is immediate, but the transfer is only reported as finished once the per-byte latency of the driver has passed.
+
+    Returns
+    -------
+    error : :obj:`int`
+      :obj:`ERR_OK` on success, otherwise the error code the driver would return.
+    """
+    if self.transfer is None:
+      return spcerr.ERR_SEQUENCE
+    host_address, device_address, size = self.transfer
+    offset, segment_size = self.segment_offset()
+    if device_address + size > segment_size:
+      return spcerr.ERR_VALUE
+    offset += device_address
+    if len(self.memory) < offset + size:
+      self.memory.extend(bytes(offset + size - len(self.memory)))
+    self.memory[offset:offset + size] = ctypes.string_at(host_address, size)
+    self.dma_start_time = time.perf_counter()
+    self.dma_end_time = self.dma_start_time + size*self.driver.byte_latency
+    return 0
+
+  def bytes_transferred(self):
+    """
+    How many bytes of the current transfer have reached the card so far.
+    """
+    if self.transfer is None or self.dma_start_time is None:
+      return 0
+    size = self.transfer[2]
+    duration = self.dma_end_time - self.dma_start_time
+    if duration <= 0:
+      return size
+    return min(size, int(size*(time.perf_counter() - self.dma_start_time)/duration))
+
+  def read_memory(self, offset, size):
+    """
+    Reads raw bytes from on-card memory.
+    Memory that has never been written to reads as zeros.
+
+    Parameters
+    ----------
+    offset : :obj:`int`
+      Where to start reading, in bytes.
+    size : :obj:`int`
+      How many bytes to read.
+
+    Returns
+    -------
+    data : :obj:`bytes`
+    """
+    data = bytes(self.memory[offset:offset + size])
+    return data + bytes(size - len(data))
+
+  def read_segment(self, segment):
+    """
+    Reads the raw bytes of one segment of on-card memory, as it would be laid out after :obj:`SPC_SEQMODE_WRITESEGMENT` is set to :obj:`segment`.
+
+    Parameters
+    ----------
+    segment : :obj:`int`
+      Which segment.
+
+    Returns
+    -------
+    data : :obj:`bytes`
+    """
+    previous_segment = self.registers[regs.SPC_SEQMODE_WRITESEGMENT]
+    self.registers[regs.SPC_SEQMODE_WRITESEGMENT] = segment
+    offset, segment_size = self.segment_offset()
+    self.registers[regs.SPC_SEQMODE_WRITESEGMENT] = previous_segment
+    return self.read_memory(offset, segment_size)
+
+class SimulatedDriver:
+  """
+  A stand-in for the driver library, with the same functions as :obj:`pyspcm`.
+  Every device that is opened becomes a :obj:`SimulatedCard`.
+  As with a real card, the state of a device is kept when its handle is closed, and is there again the next time the same device address is opened.
+
+  Parameters
+  ----------
+  call_latency : :obj:`float`
+    Time taken by each driver call, in seconds.
+  byte_latency : :obj:`float`
+    Time taken by DMA transfers per byte, in seconds.
+  registers : :obj:`dict` of :obj:`int` to :obj:`int`
+    Overrides for the default register values of each card that is opened, keyed by register address from :obj:`regs`.
+  """
+  def __init__(self, call_latency = 0, byte_latency = 0, registers = None):
+    self.call_latency = call_latency
+    self.byte_latency = byte_latency
+    self.registers = registers
+    self.cards = {}
+    self.devices = {}
+    self.call_counts = {}
+    self._next_handle = 1
+
+  def _call(self, name):
+    self.call_counts[name] = self.call_counts.get(name, 0) + 1
+    _delay(self.call_latency)
+
+  def _finish(self, card, error, address = 0, value = 0):
+    if error:
+      card.error = (error, address, value)
+    return error
+
+  def get_card(self, handle):
+    """
+    Finds the :obj:`SimulatedCard` behind a handle returned by :obj:`spcm_hOpen`.
+    """
+    return self.cards[handle]
+
+  def reset_call_counts(self):
+    """
+    Sets every entry of :obj:`call_counts` back to zero.
+    """
+    self.call_counts.clear()
+
+  # Driver functions ------------------------------------------------------------
+  # =============================================================================
+
+  def spcm_hOpen(self, device_address):
+    self._call("spcm_hOpen")
+    handle = self._next_handle
+    self._next_handle += 1
+    device_address = getattr(device_address, "value", device_address)
+    card = self.devices.get(device_address)
+    if card is None:
+      card = SimulatedCard(self, self.registers)
+      self.devices[device_address] = card
+    self.cards[handle] = card
+    return handle
+
+  def spcm_vClose(self, handle):
+    self._call("spcm_vClose")
+    self.cards.pop(handle, None)
+
+  def spcm_dwGetErrorInfo_i32(self, handle, error_register, error_value, error_text):
+    self._call("spcm_dwGetErrorInfo_i32")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    error, address, value = card.error
+    _store(error_register, address)
+    _store(error_value, value)
+    if error_text is not None:
+      error_text.value = f"Simulated error {error:#06x} at register {address} with value {value}".encode()[:regs.ERRORTEXTLEN - 1]
+    card.error = (0, 0, 0)
+    return error
+
+  def spcm_dwGetParam_i32(self, handle, address, response):
+    self._call("spcm_dwGetParam_i32")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    error, value = card.read(address)
+    if not error and not (_INT32_MIN <= value <= _INT32_MAX):
+      error = spcerr.ERR_EXCEEDSINT32
+    if not error:
+      _store(response, value)
+    return self._finish(card, error, address)
+
+  def spcm_dwGetParam_i64(self, handle, address, response):
+    self._call("spcm_dwGetParam_i64")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    error, value = card.read(address)
+    if not error:
+      _store(response, value)
+    return self._finish(card, error, address)
+
+  def spcm_dwSetParam_i32(self, handle, address, value):
+    self._call("spcm_dwSetParam_i32")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    value = _value_of(value)
+    return self._finish(card, card.write(address, value), address, value)
+
+  def spcm_dwSetParam_i64(self, handle, address, value):
+    self._call("spcm_dwSetParam_i64")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    value = _value_of(value)
+    return self._finish(card, card.write(address, value), address, value)
+
+  def spcm_dwSetParam_i64m(self, handle, address, value_high, value_low):
+    self._call("spcm_dwSetParam_i64m")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    value = (_value_of(value_high) << 32) | (_value_of(value_low) & 0xFFFFFFFF)
+    return self._finish(card, card.write(address, value), address, value)
+
+  def spcm_dwDefTransfer_i64(self, handle, buffer_type, direction, notify_size, host_address, device_address, size):
+    self._call("spcm_dwDefTransfer_i64")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    error = card.define_transfer(_value_of(buffer_type), _value_of(direction), _value_of(notify_size), _address_of(host_address), _value_of(device_address), _value_of(size))
+    return self._finish(card, error)
+
+  def spcm_dwInvalidateBuf(self, handle, buffer_type):
+    self._call("spcm_dwInvalidateBuf")
+    card = self.cards.get(handle)
+    if card is None:
+      return spcerr.ERR_INVALIDHANDLE
+    card.transfer = None
+    return 0
+
+  def spcm_dwGetContBuf_i64(self, handle, buffer_type, data_pointer, length):
+    self._call("spcm_dwGetContBuf_i64")
+    if handle not in self.cards:
+      return spcerr.ERR_INVALIDHANDLE
+    _store(length, 0)
+    return 0
@@ -0,0 +1,211 @@
+"""
+The :obj:`Transaction` class, which batches writes to the registers of a :obj:`Card`.
+"""
+
+from spectrum_card.spectrum_header import pyspcm as spcm
+
+import threading
+
+# Registers that are always written straight away, even inside a transaction, as writing to them has an immediate effect.
+_IMMEDIATE_REGISTERS = frozenset((
+  spcm.SPC_M2CMD,
+  spcm.SPC_MEMTEST,
+  spcm.SPCM_XX_ASYNCIO
+))
+
+# The order in which a transaction writes registers, so that each register is written after the registers it depends on.
+# Registers not listed here are ordered by _get_flush_rank.
+_FLUSH_RANKS = {
+  spcm.SPC_CARDMODE : 0,
+  spcm.SPC_CHENABLE : 1,
+  spcm.SPC_CLOCKMODE : 2,
+  spcm.SPC_REFERENCECLOCK : 3,
+  spcm.SPC_SAMPLERATE : 4,
+  spcm.SPC_CLOCKOUT : 5,
+  spcm.SPC_MEMSIZE : 6,
+  spcm.SPC_LOOPS : 6,
+  spcm.SPC_SEQMODE_MAXSEGMENTS : 7,
+  spcm.SPC_SEQMODE_SEGMENTSIZE : 8,
+  spcm.SPC_SEQMODE_WRITESEGMENT : 9,
+  spcm.SPC_SEQMODE_STARTSTEP : 10,
+  spcm.SPC_TRIG_ORMASK : 13,
+  spcm.SPC_TRIG_ANDMASK : 13,
+  spcm.SPC_TRIG_CH_ORMASK0 : 13,
+  spcm.SPC_TRIG_CH_ORMASK1 : 13,
+  spcm.SPC_TRIG_CH_ANDMASK0 : 13,
+  spcm.SPC_TRIG_CH_ANDMASK1 : 13
+}
+
+def _get_flush_rank(address):
+  rank = _FLUSH_RANKS.get(address)
+  if rank is not None:
+    return rank
+  if spcm.SPC_SEQMODE_STEPMEM0 <= address <= spcm.SPC_SEQMODE_STEPMEM8191:
+    # Sequence steps
+    return 10
+  if spcm.SPC_TRIG_TERM <= address <= spcm.SPC_TRIG_EXT1_LEVEL1:
+    # Trigger modes, levels and coupling, before the masks that enable them
+    return 12
+  if spcm.SPCM_X0_MODE <= address <= spcm.SPCM_X3_MODE:
+    # IO modes
+    return 14
+  # Channel settings, and anything else
+  return 11
+
+class Transaction:
+  """
+  Queues writes to the registers of a :obj:`Card`, so that they are written all at once, in an order that is safe for the card.
+  Create one using :obj:`Card.transaction`, and use it in a :obj:`with` block,
+
+  .. code-block:: python
+
+    with card.transaction() as transaction:
+      card.set_channels_enable(channel_0 = True)
+      card.set_amplitude(0, 0.5)
+      card.set_amplitude(0, 0.25)
+    print(transaction.get_statistics())
+
+  Inside the block, writes made through :obj:`Card` are queued rather than sent to the driver, and a later write to the same register replaces an earlier one.
+  Reads of a queued register return the queued value.
+  The queue is flushed when the block ends, and before any command is sent to :obj:`SPC_M2CMD` (for example by :obj:`Card.arm` or :obj:`Card.start`) or data is transferred.
+  Writes are flushed in order of dependency (card mode, then channel enables, clock, memory, sequence, channel settings, triggers, trigger masks and IO modes), and otherwise in the order they were first queued.
+  If the block raises an exception, anything still queued is discarded.
+
+  Writes to :obj:`SPC_M2CMD`, :obj:`SPC_MEMTEST` and :obj:`SPCM_XX_ASYNCIO` are never queued.
+  Writes to :obj:`SPC_SEQMODE_SEGMENTSIZE` are queued separately for each segment selected by :obj:`SPC_SEQMODE_WRITESEGMENT`.
+
+  Transactions can be nested, in which case the outermost one flushes.
+
+  On a thread safe :obj:`Card`, a transaction belongs to the thread that opened it.
+  It holds the lock of the card until it ends, so writes from other threads wait for it to be flushed, and reads from other threads are not given its queued values.
+  Commands from other threads (such as :obj:`Card.stop`) do not wait for the lock, and are sent without flushing the transaction.
+  """
+  def __init__(self, card):
+    self.card = card
+    self.thread = threading.get_ident()
+    self.depth = 0
+    self.number_of_writes_queued = 0
+    self.number_of_writes_issued = 0
+    self._writes = {}
+
+  def __enter__(self):
+    if self.card._lock is not None:
+      self.card._lock.acquire()
+    if self.depth == 0:
+      self.card._transaction = self
+    self.depth += 1
+    return self
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    try:
+      self.depth -= 1
+      if exception_type is not None:
+        self.discard()
+      elif self.depth == 0:
+        self.flush()
+    finally:
+      if self.depth == 0:
+        self.card._transaction = None
+      if self.card._lock is not None:
+        self.card._lock.release()
+    return False
+
+  def _get_write_segment(self):
+    pending = self._writes.get(spcm.SPC_SEQMODE_WRITESEGMENT)
+    if pending is not None:
+      return pending[1]
+    return self.card._get_config_int64(spcm.SPC_SEQMODE_WRITESEGMENT)
+
+  def _queue(self, address, message, width):
+    if address in _IMMEDIATE_REGISTERS:
+      return False
+    if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+      address = (address, self._get_write_segment())
+    self._writes[address] = (width, message)
+    self.number_of_writes_queued += 1
+    return True
+
+  def _look_up(self, address):
+    if self.thread != threading.get_ident():
+      # Queued values are not visible to other threads until they are flushed
+      return None
+    if address == spcm.SPC_SEQMODE_SEGMENTSIZE:
+      pending = self._writes.get((address, self._get_write_segment()))
+      if pending is None and spcm.SPC_SEQMODE_WRITESEGMENT in self._writes:
+        # The card has not been told which segment to read yet
+        self.flush()
+    else:
+      pending = self._writes.get(address)
+    if pending is None:
+      return None
+    return pending[1]
+
+  def flush(self):
+    """
+    Writes everything that is queued to the card, and empties the queue.
+    The transaction stays open.
+    """
+    if not self._writes:
+      return
+    card = self.card
+    writes = sorted(self._writes.items(), key = lambda write: _get_flush_rank(write[0][0] if isinstance(write[0], tuple) else write[0]))
+    self._writes = {}
+    card._transaction = None
+    try:
+      # While segment sizes are written, the segment they are written to is selected, and the segment that was selected before is put back afterwards
+      previous_segment = None
+      write_segment = None
+      for address, (width, message) in writes:
+        if isinstance(address, tuple):
+          address, segment = address
+          if previous_segment is None:
+            previous_segment = card._get_config_int64(spcm.SPC_SEQMODE_WRITESEGMENT)
+            write_segment = previous_segment
+          if segment != write_segment:
+            card._set_int64(spcm.SPC_SEQMODE_WRITESEGMENT, segment)
+            self.number_of_writes_issued += 1
+            write_segment = segment
+        elif previous_segment is not None:
+          if address == spcm.SPC_SEQMODE_WRITESEGMENT:
+            previous_segment = None
+            if message == write_segment:
+              continue
+          else:
+            self._restore_write_segment(previous_segment, write_segment)
+            previous_segment = None
+        if width == 32:
+          card._set_int32(address, message)
+        else:
+          card._set_int64(address, message)
+        self.number_of_writes_issued += 1
+      if previous_segment is not None:
+        self._restore_write_segment(previous_segment, write_segment)
+    finally:
+      if self.depth > 0:
+        card._transaction = self
+
+  def _restore_write_segment(self, previous_segment, write_segment):
+    if previous_segment != write_segment:
+      self.card._set_int64(spcm.SPC_SEQMODE_WRITESEGMENT, previous_segment)
+      self.number_of_writes_issued += 1
+
+  def discard(self):
+    """
+    Empties the queue without writing anything to the card.
+    """
+    self._writes.clear()
+
+  def get_statistics(self):
+    """
+    Counts how many writes were queued, and how many driver calls were made to flush them.
+
+    Returns
+    -------
+    statistics : :obj:`dict`
+      With keys :obj:`"Queued"` (number of writes made through the :obj:`Card`), :obj:`"Issued"` (number of writes sent to the driver), and :obj:`"Saved"` (the difference).
+    """
+    return {
+      "Queued" : self.number_of_writes_queued,
+      "Issued" : self.number_of_writes_issued,
+      "Saved" : self.number_of_writes_queued - self.number_of_writes_issued
+    }